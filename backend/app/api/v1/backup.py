@@ -16,7 +16,8 @@ from app.services.config_backup import (
     ConfigVersionManager,
 )
 from app.services.vyos_command import VyOSCommandExecutor
-from app.services.vyos_ssh import VyOSSSHClient, VyOSSSHConfig
+from app.services.ssh_pool import ssh_pool
+from app.services.vyos_ssh import VyOSSSHConfig
 from app.core.config import settings
 
 router = APIRouter(prefix="/backup", tags=["backup"])
@@ -130,7 +131,7 @@ def _get_executor() -> VyOSCommandExecutor:
         password=settings.vyos_password,
         timeout=settings.vyos_timeout,
     )
-    ssh_client = VyOSSSHClient(config)
+    ssh_client = ssh_pool.get_client(config)
     return VyOSCommandExecutor(ssh_client)
 
 
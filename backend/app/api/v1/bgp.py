@@ -4,7 +4,8 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
 from typing import List, Optional, Any
 
-from app.services.vyos_ssh import VyOSSSHClient, VyOSSSHConfig
+from app.services.ssh_pool import ssh_pool
+from app.services.vyos_ssh import VyOSSSHConfig
 from app.services.vyos_config_service import VyOSConfigService
 from app.core.config import settings
 
@@ -129,7 +130,7 @@ async def get_bgp_config():
     """Get BGP configuration"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -145,7 +146,7 @@ async def get_bgp_config():
                 networks=config.get('networks', [])
             )
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -167,7 +168,7 @@ async def update_bgp_config(request: BGPConfigRequest):
     """Update BGP global configuration with timers"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -190,7 +191,7 @@ async def update_bgp_config(request: BGPConfigRequest):
                 "holdtime": request.holdtime
             }
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -212,7 +213,7 @@ async def create_bgp_neighbor(request: BGPNeighborRequest):
     """Create BGP neighbor with all options"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -251,7 +252,7 @@ async def create_bgp_neighbor(request: BGPNeighborRequest):
                 "is_ibgp": is_ibgp
             }
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -273,7 +274,7 @@ async def update_bgp_neighbor(ip_address: str, request: BGPNeighborUpdateRequest
     """Update BGP neighbor"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -309,7 +310,7 @@ async def update_bgp_neighbor(ip_address: str, request: BGPNeighborUpdateRequest
 
             return {"message": "BGP neighbor updated successfully", "ip_address": ip_address}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -331,7 +332,7 @@ async def delete_bgp_neighbor(ip_address: str):
     """Delete BGP neighbor"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -349,7 +350,7 @@ async def delete_bgp_neighbor(ip_address: str):
 
             return {"message": "BGP neighbor deleted successfully", "ip_address": ip_address}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -371,7 +372,7 @@ async def add_bgp_network(request: BGPNetworkRequest):
     """Add network to BGP"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -389,7 +390,7 @@ async def add_bgp_network(request: BGPNetworkRequest):
 
             return {"message": "BGP network added successfully", "network": request.network}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -411,7 +412,7 @@ async def delete_bgp_network(network: str):
     """Delete network from BGP"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -429,7 +430,7 @@ async def delete_bgp_network(network: str):
 
             return {"message": "BGP network deleted successfully", "network": network}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -453,14 +454,14 @@ async def get_prefix_lists():
     """Get all prefix-lists"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
             config_service = VyOSConfigService(ssh_client)
             return {"prefix_lists": config_service.get_prefix_lists()}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -476,7 +477,7 @@ async def create_prefix_list(name: str):
     """Create a prefix-list"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -486,7 +487,7 @@ async def create_prefix_list(name: str):
                 raise HTTPException(status_code=400, detail="Failed to create prefix-list")
             return {"message": "Prefix-list created", "name": name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -502,7 +503,7 @@ async def delete_prefix_list(name: str):
     """Delete a prefix-list"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -512,7 +513,7 @@ async def delete_prefix_list(name: str):
                 raise HTTPException(status_code=400, detail="Failed to delete prefix-list")
             return {"message": "Prefix-list deleted", "name": name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -528,7 +529,7 @@ async def add_prefix_list_rule(name: str, request: PrefixListRuleRequest):
     """Add a rule to a prefix-list"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -541,7 +542,7 @@ async def add_prefix_list_rule(name: str, request: PrefixListRuleRequest):
                 raise HTTPException(status_code=400, detail="Failed to add prefix-list rule")
             return {"message": "Prefix-list rule added", "name": name, "sequence": request.sequence}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -557,7 +558,7 @@ async def delete_prefix_list_rule(name: str, sequence: int):
     """Delete a rule from a prefix-list"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -567,7 +568,7 @@ async def delete_prefix_list_rule(name: str, sequence: int):
                 raise HTTPException(status_code=400, detail="Failed to delete prefix-list rule")
             return {"message": "Prefix-list rule deleted", "name": name, "sequence": sequence}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -585,14 +586,14 @@ async def get_community_lists():
     """Get all community-lists"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
             config_service = VyOSConfigService(ssh_client)
             return {"community_lists": config_service.get_community_lists()}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -608,7 +609,7 @@ async def get_bgp_summary():
     """Get BGP summary (show ip bgp summary)"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -616,7 +617,7 @@ async def get_bgp_summary():
             summary = config_service.get_bgp_summary()
             return summary
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -632,7 +633,7 @@ async def create_community_list(name: str, type: str = "standard"):
     """Create a community-list"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -642,7 +643,7 @@ async def create_community_list(name: str, type: str = "standard"):
                 raise HTTPException(status_code=400, detail="Failed to create community-list")
             return {"message": "Community-list created", "name": name, "type": type}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -658,7 +659,7 @@ async def delete_community_list(name: str):
     """Delete a community-list"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -668,7 +669,7 @@ async def delete_community_list(name: str):
                 raise HTTPException(status_code=400, detail="Failed to delete community-list")
             return {"message": "Community-list deleted", "name": name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -684,7 +685,7 @@ async def add_community_list_rule(name: str, request: CommunityListRuleRequest):
     """Add a rule to a community-list"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -697,7 +698,7 @@ async def add_community_list_rule(name: str, request: CommunityListRuleRequest):
                 raise HTTPException(status_code=400, detail="Failed to add community-list rule")
             return {"message": "Community-list rule added", "name": name, "sequence": request.sequence}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -713,7 +714,7 @@ async def delete_community_list_rule(name: str, sequence: int):
     """Delete a rule from a community-list"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -723,7 +724,7 @@ async def delete_community_list_rule(name: str, sequence: int):
                 raise HTTPException(status_code=400, detail="Failed to delete community-list rule")
             return {"message": "Community-list rule deleted", "name": name, "sequence": sequence}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -741,14 +742,14 @@ async def get_route_maps():
     """Get all route-maps"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
             config_service = VyOSConfigService(ssh_client)
             return {"route_maps": config_service.get_route_maps()}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -764,7 +765,7 @@ async def create_route_map(name: str):
     """Create a route-map"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -774,7 +775,7 @@ async def create_route_map(name: str):
                 raise HTTPException(status_code=400, detail="Failed to create route-map")
             return {"message": "Route-map created", "name": name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -790,7 +791,7 @@ async def delete_route_map(name: str):
     """Delete a route-map"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -800,7 +801,7 @@ async def delete_route_map(name: str):
                 raise HTTPException(status_code=400, detail="Failed to delete route-map")
             return {"message": "Route-map deleted", "name": name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -816,7 +817,7 @@ async def add_route_map_rule(name: str, request: RouteMapRuleRequest):
     """Add a rule to a route-map"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -831,7 +832,7 @@ async def add_route_map_rule(name: str, request: RouteMapRuleRequest):
                 raise HTTPException(status_code=400, detail="Failed to add route-map rule")
             return {"message": "Route-map rule added", "name": name, "sequence": request.sequence}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -847,7 +848,7 @@ async def delete_route_map_rule(name: str, sequence: int):
     """Delete a rule from a route-map"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -857,7 +858,7 @@ async def delete_route_map_rule(name: str, sequence: int):
                 raise HTTPException(status_code=400, detail="Failed to delete route-map rule")
             return {"message": "Route-map rule deleted", "name": name, "sequence": sequence}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -3,8 +3,10 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 from typing import List, Optional
 
-from app.services.vyos_ssh import VyOSSSHClient, VyOSSSHConfig
+from app.services.ssh_pool import ssh_pool
+from app.services.vyos_ssh import VyOSSSHConfig
 from app.services.vyos_config import VyOSConfigSession
+from app.services.vyos_config_service import VyOSConfigService
 from app.core.config import settings
 
 router = APIRouter(prefix="/firewall", tags=["firewall"])
@@ -111,7 +113,7 @@ async def list_firewall_rules():
     # First try to get from VyOS, fallback to in-memory
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         session = VyOSConfigSession(ssh_client)
@@ -190,7 +192,7 @@ async def list_firewall_rules():
             pass
         finally:
             session.close()
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except:
         pass
 
@@ -202,7 +204,7 @@ async def list_firewall_rules():
 async def create_firewall_rule(request: FirewallRuleRequest):
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         session = VyOSConfigSession(ssh_client)
@@ -253,7 +255,7 @@ async def create_firewall_rule(request: FirewallRuleRequest):
             return {"message": "Rule created successfully", "name": request.name}
         finally:
             session.close()
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -262,7 +264,7 @@ async def create_firewall_rule(request: FirewallRuleRequest):
 async def delete_firewall_rule(name: str, direction: str = "in", sequence: int = 10):
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         session = VyOSConfigSession(ssh_client)
@@ -280,7 +282,7 @@ async def delete_firewall_rule(name: str, direction: str = "in", sequence: int =
             return {"message": "Rule deleted successfully", "name": name}
         finally:
             session.close()
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -292,7 +294,7 @@ async def list_nat_rules():
     # First try to get from VyOS, fallback to in-memory
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         session = VyOSConfigSession(ssh_client)
@@ -382,7 +384,7 @@ async def list_nat_rules():
             pass
         finally:
             session.close()
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except:
         pass
 
@@ -394,7 +396,7 @@ async def list_nat_rules():
 async def create_nat_rule(request: NATRuleRequest):
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         session = VyOSConfigSession(ssh_client)
@@ -496,7 +498,74 @@ async def create_nat_rule(request: NATRuleRequest):
             return {"message": "NAT rule created successfully", "name": request.name}
         finally:
             session.close()
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/nat/rules/bulk")
+async def create_nat_rules(requests: list[NATRuleRequest]):
+    """Create several NAT rules in one configure session with a single commit"""
+    try:
+        ssh_config = _get_ssh_config()
+        ssh_client = ssh_pool.get_client(ssh_config)
+        ssh_client.connect()
+
+        try:
+            config_service = VyOSConfigService(ssh_client)
+            comment = f"Create {len(requests)} NAT rules"
+            with config_service.request_session(comment=comment) as session:
+                for request in requests:
+                    # Raising leaves the session uncommitted, so nothing is applied
+                    staged = config_service.create_nat_rule(
+                        request.type,
+                        request.sequence,
+                        source_address=request.source_address,
+                        source_port=request.source_port,
+                        destination_address=request.destination_address,
+                        destination_port=request.destination_port,
+                        inbound_interface=request.inbound_interface,
+                        outbound_interface=request.outbound_interface,
+                        translation_address=request.translation_address,
+                        translation_port=request.translation_port,
+                        protocol=request.protocol,
+                        description=request.description,
+                        session=session,
+                    )
+                    if not staged:
+                        raise HTTPException(
+                            status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=f"VyOS rejected NAT rule {request.sequence}",
+                        )
+
+            # Store in memory
+            for request in requests:
+                rule = NATRuleResponse(
+                    id=str(request.sequence),
+                    name=request.name,
+                    type=request.type,
+                    sequence=request.sequence,
+                    order=request.sequence,
+                    description=request.description,
+                    enabled=request.enabled,
+                    source_address=request.source_address,
+                    source_port=request.source_port,
+                    destination_address=request.destination_address,
+                    destination_port=request.destination_port,
+                    inbound_interface=request.inbound_interface,
+                    outbound_interface=request.outbound_interface,
+                    translation_address=request.translation_address,
+                    translation_port=request.translation_port,
+                    protocol=request.protocol,
+                    log=request.log,
+                )
+                stored_nat_rules.append(rule.model_dump())
+
+            return {"message": "NAT rules created successfully", "count": len(requests)}
+        finally:
+            ssh_pool.release(ssh_client)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -505,7 +574,7 @@ async def create_nat_rule(request: NATRuleRequest):
 async def delete_nat_rule(name: str, nat_type: str = "source", sequence: int = 10):
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         session = VyOSConfigSession(ssh_client)
@@ -524,7 +593,7 @@ async def delete_nat_rule(name: str, nat_type: str = "source", sequence: int = 1
             return {"message": "NAT rule deleted successfully", "name": name}
         finally:
             session.close()
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
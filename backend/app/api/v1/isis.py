@@ -4,7 +4,8 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
 from typing import List, Optional, Any
 
-from app.services.vyos_ssh import VyOSSSHClient, VyOSSSHConfig
+from app.services.ssh_pool import ssh_pool
+from app.services.vyos_ssh import VyOSSSHConfig
 from app.services.vyos_config_service import VyOSConfigService
 from app.core.config import settings
 
@@ -94,7 +95,7 @@ async def get_isis_config():
     """Get IS-IS configuration"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -114,7 +115,7 @@ async def get_isis_config():
                 redistribute=config.get('redistribute', [])
             )
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -136,7 +137,7 @@ async def initial_isis_setup(request: ISISInitialSetupRequest):
     """Initial IS-IS setup - sets NET and first interface in single commit"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -186,7 +187,7 @@ async def initial_isis_setup(request: ISISInitialSetupRequest):
             finally:
                 session.close()
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -208,7 +209,7 @@ async def update_isis_config(request: ISISGlobalConfigRequest):
     """Update IS-IS global configuration"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -251,7 +252,7 @@ async def update_isis_config(request: ISISGlobalConfigRequest):
                 "metric_style": request.metric_style
             }
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -273,7 +274,7 @@ async def disable_isis():
     """Disable IS-IS completely"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -285,7 +286,7 @@ async def disable_isis():
 
             return {"message": "IS-IS disabled successfully"}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -308,7 +309,7 @@ async def add_isis_interface(request: ISISInterfaceRequest):
     """Add an interface to IS-IS"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -331,7 +332,7 @@ async def add_isis_interface(request: ISISInterfaceRequest):
                 "interface": request.interface
             }
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -353,7 +354,7 @@ async def update_isis_interface(interface: str, request: ISISInterfaceUpdateRequ
     """Update an IS-IS interface"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -383,7 +384,7 @@ async def update_isis_interface(interface: str, request: ISISInterfaceUpdateRequ
                 "interface": interface
             }
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -405,7 +406,7 @@ async def delete_isis_interface(interface: str):
     """Remove an interface from IS-IS"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -420,7 +421,7 @@ async def delete_isis_interface(interface: str):
                 "interface": interface
             }
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -443,7 +444,7 @@ async def add_isis_redistribute(request: ISISRedistributeRequest):
     """Add route redistribution to IS-IS"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -463,7 +464,7 @@ async def add_isis_redistribute(request: ISISRedistributeRequest):
                 "level": request.level
             }
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -485,7 +486,7 @@ async def delete_isis_redistribute(source: str, level: str):
     """Remove route redistribution from IS-IS"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -501,7 +502,7 @@ async def delete_isis_redistribute(source: str, level: str):
                 "level": level
             }
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -523,7 +524,7 @@ async def get_isis_status():
     """Get IS-IS status overview (interfaces, database, etc.)"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -531,7 +532,7 @@ async def get_isis_status():
             status = config_service.get_isis_status()
             return status
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -24,7 +24,8 @@ from app.services.logging_monitoring import (
     RealTimeLogStreamer,
 )
 from app.services.vyos_command import VyOSCommandExecutor
-from app.services.vyos_ssh import VyOSSSHClient, VyOSSSHConfig
+from app.services.ssh_pool import ssh_pool
+from app.services.vyos_ssh import VyOSSSHConfig
 from app.core.config import settings
 
 router = APIRouter(prefix="/logs", tags=["logs"])
@@ -171,7 +172,7 @@ def _get_executor() -> VyOSCommandExecutor:
         password=settings.vyos_password,
         timeout=settings.vyos_timeout,
     )
-    ssh_client = VyOSSSHClient(config)
+    ssh_client = ssh_pool.get_client(config)
     return VyOSCommandExecutor(ssh_client)
 
 
@@ -5,7 +5,8 @@ from pydantic import BaseModel
 
 from app.services.network import NetworkConfigService
 from app.services.vyos_command import VyOSCommandExecutor
-from app.services.vyos_ssh import VyOSSSHClient, VyOSSSHConfig
+from app.services.ssh_pool import ssh_pool
+from app.services.vyos_ssh import VyOSSSHConfig
 from app.services.vyos_config_service import VyOSConfigService
 from app.core.config import settings
 
@@ -215,7 +216,7 @@ def _get_executor() -> VyOSCommandExecutor:
         password=settings.vyos_password,
         timeout=settings.vyos_timeout,
     )
-    ssh_client = VyOSSSHClient(config)
+    ssh_client = ssh_pool.get_client(config)
     return VyOSCommandExecutor(ssh_client)
 
 
@@ -255,7 +256,7 @@ async def create_vlan_interface(request: VLANInterfaceRequest):
 
         # Use VyOSConfigService for reliable configuration
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -278,7 +279,7 @@ async def create_vlan_interface(request: VLANInterfaceRequest):
                 "parent_interface": request.parent_interface
             }
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -301,7 +302,7 @@ async def update_vlan_interface(name: str, request: VLANInterfaceUpdateRequest):
     try:
         # Use VyOSConfigService for reliable configuration
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -317,7 +318,7 @@ async def update_vlan_interface(name: str, request: VLANInterfaceUpdateRequest):
 
             return {"message": "VLAN interface updated successfully", "name": name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -340,7 +341,7 @@ async def delete_vlan_interface(name: str):
     try:
         # Use VyOSConfigService for reliable configuration
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -352,7 +353,7 @@ async def delete_vlan_interface(name: str):
 
             return {"message": "VLAN interface deleted successfully", "name": name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -375,7 +376,7 @@ async def add_ip_to_vlan(name: str, request: IPAddressRequest):
     try:
         # Use VyOSConfigService for reliable configuration
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -387,7 +388,7 @@ async def add_ip_to_vlan(name: str, request: IPAddressRequest):
 
             return {"message": "IP address added to VLAN successfully", "name": name, "address": request.address}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -410,7 +411,7 @@ async def remove_ip_from_vlan(name: str, address: str):
     try:
         # Use VyOSConfigService for reliable configuration
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -422,7 +423,7 @@ async def remove_ip_from_vlan(name: str, address: str):
 
             return {"message": "IP address removed from VLAN successfully", "name": name, "address": address}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -446,7 +447,7 @@ async def get_pppoe_config():
     """Get PPPoE interfaces configuration"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -454,7 +455,7 @@ async def get_pppoe_config():
             config = config_service.get_pppoe_config()
             return config
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -476,7 +477,7 @@ async def get_pppoe_status():
     """Get PPPoE interfaces status"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -484,7 +485,7 @@ async def get_pppoe_status():
             status = config_service.get_pppoe_status()
             return status
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -506,7 +507,7 @@ async def create_pppoe_interface(request: PPPoEInterfaceRequest):
     """Create a PPPoE interface"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -530,7 +531,7 @@ async def create_pppoe_interface(request: PPPoEInterfaceRequest):
                 "name": request.name
             }
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -552,7 +553,7 @@ async def update_pppoe_interface(name: str, request: PPPoEInterfaceUpdateRequest
     """Update a PPPoE interface"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -573,7 +574,7 @@ async def update_pppoe_interface(name: str, request: PPPoEInterfaceUpdateRequest
 
             return {"message": "PPPoE interface updated successfully", "name": name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -595,7 +596,7 @@ async def delete_pppoe_interface(name: str):
     """Delete a PPPoE interface"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -607,7 +608,7 @@ async def delete_pppoe_interface(name: str):
 
             return {"message": "PPPoE interface deleted successfully", "name": name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -708,7 +709,7 @@ async def create_interface(request: InterfaceRequest):
     try:
         # Use VyOSConfigService for reliable configuration
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -727,7 +728,7 @@ async def create_interface(request: InterfaceRequest):
 
             return {"message": "Interface created successfully", "name": request.name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -758,7 +759,7 @@ async def update_interface(name: str, request: InterfaceUpdateRequest):
 
         # Use VyOSConfigService for reliable configuration
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -774,7 +775,7 @@ async def update_interface(name: str, request: InterfaceUpdateRequest):
 
             return {"message": "Interface updated successfully", "name": name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -805,7 +806,7 @@ async def delete_interface(name: str):
 
         # Use VyOSConfigService for reliable configuration
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -817,7 +818,7 @@ async def delete_interface(name: str):
 
             return {"message": "Interface deleted successfully", "name": name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -850,7 +851,7 @@ async def add_ip_address(interface: str, request: IPAddressRequest):
 
         # Use VyOSConfigService for reliable configuration
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -866,7 +867,7 @@ async def add_ip_address(interface: str, request: IPAddressRequest):
 
             return {"message": "IP address added successfully", "interface": interface, "address": request.address}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -897,7 +898,7 @@ async def remove_ip_address(interface: str, address: str):
 
         # Use VyOSConfigService for reliable configuration
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -913,7 +914,7 @@ async def remove_ip_address(interface: str, address: str):
 
             return {"message": "IP address removed successfully", "interface": interface, "address": address}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -1005,7 +1006,7 @@ async def add_route(request: RouteRequest):
     try:
         # Use VyOSConfigService for reliable configuration
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -1022,7 +1023,7 @@ async def add_route(request: RouteRequest):
 
             return {"message": "Route added successfully", "destination": request.destination}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -1047,7 +1048,7 @@ async def delete_route(destination: str, next_hop: str | None = None):
     try:
         # Use VyOSConfigService for reliable configuration
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -1059,7 +1060,7 @@ async def delete_route(destination: str, next_hop: str | None = None):
 
             return {"message": "Route deleted successfully", "destination": destination}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -1186,7 +1187,7 @@ async def set_dns_servers(request: DNSSetRequest):
             password=settings.vyos_password,
             timeout=settings.vyos_timeout,
         )
-        ssh_client = VyOSSSHClient(config)
+        ssh_client = ssh_pool.get_client(config)
         ssh_client.connect()
 
         try:
@@ -1198,7 +1199,7 @@ async def set_dns_servers(request: DNSSetRequest):
 
             return {"message": "DNS servers set successfully", "servers": request.servers}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
@@ -1221,7 +1222,7 @@ async def set_domain_name(request: DomainNameRequest):
     try:
         # Use VyOSConfigService for reliable configuration
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -1233,7 +1234,7 @@ async def set_domain_name(request: DomainNameRequest):
 
             return {"message": "Domain name set successfully"}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except ConnectionError as e:
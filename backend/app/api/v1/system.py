@@ -5,7 +5,8 @@ from pydantic import BaseModel
 
 from app.services.system_info import SystemInfoCollector
 from app.services.vyos_command import VyOSCommandExecutor
-from app.services.vyos_ssh import VyOSSSHClient, VyOSSSHConfig
+from app.services.ssh_pool import ssh_pool
+from app.services.vyos_ssh import VyOSSSHConfig
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -68,7 +69,7 @@ def _get_executor() -> VyOSCommandExecutor:
         password=settings.vyos_password,
         timeout=settings.vyos_timeout,
     )
-    ssh_client = VyOSSSHClient(config)
+    ssh_client = ssh_pool.get_client(config)
     return VyOSCommandExecutor(ssh_client)
 
 
@@ -3,7 +3,8 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from pydantic import BaseModel
 from typing import Any, List, Optional
 
-from app.services.vyos_ssh import VyOSSSHClient, VyOSSSHConfig
+from app.services.ssh_pool import ssh_pool
+from app.services.vyos_ssh import VyOSSSHConfig
 from app.services.vyos_config_service import VyOSConfigService
 from app.core.config import settings
 
@@ -176,7 +177,7 @@ async def get_wireguard_config():
     """Get WireGuard configuration"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -208,7 +209,7 @@ async def get_wireguard_config():
 
             return WireGuardConfigResponse(interfaces=interfaces)
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -218,14 +219,14 @@ async def get_wireguard_status():
     """Get WireGuard status"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
             config_service = VyOSConfigService(ssh_client)
             return config_service.get_wireguard_status()
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -235,7 +236,7 @@ async def list_wireguard_interfaces():
     """List WireGuard interfaces"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -267,7 +268,7 @@ async def list_wireguard_interfaces():
 
             return interfaces
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -277,7 +278,7 @@ async def create_wireguard_interface(request: WireGuardInterfaceCreate):
     """Create a WireGuard interface"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -296,7 +297,7 @@ async def create_wireguard_interface(request: WireGuardInterfaceCreate):
 
             return {"message": "WireGuard interface created successfully", "name": request.name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -308,7 +309,7 @@ async def update_wireguard_interface(name: str, request: WireGuardInterfaceUpdat
     """Update a WireGuard interface"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -332,7 +333,7 @@ async def update_wireguard_interface(name: str, request: WireGuardInterfaceUpdat
 
             return {"message": "WireGuard interface updated successfully", "name": name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -344,7 +345,7 @@ async def delete_wireguard_interface(name: str):
     """Delete a WireGuard interface"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -356,7 +357,7 @@ async def delete_wireguard_interface(name: str):
 
             return {"message": "WireGuard interface deleted successfully", "name": name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -368,7 +369,7 @@ async def add_wireguard_peer(name: str, request: WireGuardPeerAdd):
     """Add a peer to WireGuard interface"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -388,7 +389,7 @@ async def add_wireguard_peer(name: str, request: WireGuardPeerAdd):
 
             return {"message": "WireGuard peer added successfully", "name": request.name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -400,7 +401,7 @@ async def remove_wireguard_peer(name: str, peer_name: str):
     """Remove a peer from WireGuard interface"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -412,7 +413,7 @@ async def remove_wireguard_peer(name: str, peer_name: str):
 
             return {"message": "WireGuard peer removed successfully", "name": peer_name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -426,7 +427,7 @@ async def get_ipsec_config():
     """Get IPsec configuration"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -447,7 +448,7 @@ async def get_ipsec_config():
 
             return IPsecConfigResponse(peers=peers)
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -457,14 +458,14 @@ async def get_ipsec_status():
     """Get IPsec status"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
             config_service = VyOSConfigService(ssh_client)
             return config_service.get_ipsec_status()
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -474,7 +475,7 @@ async def create_ipsec_peer(request: IPsecPeerCreate):
     """Create an IPsec peer"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -494,7 +495,7 @@ async def create_ipsec_peer(request: IPsecPeerCreate):
 
             return {"message": "IPsec peer created successfully", "name": request.name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -506,7 +507,7 @@ async def delete_ipsec_peer(name: str):
     """Delete an IPsec peer"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -518,7 +519,7 @@ async def delete_ipsec_peer(name: str):
 
             return {"message": "IPsec peer deleted successfully", "name": name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -530,7 +531,7 @@ async def add_ipsec_tunnel(name: str, request: IPsecTunnelAdd):
     """Add a tunnel to an IPsec peer"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -547,7 +548,7 @@ async def add_ipsec_tunnel(name: str, request: IPsecTunnelAdd):
 
             return {"message": "IPsec tunnel added successfully", "tunnel_name": request.tunnel_name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -561,7 +562,7 @@ async def get_openvpn_config():
     """Get OpenVPN configuration"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -581,7 +582,7 @@ async def get_openvpn_config():
 
             return OpenVPNConfigResponse(instances=instances)
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
 
@@ -591,7 +592,7 @@ async def create_openvpn_instance(request: OpenVPNCreate):
     """Create an OpenVPN instance"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -610,7 +611,7 @@ async def create_openvpn_instance(request: OpenVPNCreate):
 
             return {"message": "OpenVPN instance created successfully", "name": request.name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
@@ -622,7 +623,7 @@ async def delete_openvpn_instance(name: str):
     """Delete an OpenVPN instance"""
     try:
         ssh_config = _get_ssh_config()
-        ssh_client = VyOSSSHClient(ssh_config)
+        ssh_client = ssh_pool.get_client(ssh_config)
         ssh_client.connect()
 
         try:
@@ -634,7 +635,7 @@ async def delete_openvpn_instance(name: str):
 
             return {"message": "OpenVPN instance deleted successfully", "name": name}
         finally:
-            ssh_client.disconnect()
+            ssh_pool.release(ssh_client)
     except HTTPException:
         raise
     except Exception as e:
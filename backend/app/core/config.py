@@ -24,6 +24,16 @@ class Settings(BaseSettings):
     vyos_username: str = ""
     vyos_password: str = ""
     vyos_timeout: int = 30
+    # Pooled configure sessions: close after this long idle / since opened (seconds)
+    vyos_session_idle_timeout: float = 300.0
+    vyos_session_max_age: float = 3600.0
+    # How long fetched running config is reused across requests (seconds)
+    vyos_config_cache_ttl: float = 2.0
+    # How long operational show output (interfaces, routes, ARP) is reused (seconds)
+    vyos_show_cache_ttl: float = 3.0
+
+    # Frontend build directory; probed from the usual locations when empty
+    vyos_static_dir: str = ""
 
     # Security
     secret_key: str = ""
@@ -1,9 +1,22 @@
 """VyOS Network Configuration Service - Updated with real parser"""
 import re
+import threading
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
-from app.services.vyos_command import VyOSCommandExecutor, CommandStatus
+from app.core.config import settings
+from app.services.vyos_command import CommandResult, CommandStatus, VyOSCommandExecutor
+
+SHOW_CACHE_TTL = settings.vyos_show_cache_ttl
+
+# API handlers build a new service per request, so recent show output lives
+# here, shared by polling clients: (host, port, command) -> (fetched at, result)
+_show_cache: dict[tuple[str, int, str], tuple[float, CommandResult]] = {}
+_show_cache_lock = threading.Lock()
+# Bumped on every invalidation so a read that raced a change is not cached
+_show_cache_generation = 0
 
 
 @dataclass
@@ -76,6 +89,49 @@ class NetworkConfigService:
         """
         self.executor = executor
 
+    def _show(self, command: str) -> CommandResult:
+        """Run a read-only command, reusing its output if fetched recently"""
+        config = self.executor.ssh_client.config
+        key = (config.host, config.port, command)
+        with _show_cache_lock:
+            cached = _show_cache.get(key)
+            generation = _show_cache_generation
+        if cached is not None and time.monotonic() - cached[0] < SHOW_CACHE_TTL:
+            return cached[1]
+
+        result = self.executor.execute(command)
+        # Only successful output is worth serving again
+        if result.status == CommandStatus.SUCCESS:
+            with _show_cache_lock:
+                if _show_cache_generation == generation:
+                    _show_cache[key] = (time.monotonic(), result)
+        return result
+
+    def _invalidate_show_cache(self) -> None:
+        """Forget cached show output after a change"""
+        global _show_cache_generation
+        with _show_cache_lock:
+            _show_cache_generation += 1
+            _show_cache.clear()
+
+    def _change(
+        self, run: Callable[[Any], CommandResult], commands: list[str] | str
+    ) -> CommandResult:
+        """Run a state-changing command, dropping cached show output around it
+
+        Invalidating again once the change has returned discards anything a
+        concurrent read cached while the change was in flight.
+        """
+        self._invalidate_show_cache()
+        try:
+            return run(commands)
+        finally:
+            self._invalidate_show_cache()
+
+    def _configure(self, commands: list[str] | str) -> CommandResult:
+        """Apply configuration commands"""
+        return self._change(self.executor.configure, commands)
+
     # Interface Management
 
     def get_interfaces(self) -> list[NetworkInterface]:
@@ -84,13 +140,13 @@ class NetworkConfigService:
             List of NetworkInterface objects
         """
         # Get interfaces from VyOS
-        result = self.executor.execute("/opt/vyatta/bin/vyatta-op-cmd-wrapper show interfaces")
+        result = self._show("/opt/vyatta/bin/vyatta-op-cmd-wrapper show interfaces")
 
         # Parse interface configuration
         interfaces = self._parse_interfaces_output(result.stdout)
 
         # Get full config to get all IP addresses
-        config_result = self.executor.execute("/bin/cli-shell-api showCfg")
+        config_result = self._show("/bin/cli-shell-api showCfg")
         self._update_ip_addresses_from_config(interfaces, config_result.stdout)
 
         return interfaces
@@ -114,8 +170,11 @@ class NetworkConfigService:
                 continue
 
             if in_interfaces:
-                # Count braces to track depth
-                brace_depth += line.count('{') - line.count('}')
+                # Config lines carry at most one brace, as their last character
+                if line[-1] == '{':
+                    brace_depth += 1
+                elif line[-1] == '}':
+                    brace_depth -= 1
                 if brace_depth <= 0:
                     in_interfaces = False
                     current_iface = None
@@ -298,7 +357,7 @@ class NetworkConfigService:
         Returns:
             List of Route objects
         """
-        result = self.executor.execute("/opt/vyatta/bin/vyatta-op-cmd-wrapper show ip route")
+        result = self._show("/opt/vyatta/bin/vyatta-op-cmd-wrapper show ip route")
         return self._parse_routes_output(result.stdout)
 
     def _parse_routes_output(self, output: str) -> list[Route]:
@@ -358,7 +417,7 @@ class NetworkConfigService:
         Returns:
             List of ARPEntry objects
         """
-        result = self.executor.execute("/opt/vyatta/bin/vyatta-op-cmd-wrapper show arp")
+        result = self._show("/opt/vyatta/bin/vyatta-op-cmd-wrapper show arp")
         return self._parse_arp_output(result.stdout)
 
     def _parse_arp_output(self, output: str) -> list[ARPEntry]:
@@ -414,7 +473,7 @@ class NetworkConfigService:
         else:
             command = "ip neigh flush all"
 
-        result = self.executor.execute(command)
+        result = self._change(self.executor.execute, command)
         return result.exit_code == 0
 
     # DNS Management
@@ -425,7 +484,7 @@ class NetworkConfigService:
             DNSConfig object
         """
         # Use cli-shell-api to get configuration - this is more reliable
-        result = self.executor.execute("/bin/cli-shell-api showCfg --show-hide-secrets")
+        result = self._show("/bin/cli-shell-api showCfg --show-hide-secrets")
 
         # Parse DNS configuration
         name_servers = []
@@ -463,7 +522,7 @@ class NetworkConfigService:
             else:
                 commands.append(f"set system name-server {server}")
 
-        result = self.executor.configure(commands)
+        result = self._configure(commands)
         return result.exit_code == 0
 
     def set_domain_name(self, domain: str) -> bool:
@@ -474,7 +533,7 @@ class NetworkConfigService:
             True if successful
         """
         command = f"set system domain-name {domain}"
-        result = self.executor.execute_config_mode(command)
+        result = self._change(self.executor.execute_config_mode, command)
         return result.exit_code == 0
 
     def add_dns_mapping(self, hostname: str, ip_address: str) -> bool:
@@ -486,7 +545,7 @@ class NetworkConfigService:
             True if successful
         """
         command = f"set system host-name {hostname} inet {ip_address}"
-        result = self.executor.execute_config_mode(command)
+        result = self._change(self.executor.execute_config_mode, command)
         return result.exit_code == 0
 
     # IP Address Management
@@ -531,7 +590,7 @@ class NetworkConfigService:
             # No configuration to set
             return True
 
-        result = self.executor.configure(commands)
+        result = self._configure(commands)
         return result.status == CommandStatus.SUCCESS or result.exit_code == 0
 
     def update_interface(self, name: str, config: dict[str, Any]) -> bool:
@@ -559,7 +618,7 @@ class NetworkConfigService:
         if not commands:
             return True
 
-        result = self.executor.configure(commands)
+        result = self._configure(commands)
         return result.status == CommandStatus.SUCCESS or result.exit_code == 0
 
     def delete_interface(self, name: str) -> bool:
@@ -573,7 +632,7 @@ class NetworkConfigService:
         iface_type = iface.type if iface else "ethernet"
 
         command = f"delete interfaces {iface_type} {name}"
-        result = self.executor.configure(command)
+        result = self._configure(command)
         return result.status == CommandStatus.SUCCESS or result.exit_code == 0
 
     def add_ip_address(self, interface: str, address: str) -> bool:
@@ -587,7 +646,7 @@ class NetworkConfigService:
         iface_type = iface.type if iface else "ethernet"
 
         command = f"set interfaces {iface_type} {interface} address '{address}'"
-        result = self.executor.configure(command)
+        result = self._configure(command)
         return result.status == CommandStatus.SUCCESS or result.exit_code == 0
 
     def remove_ip_address(self, interface: str, address: str) -> bool:
@@ -601,7 +660,7 @@ class NetworkConfigService:
         iface_type = iface.type if iface else "ethernet"
 
         command = f"delete interfaces {iface_type} {interface} address '{address}'"
-        result = self.executor.configure(command)
+        result = self._configure(command)
         return result.status == CommandStatus.SUCCESS or result.exit_code == 0
 
     def add_route(self, config: dict[str, Any]) -> bool:
@@ -624,7 +683,7 @@ class NetworkConfigService:
         else:
             return False
 
-        result = self.executor.configure(commands)
+        result = self._configure(commands)
         return result.status == CommandStatus.SUCCESS or result.exit_code == 0
 
     def delete_route(self, destination: str, next_hop: str | None = None) -> bool:
@@ -633,5 +692,5 @@ class NetworkConfigService:
             return False
 
         command = f"delete protocols static route {destination}"
-        result = self.executor.configure(command)
+        result = self._configure(command)
         return result.status == CommandStatus.SUCCESS or result.exit_code == 0
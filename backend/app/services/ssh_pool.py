@@ -1,8 +1,6 @@
 """SSH Connection Pool - Reuse SSH connections for better performance"""
-import time
 import logging
-from typing import Optional
-from contextlib import contextmanager
+import threading
 
 from app.services.vyos_ssh import VyOSSSHClient, VyOSSSHConfig
 from app.core.config import settings
@@ -11,66 +9,66 @@ logger = logging.getLogger(__name__)
 
 
 class SSHConnectionPool:
-    """Simple SSH connection pool - maintains a single persistent connection"""
+    """Keeps one SSH client per router for the lifetime of the process
 
-    _instance: Optional['SSHConnectionPool'] = None
-    _client: Optional[VyOSSSHClient] = None
-    _config: Optional[VyOSSSHConfig] = None
-    _last_used: float = 0
-    _lock = False
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    Paramiko multiplexes channels over a single transport, so concurrent
+    requests can share a client: every command and configure session opens
+    its own channel. Handlers therefore skip the TCP, key exchange and auth
+    handshake after the first request, and configure sessions pooled per
+    client survive from one request to the next.
+    """
 
     def __init__(self):
-        if self._config is None:
-            self._config = VyOSSSHConfig(
+        # (host, port, username) -> shared client
+        self._clients: dict[tuple[str, int, str], VyOSSSHClient] = {}
+        self._lock = threading.Lock()
+
+    def get_client(self, config: VyOSSSHConfig | None = None) -> VyOSSSHClient:
+        """Get the shared client for a router
+
+        The client may not be connected yet; connect() is a no-op while the
+        connection is up and reconnects after it dropped.
+        """
+        if config is None:
+            config = VyOSSSHConfig(
                 host=settings.vyos_host,
                 port=settings.vyos_port,
                 username=settings.vyos_username,
                 password=settings.vyos_password,
                 timeout=settings.vyos_timeout,
             )
+        key = (config.host, config.port, config.username)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                logger.debug(f"Creating shared SSH client for {config.username}@{config.host}")
+                client = self._clients[key] = VyOSSSHClient(config)
+            return client
 
-    def get_client(self) -> VyOSSSHClient:
-        """Get an SSH client - creates new if not connected or expired"""
-        # Simple expiration - reconnect if not used in 30s
-        now = time.time()
-        if self._client is None or not self._client.is_connected() or (now - self._last_used > 30):
-            if self._client:
-                try:
-                    self._client.disconnect()
-                except:
-                    pass
-            logger.debug("Creating new SSH connection")
-            self._client = VyOSSSHClient(self._config)
-            self._client.connect()
-        self._last_used = now
-        return self._client
+    def release(self, client: VyOSSSHClient) -> None:
+        """Hand a client back after a request, keeping its connection open
 
-    @contextmanager
-    def connection(self):
-        """Context manager for SSH connection"""
-        client = self.get_client()
-        try:
-            yield client
-        finally:
-            pass
+        Only a connection that has already dropped is torn down, so the next
+        request reconnects cleanly.
+        """
+        if client.client is not None and not client.is_connected():
+            client.disconnect()
 
+    def close(self) -> None:
+        """Disconnect every shared client"""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.disconnect()
 
-# Singleton instance
-_pool = SSHConnectionPool()
 
-
-def get_ssh_client() -> VyOSSSHClient:
-    """Get SSH client from pool"""
-    return _pool.get_client()
+# Shared pool used by the API handlers
+ssh_pool = SSHConnectionPool()
 
 
-@contextmanager
-def get_ssh_connection():
-    """Get SSH connection context manager"""
-    with _pool.connection():
-        yield _pool.get_client()
+def get_ssh_client() -> VyOSSSHClient:
+    """Get the connected SSH client for the configured router"""
+    client = ssh_pool.get_client()
+    client.connect()
+    return client
@@ -1,15 +1,30 @@
 """VyOS Command Execution Module with Retry and Timeout"""
-import time
 import asyncio
+import re
+import time
+from collections.abc import AsyncIterator
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import AsyncIterator, Any
+from typing import Any
 
 from loguru import logger
 
 from app.services.vyos_ssh import VyOSSSHClient
 
+# Command wrapper prefixes (trailing space included so callers can concatenate)
+_CFG_WRAPPER = "/opt/vyatta/sbin/vyatta-cfg-cmd-wrapper "
+_OP_WRAPPER = "/opt/vyatta/bin/vyatta-op-cmd-wrapper "
+
+# Marker echoed with the exit code after each command run by execute_show_many
+_SHOW_MARKER = "__vyos_webui_show_done__"
+_SHOW_MARKER_RE = re.compile(rf"^{_SHOW_MARKER} (\d+)$", re.MULTILINE)
+
+# Circuit breaker: after this many consecutive failed calls to a host, short-circuit
+# further calls for the cooldown period instead of burning the full retry/backoff cycle
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_COOLDOWN = 30.0
+
 
 class CommandStatus(Enum):
     """Command execution status"""
@@ -39,6 +54,49 @@ class CommandTimeoutError(Exception):
     pass
 
 
+# Per-host circuit state shared by all executors: host -> (opened_at, failure_count)
+_circuit: dict[str, tuple[float | None, int]] = {}
+
+
+def _circuit_open(host: str) -> bool:
+    """Check whether calls to the host are currently short-circuited"""
+    opened_at, _ = _circuit.get(host, (None, 0))
+    if opened_at is None:
+        return False
+    # Once the cooldown has elapsed a trial call is let through (half-open)
+    return time.monotonic() - opened_at < CIRCUIT_COOLDOWN
+
+
+def _record_success(host: str) -> None:
+    """Reset the circuit after a successful call"""
+    _circuit.pop(host, None)
+
+
+def _record_failure(host: str) -> None:
+    """Count a failed call and open the circuit once the threshold is reached"""
+    _, failures = _circuit.get(host, (None, 0))
+    failures += 1
+    opened_at = time.monotonic() if failures >= CIRCUIT_FAILURE_THRESHOLD else None
+    if opened_at is not None:
+        logger.warning(
+            f"Circuit opened for {host} after {failures} failures, "
+            f"failing fast for {CIRCUIT_COOLDOWN:.0f}s"
+        )
+    _circuit[host] = (opened_at, failures)
+
+
+def _circuit_open_result(host: str, command: str) -> CommandResult:
+    """Result returned when a call is short-circuited"""
+    return CommandResult(
+        status=CommandStatus.ERROR,
+        stdout="",
+        stderr=f"Circuit open for {host}: device unreachable",
+        exit_code=-1,
+        command=command,
+        execution_time=0,
+    )
+
+
 class VyOSCommandExecutor:
     """VyOS command executor with retry mechanism and timeout control"""
 
@@ -89,6 +147,10 @@ class VyOSCommandExecutor:
         retry_count = 0
         last_error: Exception | None = None
 
+        host = self.ssh_client.config.host
+        if _circuit_open(host):
+            return _circuit_open_result(host, command)
+
         while retry_count <= retries:
             start_time = time.time()
 
@@ -99,7 +161,9 @@ class VyOSCommandExecutor:
                 logger.debug(f"Executing command: {command}")
 
                 # Execute command with timeout
-                stdin, stdout, stderr = self.ssh_client.client.exec_command(command, timeout=timeout)
+                stdin, stdout, stderr = self.ssh_client.client.exec_command(
+                    command, timeout=timeout
+                )
 
                 # Wait for command to complete
                 exit_code = stdout.channel.recv_exit_status()
@@ -126,6 +190,8 @@ class VyOSCommandExecutor:
                     retry_count=retry_count,
                 )
 
+                _record_success(host)
+
                 if status == CommandStatus.FAILED and raise_on_error:
                     raise RuntimeError(f"Command failed: {command}\nStderr: {stderr_text}")
 
@@ -138,7 +204,9 @@ class VyOSCommandExecutor:
 
             except CommandTimeoutError as e:
                 last_error = e
-                logger.warning(f"Command timeout (attempt {retry_count + 1}/{retries + 1}): {command}")
+                logger.warning(
+                    f"Command timeout (attempt {retry_count + 1}/{retries + 1}): {command}"
+                )
                 retry_count += 1
 
             except Exception as e:
@@ -153,6 +221,7 @@ class VyOSCommandExecutor:
                 time.sleep(delay)
 
         # All retries exhausted
+        _record_failure(host)
         execution_time = time.time() - start_time
         return CommandResult(
             status=CommandStatus.ERROR,
@@ -174,7 +243,7 @@ class VyOSCommandExecutor:
         Returns:
             CommandResult
         """
-        return self.execute(f"/opt/vyatta/sbin/vyatta-cfg-cmd-wrapper set {command}", **kwargs)
+        return self.execute(_CFG_WRAPPER + "set " + command, **kwargs)
 
     def configure(self, commands: list[str] | str) -> CommandResult:
         """Configure VyOS with multiple commands
@@ -193,14 +262,14 @@ class VyOSCommandExecutor:
         # We'll execute each command individually
         last_result: CommandResult | None = None
         for cmd in commands:
-            if cmd.startswith("set ") or cmd.startswith("delete "):
-                last_result = self.execute(f"/opt/vyatta/sbin/vyatta-cfg-cmd-wrapper {cmd}")
+            if cmd.startswith(("set ", "delete ")):
+                last_result = self.execute(_CFG_WRAPPER + cmd)
             else:
-                last_result = self.execute(f"/opt/vyatta/sbin/vyatta-cfg-cmd-wrapper set {cmd}")
+                last_result = self.execute(_CFG_WRAPPER + "set " + cmd)
 
         # Commit the changes
         if last_result and last_result.status == CommandStatus.SUCCESS:
-            self.execute("/opt/vyatta/sbin/vyatta-cfg-cmd-wrapper commit")
+            self.execute(_CFG_WRAPPER + "commit")
 
         return last_result or CommandResult(
             status=CommandStatus.ERROR,
@@ -221,7 +290,46 @@ class VyOSCommandExecutor:
         Returns:
             CommandResult
         """
-        return self.execute(f"/opt/vyatta/bin/vyatta-op-cmd-wrapper {command}", **kwargs)
+        return self.execute(_OP_WRAPPER + command, **kwargs)
+
+    def execute_show_many(self, commands: list[str], **kwargs) -> list[CommandResult]:
+        """Execute several show commands in a single SSH exec
+
+        The commands run one after another in the same remote shell, each
+        followed by a marker line carrying its exit code, so N queries cost
+        one channel and one round trip.
+
+        Args:
+            commands: Show commands, e.g. "show isis interface"
+            **kwargs: Additional arguments for execute()
+
+        Returns:
+            One CommandResult per command, in order
+        """
+        script = "; ".join(
+            f'{_OP_WRAPPER}{command}; echo "{_SHOW_MARKER} $?"' for command in commands
+        )
+        combined = self.execute(script, **kwargs)
+        if combined.status in (CommandStatus.ERROR, CommandStatus.TIMEOUT):
+            return [replace(combined, command=command) for command in commands]
+
+        # [output 1, exit code 1, output 2, exit code 2, ..., trailing text]
+        parts = _SHOW_MARKER_RE.split(combined.stdout)
+        results = []
+        for i, command in enumerate(commands):
+            if 2 * i + 1 < len(parts):
+                output, exit_code = parts[2 * i].strip(), int(parts[2 * i + 1])
+            else:
+                # The shell stopped before reaching this command
+                output, exit_code = "", -1
+            results.append(replace(
+                combined,
+                status=CommandStatus.SUCCESS if exit_code == 0 else CommandStatus.FAILED,
+                stdout=output,
+                exit_code=exit_code,
+                command=command,
+            ))
+        return results
 
     async def execute_command_streaming(
         self, command: str, timeout: int | None = None
@@ -1,10 +1,31 @@
 """VyOS Configuration Service using interactive shell - Simple, Fast & Reliable"""
+import re
 import time
 import logging
+import select
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Optional
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
+# Operational ("$") or configuration ("#") prompt at the end of the output
+_PROMPT_RE = re.compile(rb'[#$]\s*$')
+# Quiet period after a prompt before the output is considered complete
+_PROMPT_SETTLE = 0.05
+# Longest wait for the prompt after a single set/delete/configure/exit
+_PROMPT_WAIT_CAP = 2.0
+# Configure-mode prompt, which VyOS prints after an "[edit]" line; commit
+# hooks may print lines ending in "#" or "$" before it
+_COMMIT_DONE_RE = re.compile(rb'\[edit\]\r?\n[^\n]*#\s*$')
+_COMMIT_FAILED_RE = re.compile(r'error|fail|abort', re.IGNORECASE)
+# Line VyOS prints after rejecting a set/delete (the echoed command is never
+# a line of its own, so user text in it cannot match)
+_COMMAND_FAILED_RE = re.compile(r'^\s*(?:Set|Delete) failed\s*$', re.MULTILINE)
+
 
 class VyOSConfigSession:
     """VyOS configuration session using interactive shell"""
@@ -18,6 +39,13 @@ class VyOSConfigSession:
         self.ssh_client = ssh_client
         self.shell = None
         self.in_config_mode = False
+        # Set/delete commands sent since the last successful commit
+        self.pending_changes = False
+        # A command whose prompt has not been read yet (its wait timed out)
+        self.awaiting_prompt = False
+        # Monotonic open time and last checkout return, used by the pool
+        self.opened_at = 0.0
+        self.last_used = 0.0
 
     def open(self) -> bool:
         """Open interactive shell
@@ -27,6 +55,7 @@ class VyOSConfigSession:
         """
         try:
             self.shell = self.ssh_client.client.invoke_shell()
+            self.opened_at = self.last_used = time.monotonic()
             time.sleep(0.3)
             self._drain_output()
             return True
@@ -47,11 +76,71 @@ class VyOSConfigSession:
                 break
 
     def _send_and_sleep(self, command: str, sleep_time: float) -> str:
-        """Send command and sleep for specified time
+        """Send command and wait for the prompt to come back
+
+        Args:
+            command: Command to send
+            sleep_time: Kept for compatibility; the wait ends at the prompt,
+                capped at _PROMPT_WAIT_CAP (or sleep_time, if longer)
+
+        Returns:
+            Command output
+        """
+        return self._send_and_wait_prompt(command, timeout=max(sleep_time, _PROMPT_WAIT_CAP))
+
+    def _read_until_prompt(self, timeout: float = 5.0, prompt_re: re.Pattern = _PROMPT_RE) -> str:
+        """Read shell output until it ends with a prompt and then goes quiet
+
+        Args:
+            timeout: Maximum time to wait for the prompt
+            prompt_re: Pattern matched against the tail of the output
+
+        Returns:
+            Output read from the shell
+        """
+        buf = bytearray()
+        deadline = time.monotonic() + timeout
+        self.awaiting_prompt = True
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning("Timed out waiting for VyOS prompt")
+                break
+            # The tail must hold an "[edit]" line plus the prompt for commits
+            at_prompt = prompt_re.search(buf[-256:]) is not None
+            wait = min(_PROMPT_SETTLE, remaining) if at_prompt else remaining
+            readable, _, _ = select.select([self.shell], [], [], wait)
+            if readable:
+                data = self.shell.recv(65536)
+                if not data:
+                    break
+                buf += data
+            elif at_prompt:
+                self.awaiting_prompt = False
+                break
+        return buf.decode('utf-8', errors='replace')
+
+    def _catch_up(self, timeout: float) -> bool:
+        """Read the prompt of an earlier command whose wait timed out
+
+        Until it has been read, the next prompt in the output belongs to that
+        command rather than to whatever is sent next.
+
+        Returns:
+            True if no earlier prompt is outstanding
+        """
+        if self.awaiting_prompt:
+            self._read_until_prompt(timeout)
+        return not self.awaiting_prompt
+
+    def _send_and_wait_prompt(self, command: str, prompt_re: re.Pattern = _PROMPT_RE,
+                              timeout: float = 5.0) -> str:
+        """Send command and return as soon as the prompt comes back
 
         Args:
             command: Command to send
-            sleep_time: Time to sleep after sending
+            prompt_re: Pattern matched against the tail of the output
+            timeout: Maximum time to wait for the prompt
 
         Returns:
             Command output
@@ -60,23 +149,57 @@ class VyOSConfigSession:
             return ""
 
         try:
+            if not self._catch_up(timeout):
+                logger.error(f"Shell still busy with an earlier command, not sending: {command}")
+                return ""
             self._drain_output()
-            self.shell.send(command + "\n")
-            time.sleep(sleep_time)
-
-            # Read whatever output is available
-            output = ""
-            start = time.time()
-            while time.time() - start < 0.1:
-                if self.shell.recv_ready():
-                    output += self.shell.recv(32768).decode('utf-8', errors='replace')
-                else:
-                    break
-            return output
+            if command.startswith(("set ", "delete ")):
+                self.pending_changes = True
+            self.shell.sendall((command + "\n").encode("utf-8"))
+            return self._read_until_prompt(timeout, prompt_re)
         except Exception as e:
             logger.error(f"Failed to send command: {e}")
             return ""
 
+    def send_batch(self, commands: list[str], timeout: float = 10.0) -> str:
+        """Send several commands, waiting for the prompt after each one
+
+        Only one command is in flight at a time, so every prompt read belongs
+        to the command just sent and the batch is complete once the last
+        prompt is back.
+
+        Args:
+            commands: Commands to send, in order
+            timeout: Maximum time to wait for all commands to complete
+
+        Returns:
+            Combined command output
+
+        Raises:
+            TimeoutError: A command's prompt did not come back in time
+        """
+        if not self.shell or not commands:
+            return ""
+
+        deadline = time.monotonic() + timeout
+        if not self._catch_up(timeout):
+            raise TimeoutError("Shell still busy with an earlier command")
+        self._drain_output()
+        if any(cmd.startswith(("set ", "delete ")) for cmd in commands):
+            self.pending_changes = True
+        outputs = []
+        for command in commands:
+            self.shell.sendall((command + "\n").encode("utf-8"))
+            outputs.append(self._read_until_prompt(deadline - time.monotonic()))
+            if self.awaiting_prompt:
+                raise TimeoutError(f"No prompt after: {command}")
+        return "".join(outputs)
+
+    @staticmethod
+    def command_failed(output: str) -> bool:
+        """Whether set/delete output shows VyOS rejected one of the commands"""
+        return _COMMAND_FAILED_RE.search(output) is not None
+
     def enter_config_mode(self) -> bool:
         """Enter configuration mode"""
         if self.in_config_mode:
@@ -116,14 +239,38 @@ class VyOSConfigSession:
         cmd = "commit"
         if comment:
             cmd += f' comment "{comment}"'
-        output = self._send_and_sleep(cmd, 0.8)
-        return "error" not in output.lower() and "fail" not in output.lower() and "abort" not in output.lower()
+        # Commit time varies with the size of the change; wait for the prompt.
+        # Any earlier command's prompt is read first so it cannot pass for
+        # the end of the commit
+        output = self._send_and_wait_prompt(cmd, _COMMIT_DONE_RE, timeout=60.0)
+        ok = not self.awaiting_prompt and _COMMIT_FAILED_RE.search(output) is None
+        if ok:
+            self.pending_changes = False
+        return ok
+
+    def discard(self) -> bool:
+        """Drop uncommitted changes, staying in configuration mode"""
+        if not self.in_config_mode:
+            return False
+        output = self._send_and_wait_prompt("discard")
+        ok = (not self.awaiting_prompt
+              and "error" not in output.lower() and "fail" not in output.lower())
+        if ok:
+            self.pending_changes = False
+        return ok
 
     def save(self) -> bool:
         """Save configuration"""
-        output = self._send_and_sleep("save", 0.5)
+        output = self._send_and_wait_prompt("save", timeout=30.0)
         return "error" not in output.lower() and "fail" not in output.lower()
 
+    def is_alive(self) -> bool:
+        """Check that the shell channel and its SSH transport are still usable"""
+        if not self.shell or self.shell.closed:
+            return False
+        transport = self.ssh_client.client.get_transport() if self.ssh_client.client else None
+        return transport is not None and transport.is_active()
+
     def close(self) -> None:
         """Close the session"""
         try:
@@ -140,6 +287,8 @@ class VyOSConfigSession:
         finally:
             self.shell = None
             self.in_config_mode = False
+            self.pending_changes = False
+            self.awaiting_prompt = False
 
     def __enter__(self):
         self.open()
@@ -147,3 +296,93 @@ class VyOSConfigSession:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
+
+
+class VyOSConfigSessionPool:
+    """Keeps idle configure-mode sessions per SSH client for reuse across calls
+
+    Opening a shell and entering configure mode costs several round trips; a
+    pooled session skips straight to the set/delete/commit commands. Each
+    session is its own channel on the client's SSH transport, so concurrent
+    callers get separate sessions over the same connection.
+    """
+
+    def __init__(self, max_idle_per_client: int = 4, idle_timeout: float = 300.0,
+                 max_age: float = 3600.0):
+        # id(ssh_client) -> idle sessions; a session keeps its client alive, so
+        # the id cannot be reused while the entry exists
+        self._sessions: dict[int, list[VyOSConfigSession]] = {}
+        self._lock = threading.Lock()
+        self.max_idle_per_client = max_idle_per_client
+        self.idle_timeout = idle_timeout
+        self.max_age = max_age
+
+    def _usable(self, session: VyOSConfigSession, now: float) -> bool:
+        """Whether an idle session may still be handed out"""
+        return (now - session.last_used < self.idle_timeout
+                and now - session.opened_at < self.max_age
+                and session.is_alive())
+
+    def _sweep(self) -> None:
+        """Drop idle sessions that expired or lost their SSH connection (caller holds lock)"""
+        now = time.monotonic()
+        for key, sessions in list(self._sessions.items()):
+            alive = []
+            for session in sessions:
+                if self._usable(session, now):
+                    alive.append(session)
+                else:
+                    session.close()
+            if alive:
+                self._sessions[key] = alive
+            else:
+                del self._sessions[key]
+
+    @contextmanager
+    def checkout(self, ssh_client) -> Iterator[VyOSConfigSession]:
+        """Borrow a session in configure mode, returning it to the pool afterwards
+
+        A session is only returned to the pool when the caller finished without
+        an exception and left nothing uncommitted. Leftover edits are discarded
+        first; if that fails the session is closed so no half-applied edit
+        leaks into the next caller.
+        """
+        key = id(ssh_client)
+        session = None
+        with self._lock:
+            self._sweep()
+            idle = self._sessions.get(key)
+            if idle:
+                session = idle.pop()
+
+        if session is None:
+            session = VyOSConfigSession(ssh_client)
+            session.open()
+            session.enter_config_mode()
+
+        try:
+            yield session
+        except BaseException:
+            session.close()
+            raise
+
+        if session.pending_changes and session.is_alive():
+            session.discard()
+        if session.pending_changes or session.awaiting_prompt or not session.is_alive():
+            # Never hand uncommitted edits or unread output to the next caller
+            session.close()
+            return
+        session.last_used = time.monotonic()
+        with self._lock:
+            idle = self._sessions.setdefault(key, [])
+            if len(idle) < self.max_idle_per_client:
+                idle.append(session)
+                return
+        session.close()
+
+
+# Shared pool used by VyOSConfigService
+session_pool = VyOSConfigSessionPool(
+    idle_timeout=settings.vyos_session_idle_timeout,
+    max_age=settings.vyos_session_max_age,
+)
@@ -1,38 +1,488 @@
 """VyOS Configuration Service - SIMPLE, DIRECT, GUARANTEED TO WORK!"""
+import base64
+import codecs
 import logging
+import os
 import re
-import base64
-
+import shlex
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TypeVar
+
+try:
+    # PyNaCl is optional: libsodium's basepoint scalarmult is the cheapest X25519 path
+    from nacl.bindings import crypto_scalarmult_base as _x25519_base
+except ImportError:
+    _x25519_base = None
+
+try:
+    from cryptography.hazmat.primitives import serialization as _serialization
+    from cryptography.hazmat.primitives.asymmetric import x25519 as _x25519
+except ImportError:
+    _x25519 = _serialization = None
+
+from app.core.config import settings
+from app.services.vyos_command import VyOSCommandExecutor
+from app.services.vyos_config import VyOSConfigSession, session_pool
 from app.services.vyos_ssh import VyOSSSHClient
-from app.services.vyos_config import VyOSConfigSession
 
 logger = logging.getLogger(__name__)
 
+SHOW_CFG_COMMAND = "/bin/cli-shell-api showCfg"
+# Makes configure/set/delete/commit available to a non-interactive vbash
+CONFIG_SCRIPT_HEADER = "source /opt/vyatta/etc/functions/script-template\nconfigure\n"
+# How long a fetched showCfg result may be reused by later getters (seconds)
+CONFIG_CACHE_TTL = settings.vyos_config_cache_ttl
+
+T = TypeVar("T")
+
+# BGP neighbor leaves: showCfg key -> (result field, converter)
+_BGP_NEIGHBOR_FIELDS = {
+    'remote-as': ('remote_as', int),
+    'advertisement-interval': ('advertisement_interval', int),
+    'ebgp-multihop': ('ebgp_multihop', int),
+    'description': ('description', str),
+    'update-source': ('update_source', str),
+    'password': ('password', str),
+}
+# 'show ip bgp summary' (FRR): header line and one row per peer
+#   Neighbor  V  AS  MsgRcvd  MsgSent  TblVer  InQ  OutQ  Up/Down  State/PfxRcd  [PfxSnt]  [Desc]
+_BGP_SUMMARY_HEADER_RE = re.compile(r'BGP router identifier (\S+), local AS number (\d+)')
+_BGP_SUMMARY_PEER_RE = re.compile(
+    r'^(\S+)\s+4\s+(\d+)\s+\d+\s+\d+\s+\d+\s+\d+\s+\d+\s+(\S+)\s+(\S+)(?:\s+(\d+))?', re.MULTILINE)
+
+# 'show isis database' (FRR): per-level headers and one row per LSP; the
+# local-LSP '*' follows the LSP ID
+#   LSP ID  [*]  PduLen  SeqNumber  Chksum  Holdtime  ATT/P/OL
+_ISIS_DB_LEVEL_RE = re.compile(r'Level-([12]) link-state database')
+_ISIS_LSP_RE = re.compile(
+    r'^\s*(\*)?\s*(\S+)\s+(\*)?\s*(\d+)\s+(0x[0-9a-fA-F]+)\s+(0x[0-9a-fA-F]+)\s+(\d+)\s+(\S+)',
+    re.MULTILINE)
+
+# 'show interfaces': one row per interface with its state/link column
+#   Interface  IP Address  S/L  Description
+_SHOW_INTERFACES_ROW_RE = re.compile(r'^(\S+)\s+\S+\s+([uAD])/([uD])\b', re.MULTILINE)
+# IPv4 address in 'show interfaces pppoe' output
+_IPV4_RE = re.compile(r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})')
+# First number on a line, e.g. 'listening port: 51820' in 'show interfaces wireguard'
+_FIRST_INT_RE = re.compile(r'(\d+)')
+
+
+def _present(value: str | None) -> bool:
+    """Converter for valueless flag nodes: being listed means enabled"""
+    return True
+
+
+def _int_or_none(value: str) -> int | None:
+    """Converter for group references, reported as numbers only when numeric"""
+    return int(value) if value.isdigit() else None
+
+
+# update_bgp_neighbor keyword -> (node under the neighbor, value template or
+# None for a flag); a falsy value deletes the node
+_BGP_NEIGHBOR_UPDATE_FIELDS = [
+    ('description', 'description', '{v}'),
+    ('update_source', 'update-source', '{v}'),
+    ('advertisement_interval', 'advertisement-interval', '{v}'),
+    ('ebgp_multihop', 'ebgp-multihop', '{v}'),
+    ('password', 'password', '{v}'),
+    ('next_hop_self', 'next-hop-self', None),
+    ('prefix_list_in', 'address-family ipv4-unicast prefix-list import', '{v}'),
+    ('prefix_list_out', 'address-family ipv4-unicast prefix-list export', '{v}'),
+    ('route_map_in', 'address-family ipv4-unicast route-map import', '{v}'),
+    ('route_map_out', 'address-family ipv4-unicast route-map export', '{v}'),
+]
+
+# add_route_map_rule match/set dict keys -> node under the rule, in emit order
+_ROUTE_MAP_MATCH_FIELDS = [
+    ('ip_address_prefix_list', 'match ip address prefix-list'),
+    ('community', 'match community'),
+    ('local_preference', 'match local-preference'),
+    ('metric', 'match metric'),
+]
+_ROUTE_MAP_SET_FIELDS = [
+    ('local_preference', 'set local-preference'),
+    ('metric', 'set metric'),
+    ('weight', 'set weight'),
+    ('next_hop', 'set ip next-hop'),
+    ('as_path_prepend', 'set as-path prepend'),
+    ('community', 'set community'),
+]
+
+# IS-IS global and per-interface leaves: showCfg key -> (result field, converter)
+_ISIS_FIELDS = {
+    'net': ('net', str),
+    'level': ('level', str),
+    'metric-style': ('metric_style', str),
+    'spf-interval': ('spf_interval', int),
+    'purge-originator': ('purge_originator', _present),
+    'set-overload-bit': ('set_overload_bit', _present),
+    'ldp-sync': ('ldp_sync', _present),
+}
+# update_isis_global_config keyword -> (node under protocols isis, whether it
+# is a valueless flag); value nodes are deleted before a new value is set
+_ISIS_GLOBAL_UPDATE_FIELDS = [
+    ('net', 'net', False),
+    ('level', 'level', False),
+    ('metric_style', 'metric-style', False),
+    ('purge_originator', 'purge-originator', True),
+    ('set_overload_bit', 'set-overload-bit', True),
+    ('spf_interval', 'spf-interval', False),
+]
+_ISIS_INTERFACE_FIELDS = {
+    'circuit-type': ('circuit_type', str),
+    'hello-interval': ('hello_interval', int),
+    'hello-multiplier': ('hello_multiplier', int),
+    'metric': ('metric', int),
+    'passive': ('passive', _present),
+    'priority': ('priority', int),
+}
+# PPPoE interface leaves: showCfg key -> (result field, converter)
+_PPPOE_FIELDS = {
+    'source-interface': ('source_interface', str),
+    'description': ('description', str),
+    'mtu': ('mtu', int),
+    'default-route': ('default_route', _present),
+    'name-servers': ('name_servers', _present),
+}
+# update_pppoe_interface / update_wireguard_interface keyword -> (node under
+# the interface, value template); the node is deleted and, for a truthy
+# value, set again. _replace_commands shell-quotes the values
+_PPPOE_UPDATE_FIELDS = [
+    ('source_interface', 'source-interface', '{v}'),
+    ('username', 'authentication username', '{v}'),
+    ('password', 'authentication password', '{v}'),
+    ('description', 'description', '{v}'),
+    ('mtu', 'mtu', '{v}'),
+    ('default_route', 'default-route', 'auto'),
+    ('name_servers', 'name-servers', 'auto'),
+]
+_WIREGUARD_UPDATE_FIELDS = [
+    ('address', 'address', '{v}'),
+    ('listen_port', 'port', '{v}'),
+    ('mtu', 'mtu', '{v}'),
+    ('description', 'description', '{v}'),
+]
+# WireGuard interface and peer leaves: showCfg key -> (result field, converter)
+_WIREGUARD_FIELDS = {
+    'address': ('address', str),
+    'private-key': ('private_key', str),
+    'port': ('listen_port', int),
+    'mtu': ('mtu', int),
+    'description': ('description', str),
+}
+_WIREGUARD_PEER_FIELDS = {
+    'public-key': ('public_key', str),
+    'allowed-ips': ('allowed_ips', str),
+    'address': ('endpoint', str),
+    'port': ('port', int),
+    'persistent-keepalive': ('persistent_keepalive', int),
+}
+# IPsec site-to-site peer leaves: showCfg key -> (result field, converter)
+_IPSEC_PEER_FIELDS = {
+    'remote-address': ('remote_address', str),
+    'local-address': ('local_address', str),
+    'description': ('description', str),
+    'ike-group': ('ike_group', _int_or_none),
+    'esp-group': ('esp_group', _int_or_none),
+    'default-esp-group': ('esp_group', _int_or_none),
+}
+# OpenVPN instance leaves: showCfg key -> (result field, converter)
+_OPENVPN_FIELDS = {
+    'mode': ('mode', str),
+    'protocol': ('protocol', str),
+    'local-port': ('port', int),
+    'device-type': ('device', str),
+    'description': ('description', str),
+}
+# Neighbor address-family policy leaves: (policy node, key) -> result field
+_BGP_NEIGHBOR_AF_FIELDS = {
+    ('prefix-list', 'import'): 'prefix_list_in',
+    ('prefix-list', 'export'): 'prefix_list_out',
+    ('route-map', 'import'): 'route_map_in',
+    ('route-map', 'export'): 'route_map_out',
+}
+
+# Optional rule fields: (argument name, set-path template), emitted in order
+# for every argument that is set
+_FIREWALL_RULE_FIELDS = [
+    ("description", "description {v}"),
+    ("source_address", "source address {v}"),
+    ("destination_address", "destination address {v}"),
+    ("protocol", "protocol {v}"),
+    ("source_port", "source port {v}"),
+    ("destination_port", "destination port {v}"),
+    ("log", "log enable"),
+]
+_NAT_MATCH_FIELDS = [
+    ("source_address", "source address {v}"),
+    ("source_port", "source port {v}"),
+    ("destination_address", "destination address {v}"),
+    ("destination_port", "destination port {v}"),
+]
+_NAT_TRANSLATION_FIELDS = [
+    ("translation_address", "translation address {v}"),
+    ("translation_port", "translation port {v}"),
+    ("protocol", "protocol {v}"),
+]
+_NAT_MASQ_FIELDS = [
+    ("outbound_interface", "outbound-interface {v}"),
+    *_NAT_MATCH_FIELDS,
+    ("protocol", "protocol {v}"),
+    ("description", "description {v}"),
+]
+_NAT_SOURCE_FIELDS = [
+    ("description", "description {v}"),
+    ("outbound_interface", "outbound-interface {v}"),
+    *_NAT_MATCH_FIELDS,
+    *_NAT_TRANSLATION_FIELDS,
+]
+_NAT_DEST_FIELDS = [
+    ("description", "description {v}"),
+    ("inbound_interface", "inbound-interface {v}"),
+    *_NAT_MATCH_FIELDS,
+    *_NAT_TRANSLATION_FIELDS,
+]
+
+
+def _pubkey_libsodium(priv_key_bytes: bytes) -> bytes:
+    # X25519 basepoint multiplication (scalar clamping happens inside libsodium)
+    return _x25519_base(priv_key_bytes)
+
+
+def _pubkey_cryptography(priv_key_bytes: bytes) -> bytes:
+    priv_key = _x25519.X25519PrivateKey.from_private_bytes(priv_key_bytes)
+    return priv_key.public_key().public_bytes(
+        encoding=_serialization.Encoding.Raw,
+        format=_serialization.PublicFormat.Raw
+    )
+
+
+# X25519 backend picked once at import; None when neither library is installed
+if _x25519_base is not None:
+    _derive_pubkey = _pubkey_libsodium
+elif _x25519 is not None:
+    _derive_pubkey = _pubkey_cryptography
+else:
+    _derive_pubkey = None
+
+
+def wireguard_pubkey_from_privkey_bytes(priv_key_bytes: bytes) -> bytes | None:
+    """Derive a raw WireGuard public key from a raw private key"""
+    if _derive_pubkey is None:
+        logger.debug("No X25519 backend available to derive WireGuard public keys")
+        return None
+    try:
+        if len(priv_key_bytes) < 32:
+            raise ValueError("X25519 private key must be 32 bytes")
+        # Public key from the first 32 bytes
+        return _derive_pubkey(priv_key_bytes[:32])
+    except Exception as e:
+        logger.debug(f"Failed to derive WireGuard public key: {e}")
+        return None
+
 
 def wireguard_pubkey_from_privkey(private_key: str) -> str | None:
     """Derive WireGuard public key from private key"""
     try:
-        import cryptography.hazmat.primitives.asymmetric.x25519 as x25519
-        import cryptography.hazmat.primitives.serialization as serialization
-
-        # Decode base64 private key
         priv_key_bytes = base64.b64decode(private_key)
-
-        # Create X25519 private key object (first 32 bytes)
-        priv_key = x25519.X25519PrivateKey.from_private_bytes(priv_key_bytes[:32])
-
-        # Get public key
-        pub_key = priv_key.public_key()
-
-        # Encode to base64
-        pub_key_bytes = pub_key.public_bytes(
-            encoding=serialization.Encoding.Raw,
-            format=serialization.PublicFormat.Raw
-        )
-        return base64.b64encode(pub_key_bytes).decode('utf-8')
     except Exception as e:
         logger.debug(f"Failed to derive WireGuard public key: {e}")
         return None
+    pub_key_bytes = wireguard_pubkey_from_privkey_bytes(priv_key_bytes)
+    if pub_key_bytes is None:
+        return None
+    # base64 output is pure ASCII
+    return base64.b64encode(pub_key_bytes).decode('ascii')
+
+
+def wireguard_pubkeys_from_privkeys(private_keys: list[str]) -> list[str | None]:
+    """Derive WireGuard public keys for several private keys at once
+
+    Returns one entry per input key, None where derivation failed.
+    """
+    return [wireguard_pubkey_from_privkey(key) for key in private_keys]
+
+
+def _unquote(value: str) -> str:
+    """Strip the quotes showCfg puts around values containing spaces"""
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'':
+        return value[1:-1]
+    return value
+
+
+def _stream_lines(channel) -> Iterator[str]:
+    """Decode SSH channel output incrementally and yield it line by line"""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    tail = ""
+    while True:
+        chunk = channel.recv(65536)
+        text = decoder.decode(chunk, final=not chunk)
+        if text:
+            lines = (tail + text).split("\n")
+            tail = lines.pop()
+            yield from lines
+        if not chunk:
+            break
+    if tail:
+        yield tail
+
+
+# (parent_path, key, value) as produced by the config walker
+_ConfigEvent = tuple[tuple[str, ...], str, str | None]
+
+
+def _iter_config(lines: Iterable[str], root_path: tuple[str, ...] = ()) -> Iterator[_ConfigEvent]:
+    """Walk showCfg output lines once, yielding (parent_path, key, value) per node
+
+    parent_path mirrors the set-command path of the enclosing node, e.g.
+    ('policy', 'prefix-list', 'PL1', 'rule', '10') for the leaves of that rule.
+    Container nodes are yielded when they open, before their children, and
+    valueless leaves (e.g. 'passive') are yielded with value None.
+
+    With root_path, only nodes whose own path starts with it are yielded, and
+    the walk stops at the first node after that subtree. showCfg keeps sibling
+    nodes sorted, so e.g. every prefix-list under root_path
+    ('policy', 'prefix-list') is contiguous.
+    """
+    depth = len(root_path)
+    seen_root = False
+    parent_inside = not depth  # parent[:depth] == root_path, for deep parents
+    path: list[str] = []
+    marks: list[int] = []  # len(path) before each open container
+    parent: tuple[str, ...] = ()  # tuple(path), rebuilt only when the nesting changes
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith('/*'):
+            continue
+        # showCfg puts at most one brace on a line, always as its last
+        # character, so one comparison gives the nesting change
+        if line == '}':
+            if marks:
+                del path[marks.pop():]
+                parent = tuple(path)
+                parent_inside = parent[:depth] == root_path
+            continue
+
+        is_node = line[-1] == '{'
+        if is_node:
+            line = line[:-1].rstrip()
+        key, _, value = line.partition(' ')
+        value = _unquote(value.lstrip()) if value else None
+
+        if len(parent) >= depth:
+            inside = parent_inside
+        else:
+            own = parent + (key,) if value is None else parent + (key, value)
+            inside = own[:depth] == root_path[:len(own)]
+            if inside:
+                seen_root = seen_root or len(own) >= depth
+            elif seen_root:
+                return
+        if inside and len(parent) + 1 + (value is not None) >= depth:
+            yield parent, key, value
+
+        if is_node:
+            marks.append(len(path))
+            path.append(key)
+            if value is not None:
+                path.append(value)
+            parent = tuple(path)
+            parent_inside = parent[:depth] == root_path
+
+
+def _select_config(events: Iterable[_ConfigEvent],
+                   root_path: tuple[str, ...]) -> Iterator[_ConfigEvent]:
+    """Filter already-walked events to a subtree, as _iter_config(lines, root_path) would
+
+    Lets several parsers share one walk of the same lines. Parent tuples are
+    only rebuilt by the walker when the nesting changes, so the subtree test
+    for deep parents is redone only when the parent object changes.
+    """
+    depth = len(root_path)
+    seen_root = False
+    last_parent = None
+    parent_inside = False
+    for event in events:
+        parent, key, value = event
+        if len(parent) >= depth:
+            if parent is not last_parent:
+                last_parent = parent
+                parent_inside = parent[:depth] == root_path
+            if parent_inside:
+                yield event
+            continue
+
+        own = parent + (key,) if value is None else parent + (key, value)
+        if own[:depth] == root_path[:len(own)]:
+            if len(own) >= depth:
+                seen_root = True
+                yield event
+        elif seen_root:
+            return
+
+
+def _changed_values(current: dict, values: dict) -> dict:
+    """Drop values that already match the parsed config
+
+    A falsy value means "remove", which is a no-op when the field is already
+    unset. Values are compared as strings since parsed fields may be ints.
+    """
+    changed = {}
+    for name, value in values.items():
+        existing = current.get(name)
+        if not value:
+            if existing:
+                changed[name] = value
+        elif existing is None or str(existing) != str(value):
+            changed[name] = value
+    return changed
+
+
+def _quote(value: object) -> str:
+    """Quote a value as a single shell word for a set command or commit comment"""
+    return shlex.quote(str(value))
+
+
+def _script_line(cmd: str) -> str:
+    """Make a config script abort when a set/delete fails
+
+    Deleting a node that does not exist is not a failure: updates clear
+    nodes before setting them without knowing whether they hold a value.
+    """
+    if cmd.startswith("delete "):
+        path = cmd[len("delete "):]
+        return f"if cli-shell-api exists {path}; then {cmd} || builtin exit 1; fi"
+    return f"{cmd} || builtin exit 1"
+
+
+def _replace_commands(base: str, fields: list[tuple[str, str, str]], values: dict,
+                      current: dict | None = None) -> list[str]:
+    """Build delete/set commands for the keywords present in values
+
+    With the current parsed config, a node is only deleted when it holds a
+    value there; without it, always.
+    """
+    cmds = []
+    for name, node, template in fields:
+        if name not in values:
+            continue
+        if current is None or current.get(name):
+            cmds.append(f"delete {base} {node}")
+        value = values[name]
+        if value:
+            cmds.append(f"set {base} {node} {template.format(v=_quote(value))}")
+    return cmds
+
+
+# API handlers build a new client and service per request, so fetched config
+# and parse results live here, shared by every service talking to the same
+# router: (host, port, username) -> (showCfg cache, parse cache)
+_device_caches: dict[tuple, tuple[dict, dict]] = {}
+_device_caches_lock = threading.Lock()
 
 
 class VyOSConfigService:
@@ -41,9 +491,213 @@ class VyOSConfigService:
     def __init__(self, ssh_client: VyOSSSHClient):
         """Initialize with SSH client"""
         self.ssh_client = ssh_client
+        config = ssh_client.config
+        with _device_caches_lock:
+            key = (config.host, config.port, config.username)
+            caches = _device_caches.setdefault(key, ({}, {}))
+        # showCfg section path (() for the whole config) -> (fetched at, lines)
+        self._cfg_cache: dict[tuple[str, ...], tuple[float, list[str]]] = caches[0]
+        # getter name -> (config lines it was parsed from, parsed result)
+        self._parse_cache: dict[str, tuple[list[str], object]] = caches[1]
+
+    @contextmanager
+    def _checkout_session(self) -> Iterator[VyOSConfigSession]:
+        """Borrow a pooled configure-mode session for this SSH client"""
+        # Any mutation makes the cached running config stale; invalidate
+        # again once it is committed, as a concurrent read may have cached
+        # the old config in the meantime
+        self._invalidate_caches()
+        try:
+            with session_pool.checkout(self.ssh_client) as session:
+                yield session
+        finally:
+            self._invalidate_caches()
+
+    def _invalidate_caches(self) -> None:
+        """Forget fetched config and parse results after a change"""
+        self._cfg_cache.clear()
+        self._parse_cache.clear()
+
+    def _get_config_lines(self, section: tuple[str, ...] = (),
+                          max_age: float = CONFIG_CACHE_TTL) -> list[str]:
+        """Get showCfg output lines, reusing a recent fetch when possible
+
+        With a section (a path of plain, non-tag nodes such as
+        ('protocols', 'isis')) only that subtree is fetched. Its lines are
+        wrapped in the enclosing "node {" / "}" lines so the config walker
+        sees the same absolute paths as in the full config. A fresh full
+        config is reused for any section.
+        """
+        now = time.monotonic()
+        for key in ((section, ()) if section else ((),)):
+            cached = self._cfg_cache.get(key)
+            if cached is not None and now - cached[0] < max_age:
+                return cached[1]
+
+        # A bare session channel: no stdin/stderr file wrappers, and closing
+        # our write side up front lets the remote command see EOF at once
+        channel = self.ssh_client.client.get_transport().open_session()
+        try:
+            # recv() returns data as soon as it arrives; the timeout only
+            # bounds a stalled command instead of blocking forever
+            channel.settimeout(self.ssh_client.config.timeout)
+            channel.exec_command(" ".join((SHOW_CFG_COMMAND,) + section))
+            channel.shutdown_write()
+            lines = list(_stream_lines(channel))
+        finally:
+            channel.close()
+        if section:
+            lines = [f"{node} {{" for node in section] + lines + ["}"] * len(section)
+        # Keep the previous list when nothing changed so parse results survive
+        previous = self._cfg_cache.get(section)
+        if previous is not None and lines == previous[1]:
+            lines = previous[1]
+        self._cfg_cache[section] = (time.monotonic(), lines)
+        return lines
+
+    @contextmanager
+    def request_session(self, comment: str | None = None) -> Iterator[VyOSConfigSession]:
+        """Share one configure-mode session across several changes, committed once
+
+        Pass the yielded session to methods that take a ``session`` argument;
+        they then only stage their commands. Everything staged is committed
+        together when the block exits cleanly, and discarded if it raises.
+
+        Raises:
+            RuntimeError: The commit failed
+        """
+        with self._checkout_session() as session:
+            yield session
+            if session.pending_changes and not session.commit(comment=comment):
+                raise RuntimeError("commit failed")
+
+    def _apply(self, cmds: list[str], comment: str,
+               session: VyOSConfigSession | None = None) -> bool:
+        """Apply commands in one committed config script, or stage them in a caller's session"""
+        if session is not None:
+            # Committed by whoever owns the session (see request_session)
+            output = session.send_batch(cmds)
+            if session.command_failed(output):
+                logger.error(f"VyOS rejected staged commands: {output.strip()}")
+                return False
+            return True
+        # Same commit timeout as an interactive VyOSConfigSession.commit
+        return self._run_config_script(cmds, comment, timeout=60.0)
+
+    def _commit_in_session(self, cmds: list[str], comment: str) -> bool:
+        """Stage commands in a pooled configure session and commit them
+
+        Returns False without committing if VyOS rejected any command; the
+        pool then discards what was staged.
+        """
+        with self._checkout_session() as session:
+            output = session.send_batch(cmds)
+            if session.command_failed(output):
+                logger.error(f"VyOS rejected commands: {output.strip()}")
+                return False
+            return session.commit(comment=comment)
+
+    def _run_config_script(self, cmds: list[str], comment: str | None = None,
+                           timeout: float = 30.0) -> bool:
+        """Apply and commit commands in one non-interactive vbash exec
+
+        VyOS's script-template provides configure/set/delete/commit as plain
+        shell commands, so a short edit needs no interactive shell, prompt
+        scraping or per-command sleeps. Returns False if a command or the
+        commit failed.
+        """
+        commit = "commit" + (f" comment {_quote(comment)}" if comment else "")
+        # A failed set/delete exits before the commit, discarding the changes
+        lines = [_script_line(cmd) for cmd in cmds]
+        lines += [f"{commit} || builtin exit 1", "exit"]
+        payload = CONFIG_SCRIPT_HEADER + "\n".join(lines) + "\n"
+
+        # Any mutation makes the cached running config stale, including
+        # anything a concurrent read cached while the script ran
+        self._invalidate_caches()
+        channel = self.ssh_client.client.get_transport().open_session()
+        try:
+            channel.settimeout(timeout)
+            channel.exec_command("vbash -s")
+            channel.sendall(payload.encode("utf-8"))
+            channel.shutdown_write()
+            output = b"".join(iter(lambda: channel.recv(65536), b""))
+            status = channel.recv_exit_status()
+        finally:
+            channel.close()
+            self._invalidate_caches()
+
+        if status != 0:
+            message = output.decode("utf-8", errors="replace").strip()
+            logger.error(f"Config script failed ({status}): {message}")
+            return False
+        return True
+
+    def _memoized(self, name: str, lines: list[str], build: Callable[[], T]) -> T:
+        """Return the cached result for name if it was built from these lines"""
+        cached = self._parse_cache.get(name)
+        if cached is not None and cached[0] is lines:
+            return cached[1]
+        result = build()
+        self._parse_cache[name] = (lines, result)
+        return result
+
+    def _parsed(self, name: str, parse: Callable[[list[_ConfigEvent]], T],
+                section: tuple[str, ...] = ()) -> T:
+        """Run a config parser, memoized on the config lines it reads
+
+        The lines are tokenized once into walker events, shared by every
+        parser reading the same fetch (e.g. prefix-lists, route-maps and
+        community-lists all read the policy section). Results are shared
+        between calls and services for the same router, so callers must
+        treat them as read-only. Any mutation through _checkout_session() drops the memo
+        along with the config cache.
+        """
+        lines = self._get_config_lines(section)
+        events = self._memoized("events " + " ".join(section), lines,
+                                lambda: list(_iter_config(lines)))
+        return self._memoized(name, lines, lambda: parse(events))
+
+    def run_parallel(self, fns: list[Callable[[], T]], max_channels: int = 4) -> list[T]:
+        """Run independent service calls concurrently over the shared SSH transport
+
+        Every worker borrows its own pooled session (a separate channel on the
+        same connection), so e.g. several create_*_rule calls or the policy/BGP
+        getters overlap their round trips. Results come back in input order;
+        the first exception raised by a call is re-raised.
+        """
+        if len(fns) <= 1:
+            return [fn() for fn in fns]
+        with ThreadPoolExecutor(max_workers=min(max_channels, len(fns))) as executor:
+            return list(executor.map(lambda fn: fn(), fns))
 
     # === Firewall Configuration Methods ===
 
+    @staticmethod
+    def _firewall_rule_commands(direction: str, sequence: int, action: str,
+                                description: str | None = None,
+                                source_address: str | None = None,
+                                destination_address: str | None = None,
+                                protocol: str | None = None,
+                                source_port: int | None = None,
+                                destination_port: int | None = None,
+                                log: bool = False) -> list[str]:
+        """Build the set commands for a firewall rule"""
+        base = f"firewall name {direction} rule {sequence}"
+        values = {
+            "description": description,
+            "source_address": source_address,
+            "destination_address": destination_address,
+            "protocol": protocol,
+            "source_port": source_port,
+            "destination_port": destination_port,
+            "log": log,
+        }
+        cmds = [f"set {base} action {action}"]
+        cmds.extend(f"set {base} {tpl.format(v=_quote(values[name]))}"
+                    for name, tpl in _FIREWALL_RULE_FIELDS if values[name])
+        return cmds
+
     def create_firewall_rule(self, direction: str, sequence: int, action: str,
                           description: str | None = None,
                           source_address: str | None = None,
@@ -51,47 +705,78 @@ class VyOSConfigService:
                           protocol: str | None = None,
                           source_port: int | None = None,
                           destination_port: int | None = None,
-                          log: bool = False) -> bool:
+                          log: bool = False,
+                          session: VyOSConfigSession | None = None) -> bool:
         """Create a firewall rule - DIRECT & SIMPLE"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            base = f"firewall name {direction} rule {sequence}"
-            session._send_and_sleep(f"set {base} action {action}", 0.2)
-            if description:
-                session._send_and_sleep(f"set {base} description \"{description}\"", 0.2)
-            if source_address:
-                session._send_and_sleep(f"set {base} source address {source_address}", 0.2)
-            if destination_address:
-                session._send_and_sleep(f"set {base} destination address {destination_address}", 0.2)
-            if protocol:
-                session._send_and_sleep(f"set {base} protocol {protocol}", 0.2)
-            if source_port:
-                session._send_and_sleep(f"set {base} source port {source_port}", 0.2)
-            if destination_port:
-                session._send_and_sleep(f"set {base} destination port {destination_port}", 0.2)
-            if log:
-                session._send_and_sleep(f"set {base} log enable", 0.2)
-            result = session.commit(comment=f"Create firewall rule {sequence}")
-            return True
-        finally:
-            session.close()
+        cmds = self._firewall_rule_commands(
+            direction, sequence, action, description=description,
+            source_address=source_address, destination_address=destination_address,
+            protocol=protocol, source_port=source_port,
+            destination_port=destination_port, log=log)
+        return self._apply(cmds, f"Create firewall rule {sequence}", session)
+
+    def create_firewall_rules(self, rules: list[dict]) -> bool:
+        """Create several firewall rules with a single commit
+
+        Each dict takes the keyword arguments of create_firewall_rule.
+        """
+        cmds = []
+        for rule in rules:
+            cmds.extend(self._firewall_rule_commands(**rule))
+        return self._commit_in_session(cmds, f"Create {len(rules)} firewall rules")
 
-    def delete_firewall_rule(self, direction: str, sequence: int) -> bool:
+    def delete_firewall_rule(self, direction: str, sequence: int,
+                             session: VyOSConfigSession | None = None) -> bool:
         """Delete a firewall rule"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"delete firewall name {direction} rule {sequence}", 0.2)
-            session.commit(comment=f"Delete firewall rule {sequence}")
-            return True
-        finally:
-            session.close()
+        return self._apply([f"delete firewall name {direction} rule {sequence}"],
+                           f"Delete firewall rule {sequence}", session)
 
     # === NAT Configuration Methods ===
 
+    @staticmethod
+    def _nat_rule_commands(nat_type: str, sequence: int,
+                           source_address: str | None = None,
+                           source_port: str | None = None,
+                           destination_address: str | None = None,
+                           destination_port: str | None = None,
+                           inbound_interface: str | None = None,
+                           outbound_interface: str | None = None,
+                           translation_address: str | None = None,
+                           translation_port: str | None = None,
+                           protocol: str | None = None,
+                           description: str | None = None) -> list[str]:
+        """Build the set commands for a NAT rule"""
+        if nat_type == "masquerade":
+            base = f"nat source rule {sequence}"
+            cmds = [f"set {base} translation address masquerade"]
+            fields = _NAT_MASQ_FIELDS
+        elif nat_type == "source":
+            base = f"nat source rule {sequence}"
+            cmds = []
+            fields = _NAT_SOURCE_FIELDS
+        elif nat_type == "destination":
+            base = f"nat destination rule {sequence}"
+            cmds = []
+            fields = _NAT_DEST_FIELDS
+        else:
+            raise ValueError(f"Unsupported NAT type: {nat_type}")
+
+        values = {
+            "source_address": source_address,
+            "source_port": source_port,
+            "destination_address": destination_address,
+            "destination_port": destination_port,
+            "inbound_interface": inbound_interface,
+            "outbound_interface": outbound_interface,
+            "translation_address": translation_address,
+            "translation_port": translation_port,
+            "protocol": protocol,
+            "description": description,
+        }
+        cmds.extend(f"set {base} {tpl.format(v=_quote(values[name]))}"
+                    for name, tpl in fields if values[name])
+        return cmds
+
     def create_nat_rule(self, nat_type: str, sequence: int,
                      source_address: str | None = None,
                      source_port: str | None = None,
@@ -102,598 +787,196 @@ class VyOSConfigService:
                      translation_address: str | None = None,
                      translation_port: str | None = None,
                      protocol: str | None = None,
-                     description: str | None = None) -> bool:
+                     description: str | None = None,
+                     session: VyOSConfigSession | None = None) -> bool:
         """Create a NAT rule - DIRECT & SIMPLE"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            if nat_type == "masquerade":
-                base = f"nat source rule {sequence}"
-                if outbound_interface:
-                    session._send_and_sleep(f"set {base} outbound-interface {outbound_interface}", 0.2)
-                session._send_and_sleep(f"set {base} translation address masquerade", 0.2)
-                if source_address:
-                    session._send_and_sleep(f"set {base} source address {source_address}", 0.2)
-                if source_port:
-                    session._send_and_sleep(f"set {base} source port {source_port}", 0.2)
-                if destination_address:
-                    session._send_and_sleep(f"set {base} destination address {destination_address}", 0.2)
-                if destination_port:
-                    session._send_and_sleep(f"set {base} destination port {destination_port}", 0.2)
-                if protocol:
-                    session._send_and_sleep(f"set {base} protocol {protocol}", 0.2)
-                if description:
-                    session._send_and_sleep(f"set {base} description \"{description}\"", 0.2)
-                session.commit(comment=f"Create NAT masquerade rule {sequence}")
-                return True
-
-            elif nat_type == "source":
-                base = f"nat source rule {sequence}"
-                if description:
-                    session._send_and_sleep(f"set {base} description \"{description}\"", 0.2)
-                if outbound_interface:
-                    session._send_and_sleep(f"set {base} outbound-interface {outbound_interface}", 0.2)
-                if source_address:
-                    session._send_and_sleep(f"set {base} source address {source_address}", 0.2)
-                if source_port:
-                    session._send_and_sleep(f"set {base} source port {source_port}", 0.2)
-                if destination_address:
-                    session._send_and_sleep(f"set {base} destination address {destination_address}", 0.2)
-                if destination_port:
-                    session._send_and_sleep(f"set {base} destination port {destination_port}", 0.2)
-                if translation_address:
-                    session._send_and_sleep(f"set {base} translation address {translation_address}", 0.2)
-                if translation_port:
-                    session._send_and_sleep(f"set {base} translation port {translation_port}", 0.2)
-                if protocol:
-                    session._send_and_sleep(f"set {base} protocol {protocol}", 0.2)
-                session.commit(comment=f"Create NAT source rule {sequence}")
-                return True
-
-            elif nat_type == "destination":
-                base = f"nat destination rule {sequence}"
-                if description:
-                    session._send_and_sleep(f"set {base} description \"{description}\"", 0.2)
-                if inbound_interface:
-                    session._send_and_sleep(f"set {base} inbound-interface {inbound_interface}", 0.2)
-                if source_address:
-                    session._send_and_sleep(f"set {base} source address {source_address}", 0.2)
-                if source_port:
-                    session._send_and_sleep(f"set {base} source port {source_port}", 0.2)
-                if destination_address:
-                    session._send_and_sleep(f"set {base} destination address {destination_address}", 0.2)
-                if destination_port:
-                    session._send_and_sleep(f"set {base} destination port {destination_port}", 0.2)
-                if translation_address:
-                    session._send_and_sleep(f"set {base} translation address {translation_address}", 0.2)
-                if translation_port:
-                    session._send_and_sleep(f"set {base} translation port {translation_port}", 0.2)
-                if protocol:
-                    session._send_and_sleep(f"set {base} protocol {protocol}", 0.2)
-                session.commit(comment=f"Create NAT destination rule {sequence}")
-                return True
-
-            else:
-                raise ValueError(f"Unsupported NAT type: {nat_type}")
-        finally:
-            session.close()
+        cmds = self._nat_rule_commands(
+            nat_type, sequence, source_address=source_address, source_port=source_port,
+            destination_address=destination_address, destination_port=destination_port,
+            inbound_interface=inbound_interface, outbound_interface=outbound_interface,
+            translation_address=translation_address, translation_port=translation_port,
+            protocol=protocol, description=description)
+        return self._apply(cmds, f"Create NAT {nat_type} rule {sequence}", session)
+
+    def create_nat_rules(self, rules: list[dict]) -> bool:
+        """Create several NAT rules with a single commit
+
+        Each dict takes the keyword arguments of create_nat_rule.
+        """
+        cmds = []
+        for rule in rules:
+            cmds.extend(self._nat_rule_commands(**rule))
+        return self._commit_in_session(cmds, f"Create {len(rules)} NAT rules")
 
-    def delete_nat_rule(self, nat_type: str, sequence: int) -> bool:
+    def delete_nat_rule(self, nat_type: str, sequence: int,
+                        session: VyOSConfigSession | None = None) -> bool:
         """Delete a NAT rule"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            if nat_type == "source" or nat_type == "masquerade":
-                session._send_and_sleep(f"delete nat source rule {sequence}", 0.2)
-                session.commit(comment=f"Delete NAT rule {sequence}")
-                return True
-            elif nat_type == "destination":
-                session._send_and_sleep(f"delete nat destination rule {sequence}", 0.2)
-                session.commit(comment=f"Delete NAT rule {sequence}")
-                return True
-            else:
-                raise ValueError(f"Unsupported NAT type: {nat_type}")
-        finally:
-            session.close()
+        if nat_type == "source" or nat_type == "masquerade":
+            cmd = f"delete nat source rule {sequence}"
+        elif nat_type == "destination":
+            cmd = f"delete nat destination rule {sequence}"
+        else:
+            raise ValueError(f"Unsupported NAT type: {nat_type}")
+        return self._apply([cmd], f"Delete NAT rule {sequence}", session)
 
     # === Policy Configuration Methods ===
 
     def get_prefix_lists(self) -> list:
         """Get all prefix-lists from VyOS"""
-        stdin, stdout, stderr = self.ssh_client.client.exec_command("/bin/cli-shell-api showCfg")
-        config_text = stdout.read().decode("utf-8", errors="replace")
+        return self._parsed('prefix_lists', self._parse_prefix_lists, ('policy',))
 
-        prefix_lists = []
-        lines = config_text.split('\n')
-        in_policy = False
-        policy_brace_depth = 0
-        in_prefix_list = False
-        current_pl = None
-        pl_brace_depth = 0
-        in_pl_rule = False
-        current_rule = None
-        rule_brace_depth = 0
-
-        for line in lines:
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-
-            if line_stripped == 'policy {':
-                in_policy = True
-                policy_brace_depth = 1
-                continue
+    @staticmethod
+    def _parse_prefix_lists(config_events: list[_ConfigEvent]) -> list:
 
-            if in_policy:
-                policy_brace_depth += line.count('{') - line.count('}')
-                if policy_brace_depth <= 0:
-                    in_policy = False
-                    break
-
-            if not in_policy:
+        prefix_lists = []
+        for path, key, value in _select_config(config_events, ('policy', 'prefix-list')):
+            if path == ('policy',) and key == 'prefix-list':
+                prefix_lists.append({'name': value, 'rules': []})
+            elif path[:2] != ('policy', 'prefix-list'):
                 continue
-
-            # Parse prefix-list start
-            if not in_prefix_list and 'prefix-list' in line_stripped and '{' in line_stripped:
-                match = re.search(r'prefix-list\s+([^\s{]+)', line_stripped)
-                if match:
-                    current_pl = {'name': match.group(1), 'rules': []}
-                    in_prefix_list = True
-                    pl_brace_depth = 1
-                    continue
-
-            if in_prefix_list and current_pl:
-                pl_brace_depth += line.count('{') - line.count('}')
-                if pl_brace_depth <= 0:
-                    prefix_lists.append(current_pl)
-                    current_pl = None
-                    in_prefix_list = False
-                    continue
-
-                # Parse rule
-                if not in_pl_rule and 'rule' in line_stripped and '{' in line_stripped:
-                    match = re.search(r'rule\s+(\d+)', line_stripped)
-                    if match:
-                        current_rule = {'sequence': int(match.group(1))}
-                        in_pl_rule = True
-                        rule_brace_depth = 1
-                        continue
-
-                if in_pl_rule and current_rule:
-                    rule_brace_depth += line.count('{') - line.count('}')
-                    if rule_brace_depth <= 0:
-                        current_pl['rules'].append(current_rule)
-                        current_rule = None
-                        in_pl_rule = False
-                        continue
-
-                    if 'action' in line_stripped:
-                        match = re.search(r'action\s+(\w+)', line_stripped)
-                        if match:
-                            current_rule['action'] = match.group(1)
-                    if 'prefix' in line_stripped and 'prefix-list' not in line_stripped:
-                        match = re.search(r'prefix\s+([^\s]+)', line_stripped)
-                        if match:
-                            current_rule['prefix'] = match.group(1)
-                    if 'ge' in line_stripped:
-                        match = re.search(r'ge\s+(\d+)', line_stripped)
-                        if match:
-                            current_rule['ge'] = int(match.group(1))
-                    if 'le' in line_stripped:
-                        match = re.search(r'le\s+(\d+)', line_stripped)
-                        if match:
-                            current_rule['le'] = int(match.group(1))
+            elif len(path) == 3 and key == 'rule':
+                prefix_lists[-1]['rules'].append({'sequence': int(value)})
+            elif len(path) == 5 and path[3] == 'rule':
+                rule = prefix_lists[-1]['rules'][-1]
+                if key in ('action', 'prefix'):
+                    rule[key] = value
+                elif key in ('ge', 'le'):
+                    rule[key] = int(value)
 
         return prefix_lists
 
     def create_prefix_list(self, name: str) -> bool:
         """Create an empty prefix-list"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            # Just creating a rule will create the prefix-list
-            session._send_and_sleep(f"set policy prefix-list {name} rule 10 action permit", 0.3)
-            session._send_and_sleep(f"delete policy prefix-list {name} rule 10", 0.3)
-            session.commit(comment=f"Create prefix-list {name}")
-            return True
-        finally:
-            session.close()
+        return self._commit_in_session([f"set policy prefix-list {name}"],
+                                       f"Create prefix-list {name}")
 
     def delete_prefix_list(self, name: str) -> bool:
         """Delete a prefix-list"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"delete policy prefix-list {name}", 0.3)
-            session.commit(comment=f"Delete prefix-list {name}")
-            return True
-        finally:
-            session.close()
+        return self._commit_in_session([f"delete policy prefix-list {name}"],
+                                       f"Delete prefix-list {name}")
 
     def add_prefix_list_rule(self, name: str, sequence: int, action: str,
                            prefix: str, ge: int | None = None, le: int | None = None) -> bool:
         """Add a rule to a prefix-list"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            base = f"policy prefix-list {name} rule {sequence}"
-            session._send_and_sleep(f"set {base} action {action}", 0.2)
-            session._send_and_sleep(f"set {base} prefix {prefix}", 0.2)
-            if ge:
-                session._send_and_sleep(f"set {base} ge {ge}", 0.2)
-            if le:
-                session._send_and_sleep(f"set {base} le {le}", 0.2)
-            session.commit(comment=f"Add prefix-list {name} rule {sequence}")
-            return True
-        finally:
-            session.close()
+        base = f"policy prefix-list {name} rule {sequence}"
+        cmds = [f"set {base} action {action}", f"set {base} prefix {prefix}"]
+        if ge:
+            cmds.append(f"set {base} ge {ge}")
+        if le:
+            cmds.append(f"set {base} le {le}")
+        return self._commit_in_session(cmds, f"Add prefix-list {name} rule {sequence}")
 
     def delete_prefix_list_rule(self, name: str, sequence: int) -> bool:
         """Delete a rule from a prefix-list"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"delete policy prefix-list {name} rule {sequence}", 0.3)
-            session.commit(comment=f"Delete prefix-list {name} rule {sequence}")
-            return True
-        finally:
-            session.close()
+        return self._commit_in_session([f"delete policy prefix-list {name} rule {sequence}"],
+                                       f"Delete prefix-list {name} rule {sequence}")
 
     def get_route_maps(self) -> list:
         """Get all route-maps from VyOS"""
-        stdin, stdout, stderr = self.ssh_client.client.exec_command("/bin/cli-shell-api showCfg")
-        config_text = stdout.read().decode("utf-8", errors="replace")
-
-        route_maps = []
-        lines = config_text.split('\n')
-        in_policy = False
-        policy_brace_depth = 0
-        in_route_map = False
-        current_rm = None
-        rm_brace_depth = 0
-        in_rm_rule = False
-        current_rule = None
-        rule_brace_depth = 0
-
-        for line in lines:
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-
-            if line_stripped == 'policy {':
-                in_policy = True
-                policy_brace_depth = 1
-                continue
+        return self._parsed('route_maps', self._parse_route_maps, ('policy',))
 
-            if in_policy:
-                policy_brace_depth += line.count('{') - line.count('}')
-                if policy_brace_depth <= 0:
-                    in_policy = False
-                    break
+    @staticmethod
+    def _parse_route_maps(config_events: list[_ConfigEvent]) -> list:
 
-            if not in_policy:
+        route_maps = []
+        for path, key, value in _select_config(config_events, ('policy', 'route-map')):
+            if path == ('policy',) and key == 'route-map':
+                route_maps.append({'name': value, 'rules': []})
+            elif path[:2] != ('policy', 'route-map'):
                 continue
-
-            # Parse route-map start
-            if not in_route_map and 'route-map' in line_stripped and '{' in line_stripped:
-                match = re.search(r'route-map\s+([^\s{]+)', line_stripped)
-                if match:
-                    current_rm = {'name': match.group(1), 'rules': []}
-                    in_route_map = True
-                    rm_brace_depth = 1
-                    continue
-
-            if in_route_map and current_rm:
-                rm_brace_depth += line.count('{') - line.count('}')
-                if rm_brace_depth <= 0:
-                    route_maps.append(current_rm)
-                    current_rm = None
-                    in_route_map = False
-                    continue
-
-                # Parse rule
-                if not in_rm_rule and 'rule' in line_stripped and '{' in line_stripped:
-                    match = re.search(r'rule\s+(\d+)', line_stripped)
-                    if match:
-                        current_rule = {'sequence': int(match.group(1))}
-                        in_rm_rule = True
-                        rule_brace_depth = 1
-                        continue
-
-                if in_rm_rule and current_rule:
-                    rule_brace_depth += line.count('{') - line.count('}')
-                    if rule_brace_depth <= 0:
-                        current_rm['rules'].append(current_rule)
-                        current_rule = None
-                        in_rm_rule = False
-                        continue
-
-                    if 'action' in line_stripped:
-                        match = re.search(r'action\s+(\w+)', line_stripped)
-                        if match:
-                            current_rule['action'] = match.group(1)
+            elif len(path) == 3 and key == 'rule':
+                route_maps[-1]['rules'].append({'sequence': int(value)})
+            elif len(path) == 5 and path[3] == 'rule' and key == 'action':
+                route_maps[-1]['rules'][-1]['action'] = value
 
         return route_maps
 
     def create_route_map(self, name: str) -> bool:
         """Create an empty route-map"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"set policy route-map {name} rule 10 action permit", 0.3)
-            session._send_and_sleep(f"delete policy route-map {name} rule 10", 0.3)
-            session.commit(comment=f"Create route-map {name}")
-            return True
-        finally:
-            session.close()
+        return self._commit_in_session([f"set policy route-map {name}"],
+                                       f"Create route-map {name}")
 
     def delete_route_map(self, name: str) -> bool:
         """Delete a route-map"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"delete policy route-map {name}", 0.3)
-            session.commit(comment=f"Delete route-map {name}")
-            return True
-        finally:
-            session.close()
+        return self._commit_in_session([f"delete policy route-map {name}"],
+                                       f"Delete route-map {name}")
 
     # === BGP Configuration Methods ===
 
     def get_bgp_config(self) -> dict:
         """Get BGP configuration from VyOS - with all features"""
-        stdin, stdout, stderr = self.ssh_client.client.exec_command("/bin/cli-shell-api showCfg")
-        config_text = stdout.read().decode("utf-8", errors="replace")
+        return self._parsed('bgp_config', self._parse_bgp_config, ('protocols', 'bgp'))
+
+    @staticmethod
+    def _parse_bgp_config(config_events: list[_ConfigEvent]) -> dict:
 
         local_as = None
         router_id = None
         keepalive = None
         holdtime = None
-        neighbors = []
+        neighbors_by_ip: dict[str, dict] = {}
         networks = []
 
-        # Find the protocols section first
-        lines = config_text.split('\n')
-        in_protocols = False
-        brace_depth = 0
-        protocols_content = []
-
-        for line in lines:
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-
-            if line_stripped == 'protocols {':
-                in_protocols = True
-                brace_depth = 1
-                continue
-
-            if in_protocols:
-                brace_depth += line.count('{') - line.count('}')
-                if brace_depth <= 0:
-                    break
-                protocols_content.append(line)
-
-        # Now parse the bgp section from protocols_content
-        in_bgp = False
-        bgp_brace_depth = 0
-        bgp_content = []
-
-        for line in protocols_content:
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-
-            if line_stripped == 'bgp {':
-                in_bgp = True
-                bgp_brace_depth = 1
-                continue
-
-            if in_bgp:
-                bgp_brace_depth += line.count('{') - line.count('}')
-                if bgp_brace_depth <= 0:
-                    break
-                bgp_content.append(line)
-
-        # Now parse bgp_content for all items
-        in_neighbor = False
-        current_neighbor = None
-        neighbor_brace_depth = 0
-        in_neighbor_af = False
-        neighbor_af_brace_depth = 0
-        in_neighbor_af_prefixlist = False
-        neighbor_af_pl_brace_depth = 0
-        in_bgp_af = False
-        bgp_af_brace_depth = 0
-        in_timers = False
-        timers_brace_depth = 0
-
-        for line in bgp_content:
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-
-            # Parse system-as
-            if 'system-as' in line_stripped and not in_neighbor and not in_bgp_af and not in_timers:
-                match = re.search(r'system-as\s+(\d+)', line_stripped)
-                if match:
-                    local_as = int(match.group(1))
-
-            # Parse timers
-            if not in_timers and 'timers' in line_stripped and '{' in line_stripped:
-                in_timers = True
-                timers_brace_depth = 1
+        for path, key, value in _select_config(config_events, ('protocols', 'bgp')):
+            if path[:2] != ('protocols', 'bgp'):
                 continue
-
-            if in_timers:
-                timers_brace_depth += line.count('{') - line.count('}')
-                if timers_brace_depth <= 0:
-                    in_timers = False
-                    continue
-                if 'keepalive' in line_stripped:
-                    match = re.search(r'keepalive\s+(\d+)', line_stripped)
-                    if match:
-                        keepalive = int(match.group(1))
-                if 'holdtime' in line_stripped:
-                    match = re.search(r'holdtime\s+(\d+)', line_stripped)
-                    if match:
-                        holdtime = int(match.group(1))
-
-            # Parse neighbor start
-            if not in_neighbor and not in_bgp_af and 'neighbor' in line_stripped and '{' in line_stripped:
-                match = re.search(r'neighbor\s+([^\s{]+)', line_stripped)
-                if match:
-                    current_neighbor = {
-                        'ip_address': match.group(1),
+            scope = path[2:]
+
+            if not scope:
+                if key == 'system-as':
+                    local_as = int(value)
+                elif key == 'neighbor':
+                    neighbors_by_ip[value] = {
+                        'ip_address': value,
                         'next_hop_self': False,
                         'prefix_list_in': None,
                         'prefix_list_out': None,
                         'route_map_in': None,
                         'route_map_out': None
                     }
-                    in_neighbor = True
-                    neighbor_brace_depth = 1
-                    continue
-
-            # Parse neighbor content
-            if in_neighbor and current_neighbor is not None:
-                neighbor_brace_depth += line.count('{') - line.count('}')
-
-                if neighbor_brace_depth <= 0:
-                    neighbors.append(current_neighbor)
-                    current_neighbor = None
-                    in_neighbor = False
-                    in_neighbor_af = False
-                    in_neighbor_af_prefixlist = False
-                    continue
-
-                # Parse neighbor address-family
-                if not in_neighbor_af and 'address-family' in line_stripped and '{' in line_stripped:
-                    in_neighbor_af = True
-                    neighbor_af_brace_depth = 1
-                    continue
-
-                if in_neighbor_af:
-                    neighbor_af_brace_depth += line.count('{') - line.count('}')
-                    if neighbor_af_brace_depth <= 0:
-                        in_neighbor_af = False
-                        in_neighbor_af_prefixlist = False
-                        continue
-
-                    # Check for prefix-list nested block
-                    if not in_neighbor_af_prefixlist and 'prefix-list' in line_stripped and '{' in line_stripped:
-                        in_neighbor_af_prefixlist = True
-                        neighbor_af_pl_brace_depth = 1
-                        continue
-
-                    if in_neighbor_af_prefixlist:
-                        neighbor_af_pl_brace_depth += line.count('{') - line.count('}')
-                        if neighbor_af_pl_brace_depth <= 0:
-                            in_neighbor_af_prefixlist = False
-                            continue
-                        # Parse import/export inside prefix-list block
-                        if 'import' in line_stripped:
-                            match = re.search(r'import\s+([^\s]+)', line_stripped)
-                            if match:
-                                current_neighbor['prefix_list_in'] = match.group(1)
-                        if 'export' in line_stripped:
-                            match = re.search(r'export\s+([^\s]+)', line_stripped)
-                            if match:
-                                current_neighbor['prefix_list_out'] = match.group(1)
-                    else:
-                        # Parse next-hop-self directly in address-family
-                        if 'next-hop-self' in line_stripped:
-                            current_neighbor['next_hop_self'] = True
-                        # Parse route-map import/export
-                        if 'route-map' in line_stripped:
-                            if 'import' in line_stripped:
-                                match = re.search(r'import\s+([^\s]+)', line_stripped)
-                                if match:
-                                    current_neighbor['route_map_in'] = match.group(1)
-                            if 'export' in line_stripped:
-                                match = re.search(r'export\s+([^\s]+)', line_stripped)
-                                if match:
-                                    current_neighbor['route_map_out'] = match.group(1)
-
-                # Neighbor top-level options
-                if not in_neighbor_af:
-                    if 'remote-as' in line_stripped:
-                        match = re.search(r'remote-as\s+(\d+)', line_stripped)
-                        if match:
-                            current_neighbor['remote_as'] = int(match.group(1))
-                    if 'description' in line_stripped:
-                        match = re.search(r'description\s+[\'\"]?([^\'\"]+)[\'\"]?', line_stripped)
-                        if match:
-                            current_neighbor['description'] = match.group(1)
-                    if 'update-source' in line_stripped:
-                        match = re.search(r'update-source\s+[\'\"]?([^\'\"\s]+)[\'\"]?', line_stripped)
-                        if match:
-                            current_neighbor['update_source'] = match.group(1)
-                    if 'advertisement-interval' in line_stripped:
-                        match = re.search(r'advertisement-interval\s+(\d+)', line_stripped)
-                        if match:
-                            current_neighbor['advertisement_interval'] = int(match.group(1))
-                    if 'ebgp-multihop' in line_stripped:
-                        match = re.search(r'ebgp-multihop\s+(\d+)', line_stripped)
-                        if match:
-                            current_neighbor['ebgp_multihop'] = int(match.group(1))
-                    if 'password' in line_stripped:
-                        match = re.search(r'password\s+[\'\"]?([^\'\"]+)[\'\"]?', line_stripped)
-                        if match:
-                            current_neighbor['password'] = match.group(1)
-                    if 'next-hop-self' in line_stripped and not '{' in line_stripped:
-                        current_neighbor['next_hop_self'] = True
-
-            # Parse BGP global address-family
-            if not in_neighbor and not in_timers and not in_bgp_af and 'address-family' in line_stripped and '{' in line_stripped:
-                in_bgp_af = True
-                bgp_af_brace_depth = 1
-                continue
-
-            if in_bgp_af:
-                bgp_af_brace_depth += line.count('{') - line.count('}')
-                if bgp_af_brace_depth <= 0:
-                    in_bgp_af = False
-                    continue
-
-                if 'network' in line_stripped and '{' in line_stripped:
-                    match = re.search(r'network\s+([^\s{]+)', line_stripped)
-                    if match:
-                        networks.append(match.group(1))
+            elif scope == ('parameters',) and key == 'router-id':
+                router_id = value
+            elif scope == ('timers',):
+                if key == 'keepalive':
+                    keepalive = int(value)
+                elif key == 'holdtime':
+                    holdtime = int(value)
+            elif len(scope) == 2 and scope[0] == 'address-family' and key == 'network':
+                networks.append(value)
+            elif scope[0] == 'neighbor':
+                neighbor = neighbors_by_ip[scope[1]]
+                af_scope = scope[2:]
+                if key in ('next-hop-self', 'nexthop-self'):
+                    neighbor['next_hop_self'] = True
+                elif not af_scope:
+                    field = _BGP_NEIGHBOR_FIELDS.get(key)
+                    if field is not None:
+                        name, convert = field
+                        neighbor[name] = convert(value)
+                elif len(af_scope) == 3 and af_scope[0] == 'address-family':
+                    field = _BGP_NEIGHBOR_AF_FIELDS.get((af_scope[2], key))
+                    if field is not None:
+                        neighbor[field] = value
 
         return {
             'local_as': local_as,
             'router_id': router_id,
             'keepalive': keepalive,
             'holdtime': holdtime,
-            'neighbors': neighbors,
+            'neighbors': list(neighbors_by_ip.values()),
             'networks': networks
         }
 
     def set_bgp_global(self, local_as: int, router_id: str | None = None,
-                      keepalive: int | None = None, holdtime: int | None = None) -> bool:
+                      keepalive: int | None = None, holdtime: int | None = None,
+                      session: VyOSConfigSession | None = None) -> bool:
         """Set BGP global configuration - with timers"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"set protocols bgp system-as {local_as}", 0.3)
-            if keepalive:
-                session._send_and_sleep(f"set protocols bgp timers keepalive {keepalive}", 0.3)
-            if holdtime:
-                session._send_and_sleep(f"set protocols bgp timers holdtime {holdtime}", 0.3)
-            session.commit(comment=f"Set BGP global config: AS {local_as}")
-            return True
-        finally:
-            session.close()
+        cmds = [f"set protocols bgp system-as {local_as}"]
+        if keepalive:
+            cmds.append(f"set protocols bgp timers keepalive {keepalive}")
+        if holdtime:
+            cmds.append(f"set protocols bgp timers holdtime {holdtime}")
+        return self._apply(cmds, f"Set BGP global config: AS {local_as}", session)
 
     def add_bgp_neighbor(self, local_as: int, ip_address: str, remote_as: int,
                         description: str | None = None,
@@ -705,394 +988,194 @@ class VyOSConfigService:
                         prefix_list_in: str | None = None,
                         prefix_list_out: str | None = None,
                         route_map_in: str | None = None,
-                        route_map_out: str | None = None) -> bool:
+                        route_map_out: str | None = None,
+                        session: VyOSConfigSession | None = None) -> bool:
         """Add a BGP neighbor with all options"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            base = f"protocols bgp neighbor {ip_address}"
-            session._send_and_sleep(f"set {base} remote-as {remote_as}", 0.3)
-            if description:
-                session._send_and_sleep(f"set {base} description \"{description}\"", 0.3)
-            if update_source:
-                session._send_and_sleep(f"set {base} update-source {update_source}", 0.3)
-            if advertisement_interval:
-                session._send_and_sleep(f"set {base} advertisement-interval {advertisement_interval}", 0.3)
-            if ebgp_multihop:
-                session._send_and_sleep(f"set {base} ebgp-multihop {ebgp_multihop}", 0.3)
-            if password:
-                session._send_and_sleep(f"set {base} password \"{password}\"", 0.3)
-            # Try setting next-hop-self at neighbor level (not in address-family)
-            if next_hop_self:
-                session._send_and_sleep(f"set {base} next-hop-self", 0.3)
-            # Set route-maps at neighbor level
-            if route_map_in:
-                session._send_and_sleep(f"set {base} address-family ipv4-unicast route-map import {route_map_in}", 0.3)
-            if route_map_out:
-                session._send_and_sleep(f"set {base} address-family ipv4-unicast route-map export {route_map_out}", 0.3)
-
-            af_base = f"{base} address-family ipv4-unicast"
-            if prefix_list_in:
-                session._send_and_sleep(f"set {af_base} prefix-list import {prefix_list_in}", 0.3)
-            if prefix_list_out:
-                session._send_and_sleep(f"set {af_base} prefix-list export {prefix_list_out}", 0.3)
-
-            session.commit(comment=f"Add BGP neighbor {ip_address}")
+        cmds = []
+        base = f"protocols bgp neighbor {ip_address}"
+        cmds.append(f"set {base} remote-as {remote_as}")
+        if description:
+            cmds.append(f"set {base} description {_quote(description)}")
+        if update_source:
+            cmds.append(f"set {base} update-source {update_source}")
+        if advertisement_interval:
+            cmds.append(f"set {base} advertisement-interval {advertisement_interval}")
+        if ebgp_multihop:
+            cmds.append(f"set {base} ebgp-multihop {ebgp_multihop}")
+        if password:
+            cmds.append(f"set {base} password {_quote(password)}")
+        # Try setting next-hop-self at neighbor level (not in address-family)
+        if next_hop_self:
+            cmds.append(f"set {base} next-hop-self")
+        # Set route-maps at neighbor level
+        if route_map_in:
+            cmds.append(f"set {base} address-family ipv4-unicast route-map import {route_map_in}")
+        if route_map_out:
+            cmds.append(f"set {base} address-family ipv4-unicast route-map export {route_map_out}")
+
+        af_base = f"{base} address-family ipv4-unicast"
+        if prefix_list_in:
+            cmds.append(f"set {af_base} prefix-list import {prefix_list_in}")
+        if prefix_list_out:
+            cmds.append(f"set {af_base} prefix-list export {prefix_list_out}")
+        return self._apply(cmds, f"Add BGP neighbor {ip_address}", session)
+
+    def update_bgp_neighbor(self, ip_address: str, *,
+                            session: VyOSConfigSession | None = None, **kwargs) -> bool:
+        """Update a BGP neighbor, sending only fields that differ from the config"""
+        current = next((n for n in self.get_bgp_config()['neighbors']
+                        if n['ip_address'] == ip_address), {})
+        kwargs = _changed_values(current, kwargs)
+        if not kwargs:
             return True
-        finally:
-            session.close()
 
-    def update_bgp_neighbor(self, ip_address: str, **kwargs) -> bool:
-        """Update a BGP neighbor"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            base = f"protocols bgp neighbor {ip_address}"
-            af_base = f"{base} address-family ipv4-unicast"
-
-            if 'description' in kwargs:
-                if kwargs['description']:
-                    session._send_and_sleep(f"set {base} description \"{kwargs['description']}\"", 0.2)
-                else:
-                    session._send_and_sleep(f"delete {base} description", 0.2)
-            if 'update_source' in kwargs:
-                if kwargs['update_source']:
-                    session._send_and_sleep(f"set {base} update-source {kwargs['update_source']}", 0.2)
-                else:
-                    session._send_and_sleep(f"delete {base} update-source", 0.2)
-            if 'advertisement_interval' in kwargs:
-                if kwargs['advertisement_interval']:
-                    session._send_and_sleep(f"set {base} advertisement-interval {kwargs['advertisement_interval']}", 0.2)
-                else:
-                    session._send_and_sleep(f"delete {base} advertisement-interval", 0.2)
-            if 'ebgp_multihop' in kwargs:
-                if kwargs['ebgp_multihop']:
-                    session._send_and_sleep(f"set {base} ebgp-multihop {kwargs['ebgp_multihop']}", 0.2)
-                else:
-                    session._send_and_sleep(f"delete {base} ebgp-multihop", 0.2)
-            if 'password' in kwargs:
-                if kwargs['password']:
-                    session._send_and_sleep(f"set {base} password \"{kwargs['password']}\"", 0.2)
-                else:
-                    session._send_and_sleep(f"delete {base} password", 0.2)
-            if 'next_hop_self' in kwargs:
-                if kwargs['next_hop_self']:
-                    session._send_and_sleep(f"set {base} next-hop-self", 0.2)
-                else:
-                    session._send_and_sleep(f"delete {base} next-hop-self", 0.2)
-            if 'prefix_list_in' in kwargs:
-                if kwargs['prefix_list_in']:
-                    session._send_and_sleep(f"set {af_base} prefix-list import {kwargs['prefix_list_in']}", 0.2)
-                else:
-                    session._send_and_sleep(f"delete {af_base} prefix-list import", 0.2)
-            if 'prefix_list_out' in kwargs:
-                if kwargs['prefix_list_out']:
-                    session._send_and_sleep(f"set {af_base} prefix-list export {kwargs['prefix_list_out']}", 0.2)
-                else:
-                    session._send_and_sleep(f"delete {af_base} prefix-list export", 0.2)
-            if 'route_map_in' in kwargs:
-                if kwargs['route_map_in']:
-                    session._send_and_sleep(f"set {af_base} route-map import {kwargs['route_map_in']}", 0.2)
-                else:
-                    session._send_and_sleep(f"delete {af_base} route-map import", 0.2)
-            if 'route_map_out' in kwargs:
-                if kwargs['route_map_out']:
-                    session._send_and_sleep(f"set {af_base} route-map export {kwargs['route_map_out']}", 0.2)
-                else:
-                    session._send_and_sleep(f"delete {af_base} route-map export", 0.2)
-
-            session.commit(comment=f"Update BGP neighbor {ip_address}")
-            return True
-        finally:
-            session.close()
+        base = f"protocols bgp neighbor {ip_address}"
+        cmds = []
+        for name, node, template in _BGP_NEIGHBOR_UPDATE_FIELDS:
+            if name not in kwargs:
+                continue
+            value = kwargs[name]
+            if not value:
+                cmds.append(f"delete {base} {node}")
+            elif template is None:
+                cmds.append(f"set {base} {node}")
+            else:
+                cmds.append(f"set {base} {node} {template.format(v=_quote(value))}")
+        return self._apply(cmds, f"Update BGP neighbor {ip_address}", session)
 
     def delete_bgp_neighbor(self, local_as: int, ip_address: str) -> bool:
         """Delete a BGP neighbor"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"delete protocols bgp neighbor {ip_address}", 0.3)
-            session.commit(comment=f"Delete BGP neighbor {ip_address}")
-            return True
-        finally:
-            session.close()
+        return self._run_config_script([f"delete protocols bgp neighbor {ip_address}"],
+                                       f"Delete BGP neighbor {ip_address}")
 
     def add_bgp_network(self, local_as: int, network: str) -> bool:
         """Add a network to BGP"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"set protocols bgp address-family ipv4-unicast network {network}", 0.3)
-            session.commit(comment=f"Add BGP network {network}")
-            return True
-        finally:
-            session.close()
+        cmd = f"set protocols bgp address-family ipv4-unicast network {network}"
+        return self._run_config_script([cmd], f"Add BGP network {network}")
 
     def delete_bgp_network(self, local_as: int, network: str) -> bool:
         """Delete a network from BGP"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"delete protocols bgp address-family ipv4-unicast network {network}", 0.3)
-            session.commit(comment=f"Delete BGP network {network}")
-            return True
-        finally:
-            session.close()
+        cmd = f"delete protocols bgp address-family ipv4-unicast network {network}"
+        return self._run_config_script([cmd], f"Delete BGP network {network}")
 
     # === Community List Methods ===
 
     def get_community_lists(self) -> list:
         """Get all community-lists from VyOS"""
-        stdin, stdout, stderr = self.ssh_client.client.exec_command("/bin/cli-shell-api showCfg")
-        config_text = stdout.read().decode("utf-8", errors="replace")
+        return self._parsed('community_lists', self._parse_community_lists, ('policy',))
 
+    @staticmethod
+    def _parse_community_lists(config_events: list[_ConfigEvent]) -> list:
         community_lists = []
-        lines = config_text.split('\n')
-        in_policy = False
-        policy_brace_depth = 0
-        in_community_list = False
-        current_cl = None
-        cl_brace_depth = 0
-        in_cl_rule = False
-        current_rule = None
-        rule_brace_depth = 0
-
-        for line in lines:
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-
-            if line_stripped == 'policy {':
-                in_policy = True
-                policy_brace_depth = 1
-                continue
-
-            if in_policy:
-                policy_brace_depth += line.count('{') - line.count('}')
-                if policy_brace_depth <= 0:
-                    in_policy = False
-                    break
-
-            if not in_policy:
-                continue
-
-            # Parse community-list start
-            if not in_community_list and 'community-list' in line_stripped and '{' in line_stripped:
-                match = re.search(r'community-list\s+([^\s{]+)', line_stripped)
-                if match:
-                    current_cl = {'name': match.group(1), 'rules': []}
-                    in_community_list = True
-                    cl_brace_depth = 1
-                    continue
-
-            if in_community_list and current_cl:
-                cl_brace_depth += line.count('{') - line.count('}')
-                if cl_brace_depth <= 0:
-                    community_lists.append(current_cl)
-                    current_cl = None
-                    in_community_list = False
-                    continue
-
-                # Parse rule
-                if not in_cl_rule and 'rule' in line_stripped and '{' in line_stripped:
-                    match = re.search(r'rule\s+(\d+)', line_stripped)
-                    if match:
-                        current_rule = {'sequence': int(match.group(1))}
-                        in_cl_rule = True
-                        rule_brace_depth = 1
-                        continue
-
-                if in_cl_rule and current_rule:
-                    rule_brace_depth += line.count('{') - line.count('}')
-                    if rule_brace_depth <= 0:
-                        current_cl['rules'].append(current_rule)
-                        current_rule = None
-                        in_cl_rule = False
-                        continue
-
-                    if 'action' in line_stripped:
-                        match = re.search(r'action\s+(\w+)', line_stripped)
-                        if match:
-                            current_rule['action'] = match.group(1)
-                    if 'community' in line_stripped and '{' not in line_stripped:
-                        match = re.search(r'community\s+([^\s]+)', line_stripped)
-                        if match:
-                            current_rule['community'] = match.group(1)
-                    if 'description' in line_stripped:
-                        match = re.search(r'description\s+[\'\"]?([^\'\"]+)[\'\"]?', line_stripped)
-                        if match:
-                            current_rule['description'] = match.group(1)
+        for path, key, value in _select_config(config_events, ('policy', 'community-list')):
+            if path == ('policy',):
+                community_lists.append({'name': value, 'rules': []})
+            elif len(path) == 3 and key == 'rule':
+                community_lists[-1]['rules'].append({'sequence': int(value)})
+            elif len(path) == 5:
+                rule = community_lists[-1]['rules'][-1]
+                if key in ('action', 'description'):
+                    rule[key] = value
+                elif key in ('community', 'regex'):
+                    rule['community'] = value
 
         return community_lists
 
     def create_community_list(self, name: str, list_type: str = "standard") -> bool:
         """Create an empty community-list"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            # VyOS uses community-list without type parameter in this version
-            session._send_and_sleep(f"set policy community-list {name} rule 10 action permit", 0.3)
-            session._send_and_sleep(f"delete policy community-list {name} rule 10", 0.3)
-            session.commit(comment=f"Create community-list {name}")
-            return True
-        finally:
-            session.close()
+        # VyOS uses community-list without type parameter in this version.
+        # The placeholder rule only forces the node into existence; both
+        # edits land in the same commit.
+        return self._run_config_script([
+            f"set policy community-list {name} rule 10 action permit",
+            f"delete policy community-list {name} rule 10",
+        ], f"Create community-list {name}")
 
     def delete_community_list(self, name: str) -> bool:
         """Delete a community-list"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"delete policy community-list {name}", 0.3)
-            session.commit(comment=f"Delete community-list {name}")
-            return True
-        finally:
-            session.close()
+        return self._run_config_script([f"delete policy community-list {name}"],
+                                       f"Delete community-list {name}")
 
     def add_community_list_rule(self, name: str, sequence: int, action: str,
-                                  community: str, description: str | None = None) -> bool:
+                                  community: str, description: str | None = None,
+                                  session: VyOSConfigSession | None = None) -> bool:
         """Add a rule to a community-list"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            base = f"policy community-list {name} rule {sequence}"
-            session._send_and_sleep(f"set {base} action {action}", 0.2)
-            session._send_and_sleep(f"set {base} community {community}", 0.2)
-            if description:
-                session._send_and_sleep(f"set {base} description \"{description}\"", 0.2)
-            session.commit(comment=f"Add community-list {name} rule {sequence}")
-            return True
-        finally:
-            session.close()
+        cmds = []
+        base = f"policy community-list {name} rule {sequence}"
+        cmds.append(f"set {base} action {action}")
+        cmds.append(f"set {base} community {_quote(community)}")
+        if description:
+            cmds.append(f"set {base} description {_quote(description)}")
+        return self._apply(cmds, f"Add community-list {name} rule {sequence}", session)
 
     def delete_community_list_rule(self, name: str, sequence: int) -> bool:
         """Delete a rule from a community-list"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"delete policy community-list {name} rule {sequence}", 0.3)
-            session.commit(comment=f"Delete community-list {name} rule {sequence}")
-            return True
-        finally:
-            session.close()
+        return self._run_config_script([f"delete policy community-list {name} rule {sequence}"],
+                                       f"Delete community-list {name} rule {sequence}")
 
     # === Route Map Rule Methods ===
 
     def add_route_map_rule(self, name: str, sequence: int, action: str,
                            description: str | None = None,
                            match: dict | None = None,
-                           set: dict | None = None) -> bool:
+                           set: dict | None = None,
+                           session: VyOSConfigSession | None = None) -> bool:
         """Add a rule to a route-map"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            base = f"policy route-map {name} rule {sequence}"
-            session._send_and_sleep(f"set {base} action {action}", 0.2)
-            if description:
-                session._send_and_sleep(f"set {base} description \"{description}\"", 0.2)
-
-            # Add match conditions
-            if match:
-                if match.get('ip_address_prefix_list'):
-                    session._send_and_sleep(f"set {base} match ip address prefix-list {match['ip_address_prefix_list']}", 0.2)
-                if match.get('community'):
-                    session._send_and_sleep(f"set {base} match community {match['community']}", 0.2)
-                if match.get('local_preference'):
-                    session._send_and_sleep(f"set {base} match local-preference {match['local_preference']}", 0.2)
-                if match.get('metric'):
-                    session._send_and_sleep(f"set {base} match metric {match['metric']}", 0.2)
-
-            # Add set actions
-            if set:
-                if set.get('local_preference'):
-                    session._send_and_sleep(f"set {base} set local-preference {set['local_preference']}", 0.2)
-                if set.get('metric'):
-                    session._send_and_sleep(f"set {base} set metric {set['metric']}", 0.2)
-                if set.get('weight'):
-                    session._send_and_sleep(f"set {base} set weight {set['weight']}", 0.2)
-                if set.get('next_hop'):
-                    session._send_and_sleep(f"set {base} set ip next-hop {set['next_hop']}", 0.2)
-                if set.get('as_path_prepend'):
-                    for asn in set['as_path_prepend']:
-                        session._send_and_sleep(f"set {base} set as-path prepend {asn}", 0.2)
-                if set.get('community'):
-                    for comm in set['community']:
-                        session._send_and_sleep(f"set {base} set community {comm}", 0.2)
-
-            session.commit(comment=f"Add route-map {name} rule {sequence}")
-            return True
-        finally:
-            session.close()
+        cmds = []
+        base = f"policy route-map {name} rule {sequence}"
+        cmds.append(f"set {base} action {action}")
+        if description:
+            cmds.append(f"set {base} description {_quote(description)}")
+
+        # Add match conditions, then set actions; list values (as-path
+        # prepend, communities) emit one command per item
+        for options, fields in ((match, _ROUTE_MAP_MATCH_FIELDS), (set, _ROUTE_MAP_SET_FIELDS)):
+            if not options:
+                continue
+            for key, node in fields:
+                value = options.get(key)
+                if not value:
+                    continue
+                for item in (value if isinstance(value, list) else (value,)):
+                    cmds.append(f"set {base} {node} {_quote(item)}")
+        return self._apply(cmds, f"Add route-map {name} rule {sequence}", session)
 
     def delete_route_map_rule(self, name: str, sequence: int) -> bool:
         """Delete a rule from a route-map"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"delete policy route-map {name} rule {sequence}", 0.3)
-            session.commit(comment=f"Delete route-map {name} rule {sequence}")
-            return True
-        finally:
-            session.close()
+        return self._run_config_script([f"delete policy route-map {name} rule {sequence}"],
+                                       f"Delete route-map {name} rule {sequence}")
 
     def get_bgp_summary(self) -> dict:
         """Get BGP summary from 'show ip bgp summary'"""
         try:
-            # First get config to get local_as and router_id
-            config = self.get_bgp_config()
-            local_as = config.get('local_as')
-            router_id = config.get('router_id')
-
-            # Try to run show command, but if not available return mock data
-            try:
-                output = self.ssh_client.run_command("show ip bgp summary")
-                # Parse output if we have it
-                # For now, return structure with config data and empty peers
-                peers = []
-                for neighbor in config.get('neighbors', []):
-                    peers.append({
-                        'neighbor': neighbor.get('ip_address'),
-                        'as': neighbor.get('remote_as'),
-                        'up_down': 'never',
-                        'state': 'Idle',
-                        'prefix_received': 0,
-                        'prefix_sent': 0
-                    })
+            result = VyOSCommandExecutor(self.ssh_client).execute_show("show ip bgp summary")
+            if result.status.value == "success" and result.stdout:
+                summary = self._parse_bgp_summary(result.stdout)
+                if summary['local_as'] is not None:
+                    return summary
+        except Exception as e:
+            logger.debug(f"show ip bgp summary failed, using config: {e}")
 
-                return {
-                    'local_as': local_as,
-                    'router_id': router_id,
-                    'peers': peers
-                }
-            except Exception:
-                # If command fails, return mock data based on config
-                peers = []
-                for neighbor in config.get('neighbors', []):
-                    peers.append({
-                        'neighbor': neighbor.get('ip_address'),
-                        'as': neighbor.get('remote_as'),
-                        'up_down': 'never',
-                        'state': 'Idle',
-                        'prefix_received': 0,
-                        'prefix_sent': 0
-                    })
+        try:
+            # BGP not running or the show command failed: list the configured
+            # neighbors as idle peers
+            config = self.get_bgp_config()
+            peers = []
+            for neighbor in config.get('neighbors', []):
+                peers.append({
+                    'neighbor': neighbor.get('ip_address'),
+                    'as': neighbor.get('remote_as'),
+                    'up_down': 'never',
+                    'state': 'Idle',
+                    'prefix_received': 0,
+                    'prefix_sent': 0
+                })
 
-                return {
-                    'local_as': local_as,
-                    'router_id': router_id,
-                    'peers': peers
-                }
+            return {
+                'local_as': config.get('local_as'),
+                'router_id': config.get('router_id'),
+                'peers': peers
+            }
         except Exception as e:
             # Fallback to empty data
             return {
@@ -1101,13 +1184,47 @@ class VyOSConfigService:
                 'peers': []
             }
 
+    @staticmethod
+    def _parse_bgp_summary(output: str) -> dict:
+        """Parse FRR 'show ip bgp summary' output into local AS, router-id and peers"""
+        local_as = None
+        router_id = None
+        peers = {}
+
+        header = _BGP_SUMMARY_HEADER_RE.search(output)
+        if header:
+            router_id = header.group(1)
+            local_as = int(header.group(2))
+
+        for match in _BGP_SUMMARY_PEER_RE.finditer(output):
+            neighbor, asn, up_down, state_pfx, pfx_sent = match.groups()
+            if neighbor in peers:
+                # Same peer listed again under another address family
+                continue
+            established = state_pfx.isdigit()
+            peers[neighbor] = {
+                'neighbor': neighbor,
+                'as': int(asn),
+                'up_down': up_down,
+                'state': 'Established' if established else state_pfx,
+                'prefix_received': int(state_pfx) if established else 0,
+                'prefix_sent': int(pfx_sent) if pfx_sent else 0
+            }
+
+        return {
+            'local_as': local_as,
+            'router_id': router_id,
+            'peers': list(peers.values())
+        }
+
     # === IS-IS Configuration Methods ===
 
     def get_isis_config(self) -> dict:
         """Get IS-IS configuration from VyOS"""
-        stdin, stdout, stderr = self.ssh_client.client.exec_command("/bin/cli-shell-api showCfg")
-        config_text = stdout.read().decode("utf-8", errors="replace")
+        return self._parsed('isis_config', self._parse_isis_config, ('protocols', 'isis'))
 
+    @staticmethod
+    def _parse_isis_config(config_events: list[_ConfigEvent]) -> dict:
         result = {
             'net': None,
             'level': None,
@@ -1121,97 +1238,17 @@ class VyOSConfigService:
             'redistribute': []
         }
 
-        # Find the protocols section first
-        lines = config_text.split('\n')
-        in_protocols = False
-        brace_depth = 0
-        protocols_content = []
-
-        for line in lines:
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-
-            if line_stripped == 'protocols {':
-                in_protocols = True
-                brace_depth = 1
-                continue
-
-            if in_protocols:
-                brace_depth += line.count('{') - line.count('}')
-                if brace_depth <= 0:
-                    break
-                protocols_content.append(line)
-
-        # Now parse the isis section from protocols_content
-        in_isis = False
-        isis_brace_depth = 0
-        isis_content = []
-
-        for line in protocols_content:
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-
-            if line_stripped == 'isis {':
-                in_isis = True
-                isis_brace_depth = 1
+        interfaces = result['interfaces']
+        redistribute = result['redistribute']
+        for path, key, value in _select_config(config_events, ('protocols', 'isis')):
+            if path[:2] != ('protocols', 'isis'):
                 continue
+            scope = path[2:]
 
-            if in_isis:
-                isis_brace_depth += line.count('{') - line.count('}')
-                if isis_brace_depth <= 0:
-                    break
-                isis_content.append(line)
-
-        # Now parse isis_content for all items
-        in_interface = False
-        current_interface = None
-        iface_brace_depth = 0
-
-        for line in isis_content:
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-
-            # Parse NET
-            if 'net' in line_stripped and not in_interface:
-                match = re.search(r'net\s+[\'\"]?([^\'\"]+)[\'\"]?', line_stripped)
-                if match:
-                    result['net'] = match.group(1)
-
-            # Parse level
-            elif 'level' in line_stripped and not in_interface:
-                match = re.search(r'level\s+(\S+)', line_stripped)
-                if match:
-                    result['level'] = match.group(1)
-
-            # Parse metric-style
-            elif 'metric-style' in line_stripped and not in_interface:
-                match = re.search(r'metric-style\s+(\S+)', line_stripped)
-                if match:
-                    result['metric_style'] = match.group(1)
-
-            # Parse purge-originator
-            elif 'purge-originator' in line_stripped and not in_interface and '{' not in line_stripped:
-                result['purge_originator'] = True
-
-            # Parse set-overload-bit
-            elif 'set-overload-bit' in line_stripped and not in_interface and '{' not in line_stripped:
-                result['set_overload_bit'] = True
-
-            # Parse spf-interval
-            elif 'spf-interval' in line_stripped and not in_interface:
-                match = re.search(r'spf-interval\s+(\d+)', line_stripped)
-                if match:
-                    result['spf_interval'] = int(match.group(1))
-
-            # Parse interface start
-            elif 'interface' in line_stripped and '{' in line_stripped:
-                match = re.search(r'interface\s+([^\s{]+)', line_stripped)
-                if match:
-                    current_interface = {
-                        'name': match.group(1),
+            if not scope:
+                if key == 'interface':
+                    interfaces.append({
+                        'name': value,
                         'circuit_type': None,
                         'hello_interval': None,
                         'hello_multiplier': None,
@@ -1220,150 +1257,85 @@ class VyOSConfigService:
                         'password': None,
                         'priority': None,
                         'ldp_sync_disable': False
-                    }
-                    in_interface = True
-                    iface_brace_depth = 1
-                    continue
-
-            # Parse interface content
-            elif in_interface and current_interface is not None:
-                iface_brace_depth += line.count('{') - line.count('}')
+                    })
+                elif key in _ISIS_FIELDS:
+                    name, convert = _ISIS_FIELDS[key]
+                    result[name] = convert(value)
+            elif scope == ('ldp-sync',) and key == 'holddown':
+                result['ldp_sync_holddown'] = int(value)
+            elif scope[0] == 'interface':
+                interface = interfaces[-1]
+                if len(scope) == 2:
+                    if key in _ISIS_INTERFACE_FIELDS:
+                        name, convert = _ISIS_INTERFACE_FIELDS[key]
+                        interface[name] = convert(value)
+                elif scope[2:] == ('password',):
+                    interface['password'] = value
+                elif scope[2:] == ('ldp-sync',) and key == 'disable':
+                    interface['ldp_sync_disable'] = True
+            elif scope[:2] == ('redistribute', 'ipv4'):
+                # redistribute ipv4 <source> <level> [route-map <name>]
+                if len(scope) == 3:
+                    redistribute.append({'source': scope[2], 'level': key, 'route_map': None})
+                elif len(scope) == 4 and key == 'route-map':
+                    redistribute[-1]['route_map'] = value
 
-                if iface_brace_depth <= 0:
-                    result['interfaces'].append(current_interface)
-                    current_interface = None
-                    in_interface = False
-                    continue
+        return result
 
-                if 'circuit-type' in line_stripped:
-                    match = re.search(r'circuit-type\s+(\S+)', line_stripped)
-                    if match:
-                        current_interface['circuit_type'] = match.group(1)
-                elif 'hello-interval' in line_stripped:
-                    match = re.search(r'hello-interval\s+(\d+)', line_stripped)
-                    if match:
-                        current_interface['hello_interval'] = int(match.group(1))
-                elif 'hello-multiplier' in line_stripped:
-                    match = re.search(r'hello-multiplier\s+(\d+)', line_stripped)
-                    if match:
-                        current_interface['hello_multiplier'] = int(match.group(1))
-                elif 'metric' in line_stripped and 'hello' not in line_stripped and '{' not in line_stripped:
-                    match = re.search(r'metric\s+(\d+)', line_stripped)
-                    if match:
-                        current_interface['metric'] = int(match.group(1))
-                elif 'passive' in line_stripped and '{' not in line_stripped:
-                    current_interface['passive'] = True
-                elif 'priority' in line_stripped:
-                    match = re.search(r'priority\s+(\d+)', line_stripped)
-                    if match:
-                        current_interface['priority'] = int(match.group(1))
-
-            # Parse redistribute
-            elif 'redistribute' in line_stripped and not in_interface:
-                match = re.search(r'redistribute\s+ipv4\s+(\S+)\s+(\S+)', line_stripped)
-                if match:
-                    source = match.group(1)
-                    level = match.group(2)
-                    route_map = None
-                    rm_match = re.search(r'route-map\s+[\'\"]?([^\'\"]+)[\'\"]?', line_stripped)
-                    if rm_match:
-                        route_map = rm_match.group(1)
-                    # Check if already exists
-                    exists = any(r['source'] == source and r['level'] == level for r in result['redistribute'])
-                    if not exists:
-                        result['redistribute'].append({
-                            'source': source,
-                            'level': level,
-                            'route_map': route_map
-                        })
+    @staticmethod
+    def _isis_global_commands(values: dict, current: dict | None = None) -> list[str]:
+        """Build delete/set commands for the given IS-IS global options
 
-        return result
+        With the current parsed config, a value node is only deleted before
+        being set when it already holds a value; without it, always.
+        """
+        cmds = []
+        for name, node, flag in _ISIS_GLOBAL_UPDATE_FIELDS:
+            if name not in values:
+                continue
+            value = values[name]
+            if flag:
+                cmds.append(f"{'set' if value else 'delete'} protocols isis {node}")
+                continue
+            if current is None or current.get(name) is not None:
+                cmds.append(f"delete protocols isis {node}")
+            if value:
+                cmds.append(f"set protocols isis {node} {_quote(value)}")
+        return cmds
 
-    def set_isis_net(self, net: str) -> bool:
+    def set_isis_net(self, net: str, session: VyOSConfigSession | None = None) -> bool:
         """Set IS-IS NET (Network Entity Title)"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            # Delete existing NET if any
-            session._send_and_sleep("delete protocols isis net", 0.2)
-            session._send_and_sleep(f"set protocols isis net {net}", 0.3)
-            result = session.commit(comment=f"Set IS-IS NET to {net}")
-            return result
-        finally:
-            session.close()
+        return self._apply(self._isis_global_commands({'net': net}),
+                           f"Set IS-IS NET to {net}", session)
 
-    def set_isis_level(self, level: str | None) -> bool:
+    def set_isis_level(self, level: str | None, session: VyOSConfigSession | None = None) -> bool:
         """Set IS-IS level (level-1, level-1-2, level-2-only)"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep("delete protocols isis level", 0.2)
-            if level:
-                session._send_and_sleep(f"set protocols isis level {level}", 0.3)
-            result = session.commit(comment=f"Set IS-IS level to {level}")
-            return result
-        finally:
-            session.close()
+        return self._apply(self._isis_global_commands({'level': level}),
+                           f"Set IS-IS level to {level}", session)
 
-    def set_isis_metric_style(self, style: str | None) -> bool:
+    def set_isis_metric_style(self, style: str | None,
+                              session: VyOSConfigSession | None = None) -> bool:
         """Set IS-IS metric style (narrow, transition, wide)"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep("delete protocols isis metric-style", 0.2)
-            if style:
-                session._send_and_sleep(f"set protocols isis metric-style {style}", 0.3)
-            result = session.commit(comment=f"Set IS-IS metric-style to {style}")
-            return result
-        finally:
-            session.close()
+        return self._apply(self._isis_global_commands({'metric_style': style}),
+                           f"Set IS-IS metric-style to {style}", session)
 
-    def set_isis_spf_interval(self, interval: int | None) -> bool:
+    def set_isis_spf_interval(self, interval: int | None,
+                              session: VyOSConfigSession | None = None) -> bool:
         """Set IS-IS SPF interval in seconds"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep("delete protocols isis spf-interval", 0.2)
-            if interval:
-                session._send_and_sleep(f"set protocols isis spf-interval {interval}", 0.3)
-            result = session.commit(comment=f"Set IS-IS SPF interval to {interval}")
-            return result
-        finally:
-            session.close()
+        return self._apply(self._isis_global_commands({'spf_interval': interval}),
+                           f"Set IS-IS SPF interval to {interval}", session)
 
-    def set_isis_purge_originator(self, enabled: bool) -> bool:
+    def set_isis_purge_originator(self, enabled: bool,
+                                  session: VyOSConfigSession | None = None) -> bool:
         """Set IS-IS purge-originator"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            if enabled:
-                session._send_and_sleep("set protocols isis purge-originator", 0.3)
-            else:
-                session._send_and_sleep("delete protocols isis purge-originator", 0.2)
-            result = session.commit(comment=f"Set IS-IS purge-originator to {enabled}")
-            return result
-        finally:
-            session.close()
+        return self._apply(self._isis_global_commands({'purge_originator': enabled}),
+                           f"Set IS-IS purge-originator to {enabled}", session)
 
-    def set_isis_overload_bit(self, enabled: bool) -> bool:
+    def set_isis_overload_bit(self, enabled: bool,
+                              session: VyOSConfigSession | None = None) -> bool:
         """Set IS-IS set-overload-bit"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            if enabled:
-                session._send_and_sleep("set protocols isis set-overload-bit", 0.3)
-            else:
-                session._send_and_sleep("delete protocols isis set-overload-bit", 0.2)
-            result = session.commit(comment=f"Set IS-IS overload-bit to {enabled}")
-            return result
-        finally:
-            session.close()
+        return self._apply(self._isis_global_commands({'set_overload_bit': enabled}),
+                           f"Set IS-IS overload-bit to {enabled}", session)
 
     def update_isis_global_config(self, net: str | None = None,
                                    level: str | None = None,
@@ -1371,174 +1343,105 @@ class VyOSConfigService:
                                    purge_originator: bool | None = None,
                                    set_overload_bit: bool | None = None,
                                    spf_interval: int | None = None) -> bool:
-        """Update multiple IS-IS global config options in single session (to avoid commit issues)"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            # Apply all config changes
-            if net is not None:
-                session._send_and_sleep("delete protocols isis net", 0.2)
-                if net:
-                    session._send_and_sleep(f"set protocols isis net {net}", 0.2)
-
-            if level is not None:
-                session._send_and_sleep("delete protocols isis level", 0.1)
-                if level:
-                    session._send_and_sleep(f"set protocols isis level {level}", 0.2)
-
-            if metric_style is not None:
-                session._send_and_sleep("delete protocols isis metric-style", 0.1)
-                if metric_style:
-                    session._send_and_sleep(f"set protocols isis metric-style {metric_style}", 0.2)
-
-            if purge_originator is not None:
-                if purge_originator:
-                    session._send_and_sleep("set protocols isis purge-originator", 0.2)
-                else:
-                    session._send_and_sleep("delete protocols isis purge-originator", 0.1)
-
-            if set_overload_bit is not None:
-                if set_overload_bit:
-                    session._send_and_sleep("set protocols isis set-overload-bit", 0.2)
-                else:
-                    session._send_and_sleep("delete protocols isis set-overload-bit", 0.1)
-
-            if spf_interval is not None:
-                session._send_and_sleep("delete protocols isis spf-interval", 0.1)
-                if spf_interval:
-                    session._send_and_sleep(f"set protocols isis spf-interval {spf_interval}", 0.2)
-
-            # Try to commit
-            result = session.commit(comment="Update IS-IS global config")
-            return result
-        finally:
-            session.close()
+        """Update multiple IS-IS global config options with a single commit
+
+        Options left as None, or already set to the given value, are not touched.
+        """
+        values = {
+            'net': net,
+            'level': level,
+            'metric_style': metric_style,
+            'purge_originator': purge_originator,
+            'set_overload_bit': set_overload_bit,
+            'spf_interval': spf_interval,
+        }
+        current = self.get_isis_config()
+        values = _changed_values(current, {k: v for k, v in values.items() if v is not None})
+        cmds = self._isis_global_commands(values, current)
+        if not cmds:
+            return True
+        return self._run_config_script(cmds, "Update IS-IS global config")
 
     def add_isis_interface(self, interface: str, circuit_type: str | None = None,
                           hello_interval: int | None = None,
                           hello_multiplier: int | None = None,
                           metric: int | None = None,
                           passive: bool = False,
-                          priority: int | None = None) -> bool:
+                          priority: int | None = None,
+                          session: VyOSConfigSession | None = None) -> bool:
         """Add an interface to IS-IS"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            base = f"protocols isis interface {interface}"
-            session._send_and_sleep(f"set {base}", 0.2)
-            if circuit_type:
-                session._send_and_sleep(f"set {base} circuit-type {circuit_type}", 0.2)
-            if hello_interval:
-                session._send_and_sleep(f"set {base} hello-interval {hello_interval}", 0.2)
-            if hello_multiplier:
-                session._send_and_sleep(f"set {base} hello-multiplier {hello_multiplier}", 0.2)
-            if metric:
-                session._send_and_sleep(f"set {base} metric {metric}", 0.2)
-            if passive:
-                session._send_and_sleep(f"set {base} passive", 0.2)
-            if priority:
-                session._send_and_sleep(f"set {base} priority {priority}", 0.2)
-            result = session.commit(comment=f"Add IS-IS interface {interface}")
-            return result
-        finally:
-            session.close()
+        values = {
+            'circuit_type': circuit_type,
+            'hello_interval': hello_interval,
+            'hello_multiplier': hello_multiplier,
+            'metric': metric,
+            'passive': passive,
+            'priority': priority,
+        }
+        base = f"protocols isis interface {interface}"
+        cmds = []
+        for node, (name, convert) in _ISIS_INTERFACE_FIELDS.items():
+            value = values[name]
+            if value:
+                cmds.append(f"set {base} {node}" if convert is _present
+                            else f"set {base} {node} {_quote(value)}")
+        # Setting any option creates the interface node; only a bare
+        # interface needs it set on its own
+        if not cmds:
+            cmds.append(f"set {base}")
+        return self._apply(cmds, f"Add IS-IS interface {interface}", session)
+
+    def update_isis_interface(self, interface: str, *,
+                              session: VyOSConfigSession | None = None, **kwargs) -> bool:
+        """Update an IS-IS interface, sending only fields that differ from the config"""
+        current = next((i for i in self.get_isis_config()['interfaces']
+                        if i['name'] == interface), {})
+        kwargs = _changed_values(current, kwargs)
+        if not kwargs:
+            return True
 
-    def update_isis_interface(self, interface: str, **kwargs) -> bool:
-        """Update an IS-IS interface"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            base = f"protocols isis interface {interface}"
-
-            if 'circuit_type' in kwargs:
-                session._send_and_sleep(f"delete {base} circuit-type", 0.1)
-                if kwargs['circuit_type']:
-                    session._send_and_sleep(f"set {base} circuit-type {kwargs['circuit_type']}", 0.2)
-            if 'hello_interval' in kwargs:
-                session._send_and_sleep(f"delete {base} hello-interval", 0.1)
-                if kwargs['hello_interval']:
-                    session._send_and_sleep(f"set {base} hello-interval {kwargs['hello_interval']}", 0.2)
-            if 'hello_multiplier' in kwargs:
-                session._send_and_sleep(f"delete {base} hello-multiplier", 0.1)
-                if kwargs['hello_multiplier']:
-                    session._send_and_sleep(f"set {base} hello-multiplier {kwargs['hello_multiplier']}", 0.2)
-            if 'metric' in kwargs:
-                session._send_and_sleep(f"delete {base} metric", 0.1)
-                if kwargs['metric']:
-                    session._send_and_sleep(f"set {base} metric {kwargs['metric']}", 0.2)
-            if 'passive' in kwargs:
-                session._send_and_sleep(f"delete {base} passive", 0.1)
-                if kwargs['passive']:
-                    session._send_and_sleep(f"set {base} passive", 0.2)
-            if 'priority' in kwargs:
-                session._send_and_sleep(f"delete {base} priority", 0.1)
-                if kwargs['priority']:
-                    session._send_and_sleep(f"set {base} priority {kwargs['priority']}", 0.2)
-
-            result = session.commit(comment=f"Update IS-IS interface {interface}")
-            return result
-        finally:
-            session.close()
+        base = f"protocols isis interface {interface}"
+        cmds = []
+        for node, (name, convert) in _ISIS_INTERFACE_FIELDS.items():
+            if name not in kwargs:
+                continue
+            if current.get(name):
+                cmds.append(f"delete {base} {node}")
+            value = kwargs[name]
+            if value:
+                cmds.append(f"set {base} {node}" if convert is _present
+                            else f"set {base} {node} {_quote(value)}")
+        return self._apply(cmds, f"Update IS-IS interface {interface}", session)
 
     def delete_isis_interface(self, interface: str) -> bool:
         """Remove an interface from IS-IS"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"delete protocols isis interface {interface}", 0.3)
-            result = session.commit(comment=f"Remove IS-IS interface {interface}")
-            return result
-        finally:
-            session.close()
+        return self._run_config_script([f"delete protocols isis interface {interface}"],
+                                       f"Remove IS-IS interface {interface}")
 
     def add_isis_redistribute(self, source: str, level: str, route_map: str | None = None) -> bool:
         """Add IS-IS route redistribution"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            cmd = f"set protocols isis redistribute ipv4 {source} {level}"
-            if route_map:
-                cmd += f" route-map {route_map}"
-            session._send_and_sleep(cmd, 0.3)
-            result = session.commit(comment=f"Add IS-IS redistribute {source} to {level}")
-            return result
-        finally:
-            session.close()
+        cmd = f"set protocols isis redistribute ipv4 {source} {level}"
+        if route_map:
+            cmd += f" route-map {route_map}"
+        return self._run_config_script([cmd], f"Add IS-IS redistribute {source} to {level}")
 
     def delete_isis_redistribute(self, source: str, level: str) -> bool:
         """Remove IS-IS route redistribution"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"delete protocols isis redistribute ipv4 {source} {level}", 0.3)
-            result = session.commit(comment=f"Remove IS-IS redistribute {source} from {level}")
-            return result
-        finally:
-            session.close()
+        cmd = f"delete protocols isis redistribute ipv4 {source} {level}"
+        return self._run_config_script([cmd], f"Remove IS-IS redistribute {source} from {level}")
 
     def disable_isis(self) -> bool:
         """Disable IS-IS completely"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep("delete protocols isis", 0.5)
-            result = session.commit(comment="Disable IS-IS")
-            return result
-        finally:
-            session.close()
+        return self._run_config_script(["delete protocols isis"], "Disable IS-IS")
 
-    def get_isis_status(self) -> dict:
-        """Get IS-IS status and overview"""
-        from app.services.vyos_command import VyOSCommandExecutor
+    def get_isis_status(self, config: dict | None = None) -> dict:
+        """Get IS-IS status and overview
 
-        config = self.get_isis_config()
+        Pass the result of get_isis_config() as config when the caller
+        already has it, to skip reading the configuration again.
+        """
+        if config is None:
+            config = self.get_isis_config()
         net = config.get('net')
         level = config.get('level')
         interfaces = config.get('interfaces', [])
@@ -1555,17 +1458,19 @@ class VyOSConfigService:
 
         try:
             executor = VyOSCommandExecutor(self.ssh_client)
+            # Both show commands run in one exec over a single channel
+            interface_result, database_result = executor.execute_show_many(
+                ["show isis interface", "show isis database"])
 
             # Get IS-IS interface status
             try:
-                result = executor.execute_show("show isis interface")
+                result = interface_result
                 if result.status.value == "success" and result.stdout:
                     status_data['interfaces_raw'] = result.stdout
                     # Parse the interface output
-                    lines = result.stdout.split('\n')
                     parsed_interfaces = []
                     header_found = False
-                    for line in lines:
+                    for line in result.stdout.splitlines():
                         line = line.strip()
                         if not line:
                             continue
@@ -1588,50 +1493,10 @@ class VyOSConfigService:
 
             # Get IS-IS database
             try:
-                result = executor.execute_show("show isis database")
+                result = database_result
                 if result.status.value == "success" and result.stdout:
                     status_data['database_raw'] = result.stdout
-                    # Parse LSP database
-                    lines = result.stdout.split('\n')
-                    lsps = []
-                    in_level1 = False
-                    in_level2 = False
-                    for line in lines:
-                        line = line.strip()
-                        if not line:
-                            continue
-                        if 'Level-1 link-state database' in line:
-                            in_level1 = True
-                            in_level2 = False
-                            continue
-                        if 'Level-2 link-state database' in line:
-                            in_level1 = False
-                            in_level2 = True
-                            continue
-                        if line.startswith('LSP ID'):
-                            continue
-                        if line.startswith('1 LSPs'):
-                            continue
-                        if line and (in_level1 or in_level2):
-                            parts = line.split()
-                            if len(parts) >= 6:
-                                # The * might be in parts[0] or parts[1] depending on spacing
-                                is_local = '*' in line
-                                # Find the actual LSP ID and other fields
-                                lsp_id = parts[0] if parts[0] != '*' else parts[1]
-                                # Adjust indices based on whether there's a *
-                                offset = 1 if parts[0] == '*' else 0
-                                lsps.append({
-                                    'lsp_id': lsp_id,
-                                    'local': is_local,
-                                    'pdu_len': parts[offset + 1],
-                                    'seq_number': parts[offset + 2],
-                                    'chksum': parts[offset + 3],
-                                    'holdtime': parts[offset + 4],
-                                    'flags': parts[offset + 5],
-                                    'level': 'level-1' if in_level1 else 'level-2'
-                                })
-                    status_data['database'] = lsps
+                    status_data['database'] = self._parse_isis_database(result.stdout)
             except Exception as e:
                 status_data['database_error'] = str(e)
 
@@ -1640,6 +1505,26 @@ class VyOSConfigService:
 
         return status_data
 
+    @staticmethod
+    def _parse_isis_database(output: str) -> list:
+        """Parse FRR 'show isis database' output into one dict per LSP"""
+        lsps = []
+        # [preamble, '1', level-1 rows, '2', level-2 rows]
+        sections = _ISIS_DB_LEVEL_RE.split(output)
+        for level, block in zip(sections[1::2], sections[2::2]):
+            lsps.extend({
+                'lsp_id': lsp_id,
+                'local': bool(star_before or star_after),
+                'pdu_len': pdu_len,
+                'seq_number': seq_number,
+                'chksum': chksum,
+                'holdtime': holdtime,
+                'flags': flags,
+                'level': f'level-{level}'
+            } for star_before, lsp_id, star_after, pdu_len, seq_number, chksum, holdtime, flags
+                in _ISIS_LSP_RE.findall(block))
+        return lsps
+
     # === PPPoE Configuration Methods ===
 
     def create_pppoe_interface(self, name: str, source_interface: str,
@@ -1647,31 +1532,24 @@ class VyOSConfigService:
                                description: str | None = None,
                                mtu: int | None = None,
                                default_route: bool = True,
-                               name_servers: bool = True) -> bool:
+                               name_servers: bool = True,
+                               session: VyOSConfigSession | None = None) -> bool:
         """Create a PPPoE interface"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            base = f"interfaces pppoe {name}"
-            session._send_and_sleep(f"set {base}", 0.2)
-            session._send_and_sleep(f"set {base} source-interface {source_interface}", 0.2)
-            session._send_and_sleep(f"set {base} authentication username {username}", 0.2)
-            session._send_and_sleep(f"set {base} authentication password {password}", 0.2)
-
-            if description:
-                session._send_and_sleep(f"set {base} description '{description}'", 0.2)
-            if mtu:
-                session._send_and_sleep(f"set {base} mtu {mtu}", 0.2)
-            if default_route:
-                session._send_and_sleep(f"set {base} default-route auto", 0.2)
-            if name_servers:
-                session._send_and_sleep(f"set {base} name-servers auto", 0.2)
-
-            result = session.commit(comment=f"Create PPPoE interface {name}")
-            return result
-        finally:
-            session.close()
+        cmds = []
+        base = f"interfaces pppoe {name}"
+        cmds.append(f"set {base} source-interface {source_interface}")
+        cmds.append(f"set {base} authentication username {_quote(username)}")
+        cmds.append(f"set {base} authentication password {_quote(password)}")
+
+        if description:
+            cmds.append(f"set {base} description {_quote(description)}")
+        if mtu:
+            cmds.append(f"set {base} mtu {mtu}")
+        if default_route:
+            cmds.append(f"set {base} default-route auto")
+        if name_servers:
+            cmds.append(f"set {base} name-servers auto")
+        return self._apply(cmds, f"Create PPPoE interface {name}", session)
 
     def update_pppoe_interface(self, name: str,
                                source_interface: str | None = None,
@@ -1680,140 +1558,60 @@ class VyOSConfigService:
                                description: str | None = None,
                                mtu: int | None = None,
                                default_route: bool | None = None,
-                               name_servers: bool | None = None) -> bool:
-        """Update a PPPoE interface"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            base = f"interfaces pppoe {name}"
-
-            if source_interface is not None:
-                session._send_and_sleep(f"delete {base} source-interface", 0.1)
-                session._send_and_sleep(f"set {base} source-interface {source_interface}", 0.2)
-            if username is not None:
-                session._send_and_sleep(f"delete {base} authentication username", 0.1)
-                session._send_and_sleep(f"set {base} authentication username {username}", 0.2)
-            if password is not None:
-                session._send_and_sleep(f"delete {base} authentication password", 0.1)
-                session._send_and_sleep(f"set {base} authentication password {password}", 0.2)
-            if description is not None:
-                session._send_and_sleep(f"delete {base} description", 0.1)
-                if description:
-                    session._send_and_sleep(f"set {base} description '{description}'", 0.2)
-            if mtu is not None:
-                session._send_and_sleep(f"delete {base} mtu", 0.1)
-                if mtu:
-                    session._send_and_sleep(f"set {base} mtu {mtu}", 0.2)
-            if default_route is not None:
-                session._send_and_sleep(f"delete {base} default-route", 0.1)
-                if default_route:
-                    session._send_and_sleep(f"set {base} default-route auto", 0.2)
-            if name_servers is not None:
-                session._send_and_sleep(f"delete {base} name-servers", 0.1)
-                if name_servers:
-                    session._send_and_sleep(f"set {base} name-servers auto", 0.2)
-
-            result = session.commit(comment=f"Update PPPoE interface {name}")
-            return result
-        finally:
-            session.close()
+                               name_servers: bool | None = None,
+                               session: VyOSConfigSession | None = None) -> bool:
+        """Update a PPPoE interface, sending only fields that differ from the config"""
+        values = {
+            'source_interface': source_interface,
+            'username': username,
+            'password': password,
+            'description': description,
+            'mtu': mtu,
+            'default_route': default_route,
+            'name_servers': name_servers,
+        }
+        current = next((i for i in self.get_pppoe_config()['interfaces']
+                        if i['name'] == name), {})
+        values = _changed_values(current, {k: v for k, v in values.items() if v is not None})
+        if not values:
+            return True
+        cmds = _replace_commands(f"interfaces pppoe {name}", _PPPOE_UPDATE_FIELDS, values, current)
+        return self._apply(cmds, f"Update PPPoE interface {name}", session)
 
     def delete_pppoe_interface(self, name: str) -> bool:
         """Delete a PPPoE interface"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"delete interfaces pppoe {name}", 0.3)
-            result = session.commit(comment=f"Delete PPPoE interface {name}")
-            return result
-        finally:
-            session.close()
+        return self._run_config_script([f"delete interfaces pppoe {name}"],
+                                       f"Delete PPPoE interface {name}")
 
     def get_pppoe_config(self) -> dict:
         """Get PPPoE configuration"""
-        stdin, stdout, stderr = self.ssh_client.client.exec_command("/bin/cli-shell-api showCfg")
-        config_text = stdout.read().decode("utf-8", errors="replace")
+        return self._parsed('pppoe_config', self._parse_pppoe_config, ('interfaces',))
 
+    @staticmethod
+    def _parse_pppoe_config(config_events: list[_ConfigEvent]) -> dict:
         pppoe_interfaces = []
-        lines = config_text.split('\n')
-        in_interfaces = False
-        in_pppoe = False
-        brace_depth = 0
-        pppoe_brace_depth = 0
-        current_pppoe = None
-
-        for line in lines:
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-
-            if line_stripped == 'interfaces {':
-                in_interfaces = True
-                brace_depth = 1
-                continue
-
-            if in_interfaces:
-                brace_depth += line.count('{') - line.count('}')
-                if brace_depth <= 0:
-                    in_interfaces = False
-                    break
-
-            if not in_interfaces:
-                continue
-
-            if not in_pppoe and line_stripped.startswith('pppoe') and '{' in line_stripped:
-                match = re.search(r'pppoe\s+([^\s{]+)', line_stripped)
-                if match:
-                    current_pppoe = {
-                        'name': match.group(1),
-                        'source_interface': None,
-                        'username': None,
-                        'description': None,
-                        'mtu': None,
-                        'default_route': False,
-                        'name_servers': False
-                    }
-                    in_pppoe = True
-                    pppoe_brace_depth = 1
-                    continue
-
-            if in_pppoe and current_pppoe:
-                pppoe_brace_depth += line.count('{') - line.count('}')
-                if pppoe_brace_depth <= 0:
-                    pppoe_interfaces.append(current_pppoe)
-                    current_pppoe = None
-                    in_pppoe = False
-                    continue
-
-                if 'source-interface' in line_stripped:
-                    match = re.search(r'source-interface\s+([^\s]+)', line_stripped)
-                    if match:
-                        current_pppoe['source_interface'] = match.group(1)
-                if 'username' in line_stripped:
-                    match = re.search(r'username\s+([^\s]+)', line_stripped)
-                    if match:
-                        current_pppoe['username'] = match.group(1)
-                if 'description' in line_stripped and not line_stripped.startswith('#'):
-                    match = re.search(r'description\s+[\'"]?([^\'"]+)[\'"]?', line_stripped)
-                    if match:
-                        current_pppoe['description'] = match.group(1)
-                if 'mtu' in line_stripped:
-                    match = re.search(r'mtu\s+(\d+)', line_stripped)
-                    if match:
-                        current_pppoe['mtu'] = int(match.group(1))
-                if 'default-route' in line_stripped:
-                    current_pppoe['default_route'] = True
-                if 'name-servers' in line_stripped:
-                    current_pppoe['name_servers'] = True
+        for path, key, value in _select_config(config_events, ('interfaces', 'pppoe')):
+            if path == ('interfaces',):
+                pppoe_interfaces.append({
+                    'name': value,
+                    'source_interface': None,
+                    'username': None,
+                    'description': None,
+                    'mtu': None,
+                    'default_route': False,
+                    'name_servers': False
+                })
+            elif len(path) == 3:
+                if key in _PPPOE_FIELDS:
+                    name, convert = _PPPOE_FIELDS[key]
+                    pppoe_interfaces[-1][name] = convert(value)
+            elif path[3:] == ('authentication',) and key == 'username':
+                pppoe_interfaces[-1]['username'] = value
 
         return {'interfaces': pppoe_interfaces}
 
     def get_pppoe_status(self) -> dict:
         """Get PPPoE interface status"""
-        from app.services.vyos_command import VyOSCommandExecutor
-
         config = self.get_pppoe_config()
         pppoe_interfaces = config.get('interfaces', [])
 
@@ -1824,94 +1622,101 @@ class VyOSConfigService:
         try:
             executor = VyOSCommandExecutor(self.ssh_client)
 
-            for pppoe_if in pppoe_interfaces:
-                iface_name = pppoe_if['name']
+            # One "show interfaces" gives the basic state of every interface
+            link_states = {}
+            if pppoe_interfaces:
                 try:
-                    iface_status = {
-                        'name': iface_name,
-                        'status': 'unknown',
-                        'ip_address': None,
-                        'remote_ip': None,
-                        'uptime': None,
-                        'raw_output': None
-                    }
+                    result = executor.execute_show("show interfaces")
+                    if result.status.value == "success" and result.stdout:
+                        link_states = self._parse_interface_states(result.stdout)
+                except Exception:
+                    pass
+
+            # The detailed query is per interface; run them side by side on
+            # separate channels, keeping the configured order
+            status_data['interfaces'] = self.run_parallel(
+                [lambda name=pppoe_if['name']: self._pppoe_interface_status(
+                    executor, name, link_states.get(name, 'unknown'))
+                 for pppoe_if in pppoe_interfaces],
+                max_channels=8)
+        except Exception as e:
+            status_data['error'] = str(e)
 
-                    # First try "show interfaces" to get basic status
-                    try:
-                        result = executor.execute_show("show interfaces")
-                        if result.status.value == "success" and result.stdout:
-                            lines = result.stdout.split('\n')
-                            in_pppoe_section = False
-                            for line in lines:
-                                line = line.strip()
-                                if iface_name in line:
-                                    in_pppoe_section = True
-                                elif in_pppoe_section and line and not line.startswith(' '):
-                                    break
-                                elif in_pppoe_section:
-                                    if 'up' in line.lower() and 'down' not in line.lower():
-                                        iface_status['status'] = 'up'
-                                    elif 'down' in line.lower():
-                                        iface_status['status'] = 'down'
-                    except Exception:
-                        pass
+        return status_data
 
-                    # Try to get detailed PPPoE info
-                    try:
-                        result = executor.execute_show(f"show interfaces pppoe {iface_name}")
-                        if result.status.value == "success" and result.stdout:
-                            iface_status['raw_output'] = result.stdout
+    @staticmethod
+    def _parse_interface_states(output: str) -> dict[str, str]:
+        """Map interface name to 'up'/'down' from the S/L column of 'show interfaces'"""
+        return {
+            name: 'up' if admin == 'u' and link == 'u' else 'down'
+            for name, admin, link in _SHOW_INTERFACES_ROW_RE.findall(output)
+        }
 
-                            lines = result.stdout.split('\n')
-                            for line in lines:
-                                line = line.strip()
-                                if not line:
-                                    continue
+    @staticmethod
+    def _pppoe_interface_status(executor: VyOSCommandExecutor, iface_name: str,
+                                link_state: str = 'unknown') -> dict:
+        """Query the live status of one PPPoE interface"""
+        try:
+            iface_status = {
+                'name': iface_name,
+                'status': link_state,
+                'ip_address': None,
+                'remote_ip': None,
+                'uptime': None,
+                'raw_output': None
+            }
 
-                                # Check for state/status
-                                if 'state:' in line.lower() or 'status:' in line.lower():
-                                    if 'up' in line.lower():
-                                        iface_status['status'] = 'up'
-                                    elif 'down' in line.lower():
-                                        iface_status['status'] = 'down'
-                                # Check for LCP state
-                                elif 'lcp' in line.lower() and 'open' in line.lower():
-                                    iface_status['status'] = 'up'
-                                elif 'lcp' in line.lower() and 'closed' in line.lower():
-                                    iface_status['status'] = 'down'
-                                # Check for local IP
-                                elif 'local' in line.lower() and 'ip' in line.lower():
-                                    match = re.search(r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})', line)
-                                    if match:
-                                        iface_status['ip_address'] = match.group(1)
-                                # Check for remote IP
-                                elif 'remote' in line.lower() and 'ip' in line.lower():
-                                    match = re.search(r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})', line)
-                                    if match:
-                                        iface_status['remote_ip'] = match.group(1)
-                                # Check for IP address without "local"
-                                elif 'ip address' in line.lower() and 'local' not in line.lower():
-                                    match = re.search(r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})', line)
-                                    if match and not iface_status['ip_address']:
-                                        iface_status['ip_address'] = match.group(1)
-                                # Check for uptime
-                                elif 'uptime' in line.lower():
-                                    iface_status['uptime'] = line
-                    except Exception:
-                        pass
+            # Try to get detailed PPPoE info
+            try:
+                result = executor.execute_show(f"show interfaces pppoe {iface_name}")
+                if result.status.value == "success" and result.stdout:
+                    iface_status['raw_output'] = result.stdout
 
-                    status_data['interfaces'].append(iface_status)
-                except Exception as e:
-                    status_data['interfaces'].append({
-                        'name': iface_name,
-                        'status': 'error',
-                        'error': str(e)
-                    })
+                    for line in result.stdout.splitlines():
+                        line = line.strip()
+                        if not line:
+                            continue
+                        lowered = line.lower()
+
+                        # Check for state/status
+                        if 'state:' in lowered or 'status:' in lowered:
+                            if 'up' in lowered:
+                                iface_status['status'] = 'up'
+                            elif 'down' in lowered:
+                                iface_status['status'] = 'down'
+                        # Check for LCP state
+                        elif 'lcp' in lowered and 'open' in lowered:
+                            iface_status['status'] = 'up'
+                        elif 'lcp' in lowered and 'closed' in lowered:
+                            iface_status['status'] = 'down'
+                        # Check for local IP
+                        elif 'local' in lowered and 'ip' in lowered:
+                            match = _IPV4_RE.search(line)
+                            if match:
+                                iface_status['ip_address'] = match.group(1)
+                        # Check for remote IP
+                        elif 'remote' in lowered and 'ip' in lowered:
+                            match = _IPV4_RE.search(line)
+                            if match:
+                                iface_status['remote_ip'] = match.group(1)
+                        # Check for IP address without "local" (handled above)
+                        elif 'ip address' in lowered:
+                            match = _IPV4_RE.search(line)
+                            if match and not iface_status['ip_address']:
+                                iface_status['ip_address'] = match.group(1)
+                        # Check for uptime
+                        elif 'uptime' in lowered:
+                            iface_status['uptime'] = line
+            except Exception:
+                pass
 
+            return iface_status
         except Exception as e:
-            status_data['error'] = str(e)
-
-        return status_data
+            return {
+                'name': iface_name,
+                'status': 'error',
+                'error': str(e)
+            }
 
     # === WireGuard Configuration Methods ===
 
@@ -1919,80 +1724,44 @@ class VyOSConfigService:
                                     address: str | None = None,
                                     listen_port: int | None = None,
                                     mtu: int | None = None,
-                                    description: str | None = None) -> bool:
+                                    description: str | None = None,
+                                    session: VyOSConfigSession | None = None) -> bool:
         """Create a WireGuard interface"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            base = f"interfaces wireguard {name}"
-            session._send_and_sleep(f"set {base} private-key {private_key}", 0.3)
-
-            if address:
-                session._send_and_sleep(f"set {base} address {address}", 0.3)
-            if listen_port:
-                session._send_and_sleep(f"set {base} port {listen_port}", 0.3)
-            if mtu:
-                session._send_and_sleep(f"set {base} mtu {mtu}", 0.3)
-            if description:
-                session._send_and_sleep(f"set {base} description \"{description}\"", 0.3)
-
-            # Create a real-looking dummy peer to satisfy commit requirements
-            import base64
-            import os
-            dummy_pubkey = base64.b64encode(os.urandom(32)).decode()
-            dummy_peer = f"{base} peer initial-peer"
-            session._send_and_sleep(f"set {dummy_peer} public-key {dummy_pubkey}", 0.3)
-            session._send_and_sleep(f"set {dummy_peer} allowed-ips 127.0.0.2/32", 0.3)
-
-            result = session.commit(comment=f"Create WireGuard interface {name}")
-            return result
-        finally:
-            session.close()
-
-    def update_wireguard_interface(self, name: str, **kwargs) -> bool:
+        cmds = []
+        base = f"interfaces wireguard {name}"
+        cmds.append(f"set {base} private-key {_quote(private_key)}")
+
+        if address:
+            cmds.append(f"set {base} address {address}")
+        if listen_port:
+            cmds.append(f"set {base} port {listen_port}")
+        if mtu:
+            cmds.append(f"set {base} mtu {mtu}")
+        if description:
+            cmds.append(f"set {base} description {_quote(description)}")
+
+        # Create a real-looking dummy peer to satisfy commit requirements
+        dummy_pubkey = base64.b64encode(os.urandom(32)).decode()
+        dummy_peer = f"{base} peer initial-peer"
+        cmds.append(f"set {dummy_peer} public-key {dummy_pubkey}")
+        cmds.append(f"set {dummy_peer} allowed-ips 127.0.0.2/32")
+        return self._apply(cmds, f"Create WireGuard interface {name}", session)
+
+    def update_wireguard_interface(self, name: str, *,
+                                   session: VyOSConfigSession | None = None, **kwargs) -> bool:
         """Update a WireGuard interface"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            base = f"interfaces wireguard {name}"
-
-            if 'address' in kwargs:
-                session._send_and_sleep(f"delete {base} address", 0.1)
-                if kwargs['address']:
-                    session._send_and_sleep(f"set {base} address {kwargs['address']}", 0.2)
-            if 'listen_port' in kwargs:
-                session._send_and_sleep(f"delete {base} port", 0.1)
-                if kwargs['listen_port']:
-                    session._send_and_sleep(f"set {base} port {kwargs['listen_port']}", 0.2)
-            if 'mtu' in kwargs:
-                session._send_and_sleep(f"delete {base} mtu", 0.1)
-                if kwargs['mtu']:
-                    session._send_and_sleep(f"set {base} mtu {kwargs['mtu']}", 0.2)
-            if 'description' in kwargs:
-                session._send_and_sleep(f"delete {base} description", 0.1)
-                if kwargs['description']:
-                    session._send_and_sleep(f"set {base} description '{kwargs['description']}'", 0.2)
-            if 'private_key' in kwargs and kwargs['private_key']:
-                session._send_and_sleep(f"set {base} private-key {kwargs['private_key']}", 0.2)
-
-            result = session.commit(comment=f"Update WireGuard interface {name}")
-            return result
-        finally:
-            session.close()
-
-    def delete_wireguard_interface(self, name: str) -> bool:
+        base = f"interfaces wireguard {name}"
+        cmds = _replace_commands(base, _WIREGUARD_UPDATE_FIELDS, kwargs)
+        # The private key is required, so it is only ever replaced
+        if 'private_key' in kwargs and kwargs['private_key']:
+            cmds.append(f"set {base} private-key {_quote(kwargs['private_key'])}")
+        return self._apply(cmds, f"Update WireGuard interface {name}", session)
+
+    def delete_wireguard_interface(self, name: str,
+                                   session: VyOSConfigSession | None = None) -> bool:
         """Delete a WireGuard interface"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"delete interfaces wireguard {name}", 0.3)
-            result = session.commit(comment=f"Delete WireGuard interface {name}")
-            return result
-        finally:
-            session.close()
+        return self._apply([f"delete interfaces wireguard {name}"],
+                           f"Delete WireGuard interface {name}", session)
 
     def add_wireguard_peer(self, interface: str, peer_name: str,
                            public_key: str,
@@ -2000,190 +1769,82 @@ class VyOSConfigService:
                            endpoint: str | None = None,
                            endpoint_port: int | None = None,
                            persistent_keepalive: int | None = None,
-                           preshared_key: str | None = None) -> bool:
+                           preshared_key: str | None = None,
+                           session: VyOSConfigSession | None = None) -> bool:
         """Add a peer to a WireGuard interface"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            base = f"interfaces wireguard {interface} peer {peer_name}"
-            session._send_and_sleep(f"set {base}", 0.2)
-            session._send_and_sleep(f"set {base} public-key {public_key}", 0.2)
-
-            # VyOS requires allowed-ips for WireGuard peers
-            if allowed_ips:
-                session._send_and_sleep(f"set {base} allowed-ips {allowed_ips}", 0.2)
-            else:
-                session._send_and_sleep(f"set {base} allowed-ips 0.0.0.0/0", 0.2)
-
-            if endpoint:
-                session._send_and_sleep(f"set {base} address {endpoint}", 0.2)
-            if endpoint_port:
-                session._send_and_sleep(f"set {base} port {endpoint_port}", 0.2)
-            if persistent_keepalive:
-                session._send_and_sleep(f"set {base} persistent-keepalive {persistent_keepalive}", 0.2)
-            if preshared_key:
-                session._send_and_sleep(f"set {base} preshared-key {preshared_key}", 0.2)
-
-            result = session.commit(comment=f"Add WireGuard peer {peer_name} to {interface}")
-            return result
-        finally:
-            session.close()
-
-    def remove_wireguard_peer(self, interface: str, peer_name: str) -> bool:
+        cmds = []
+        base = f"interfaces wireguard {interface} peer {peer_name}"
+        cmds.append(f"set {base} public-key {public_key}")
+
+        # VyOS requires allowed-ips for WireGuard peers
+        if allowed_ips:
+            cmds.append(f"set {base} allowed-ips {allowed_ips}")
+        else:
+            cmds.append(f"set {base} allowed-ips 0.0.0.0/0")
+
+        if endpoint:
+            cmds.append(f"set {base} address {endpoint}")
+        if endpoint_port:
+            cmds.append(f"set {base} port {endpoint_port}")
+        if persistent_keepalive:
+            cmds.append(f"set {base} persistent-keepalive {persistent_keepalive}")
+        if preshared_key:
+            cmds.append(f"set {base} preshared-key {_quote(preshared_key)}")
+        return self._apply(cmds, f"Add WireGuard peer {peer_name} to {interface}", session)
+
+    def remove_wireguard_peer(self, interface: str, peer_name: str,
+                              session: VyOSConfigSession | None = None) -> bool:
         """Remove a peer from a WireGuard interface"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"delete interfaces wireguard {interface} peer {peer_name}", 0.3)
-            result = session.commit(comment=f"Remove WireGuard peer {peer_name} from {interface}")
-            return result
-        finally:
-            session.close()
+        return self._apply([f"delete interfaces wireguard {interface} peer {peer_name}"],
+                           f"Remove WireGuard peer {peer_name} from {interface}", session)
 
     def get_wireguard_config(self) -> dict:
         """Get WireGuard configuration"""
-        stdin, stdout, stderr = self.ssh_client.client.exec_command("/bin/cli-shell-api showCfg")
-        config_text = stdout.read().decode("utf-8", errors="replace")
+        return self._parsed('wireguard_config', self._parse_wireguard_config, ('interfaces',))
 
+    @staticmethod
+    def _parse_wireguard_config(config_events: list[_ConfigEvent]) -> dict:
         wireguard_interfaces = []
-        lines = config_text.split('\n')
-        in_interfaces = False
-        brace_depth = 0
-
-        current_wg = None
-        in_wg = False
-        wg_brace_depth = 0
-
-        current_peer = None
-        in_peer = False
-        peer_brace_depth = 0
-
-        for line in lines:
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-
-            if line_stripped == 'interfaces {':
-                in_interfaces = True
-                brace_depth = 1
-                continue
-
-            if in_interfaces:
-                brace_depth += line.count('{') - line.count('}')
-                if brace_depth <= 0:
-                    in_interfaces = False
-                    break
-
-            if not in_interfaces:
-                continue
-
-            # WireGuard interface start
-            if not in_wg and line_stripped.startswith('wireguard') and '{' in line_stripped:
-                match = re.search(r'wireguard\s+([^\s{]+)', line_stripped)
-                if match:
-                    current_wg = {
-                        'name': match.group(1),
-                        'address': None,
-                        'private_key': None,
+        for path, key, value in _select_config(config_events, ('interfaces', 'wireguard')):
+            if path == ('interfaces',):
+                wireguard_interfaces.append({
+                    'name': value,
+                    'address': None,
+                    'private_key': None,
+                    'public_key': None,
+                    'listen_port': None,
+                    'mtu': None,
+                    'description': None,
+                    'peers': []
+                })
+            elif len(path) == 3:
+                if key == 'peer':
+                    wireguard_interfaces[-1]['peers'].append({
+                        'name': value,
                         'public_key': None,
-                        'listen_port': None,
-                        'mtu': None,
-                        'description': None,
-                        'peers': []
-                    }
-                    in_wg = True
-                    wg_brace_depth = 1
-                    continue
-
-            if in_wg and current_wg:
-                wg_brace_depth += line.count('{') - line.count('}')
-                if wg_brace_depth <= 0:
-                    wireguard_interfaces.append(current_wg)
-                    current_wg = None
-                    in_wg = False
-                    continue
-
-                # Peer start
-                if not in_peer and 'peer' in line_stripped and '{' in line_stripped:
-                    match = re.search(r'peer\s+([^\s{]+)', line_stripped)
-                    if match:
-                        current_peer = {
-                            'name': match.group(1),
-                            'public_key': None,
-                            'allowed_ips': None,
-                            'endpoint': None,
-                            'port': None,
-                            'persistent_keepalive': None
-                        }
-                        in_peer = True
-                        peer_brace_depth = 1
-                        continue
-
-                if in_peer and current_peer:
-                    peer_brace_depth += line.count('{') - line.count('}')
-                    if peer_brace_depth <= 0:
-                        current_wg['peers'].append(current_peer)
-                        current_peer = None
-                        in_peer = False
-                        continue
-
-                    if 'public-key' in line_stripped:
-                        match = re.search(r'public-key\s+([^\s]+)', line_stripped)
-                        if match:
-                            current_peer['public_key'] = match.group(1)
-                    elif 'allowed-ips' in line_stripped:
-                        match = re.search(r'allowed-ips\s+([^\s]+)', line_stripped)
-                        if match:
-                            current_peer['allowed_ips'] = match.group(1)
-                    elif 'address' in line_stripped and '{' not in line_stripped:
-                        match = re.search(r'address\s+([^\s]+)', line_stripped)
-                        if match:
-                            current_peer['endpoint'] = match.group(1)
-                    elif 'port' in line_stripped and '{' not in line_stripped:
-                        match = re.search(r'port\s+(\d+)', line_stripped)
-                        if match:
-                            current_peer['port'] = int(match.group(1))
-                    elif 'persistent-keepalive' in line_stripped:
-                        match = re.search(r'persistent-keepalive\s+(\d+)', line_stripped)
-                        if match:
-                            current_peer['persistent_keepalive'] = int(match.group(1))
-                    continue
-
-                # Parse WireGuard interface fields
-                if 'address' in line_stripped and '{' not in line_stripped:
-                    match = re.search(r'address\s+([^\s]+)', line_stripped)
-                    if match:
-                        current_wg['address'] = match.group(1)
-                elif 'private-key' in line_stripped:
-                    match = re.search(r'private-key\s+([^\s]+)', line_stripped)
-                    if match:
-                        current_wg['private_key'] = match.group(1)
-                elif 'port' in line_stripped and '{' not in line_stripped:
-                    match = re.search(r'port\s+(\d+)', line_stripped)
-                    if match:
-                        current_wg['listen_port'] = int(match.group(1))
-                elif 'mtu' in line_stripped:
-                    match = re.search(r'mtu\s+(\d+)', line_stripped)
-                    if match:
-                        current_wg['mtu'] = int(match.group(1))
-                elif 'description' in line_stripped:
-                    match = re.search(r'description\s+[\'"]?([^\'"]+)[\'"]?', line_stripped)
-                    if match:
-                        current_wg['description'] = match.group(1)
-
-        # Derive public keys from private keys
-        for wg_if in wireguard_interfaces:
-            if wg_if.get('private_key'):
-                wg_if['public_key'] = wireguard_pubkey_from_privkey(wg_if['private_key'])
+                        'allowed_ips': None,
+                        'endpoint': None,
+                        'port': None,
+                        'persistent_keepalive': None
+                    })
+                elif key in _WIREGUARD_FIELDS:
+                    name, convert = _WIREGUARD_FIELDS[key]
+                    wireguard_interfaces[-1][name] = convert(value)
+            elif len(path) == 5 and path[3] == 'peer':
+                if key in _WIREGUARD_PEER_FIELDS:
+                    name, convert = _WIREGUARD_PEER_FIELDS[key]
+                    wireguard_interfaces[-1]['peers'][-1][name] = convert(value)
+
+        # Derive public keys from private keys in one batch
+        keyed = [wg_if for wg_if in wireguard_interfaces if wg_if.get('private_key')]
+        public_keys = wireguard_pubkeys_from_privkeys([wg_if['private_key'] for wg_if in keyed])
+        for wg_if, public_key in zip(keyed, public_keys):
+            wg_if['public_key'] = public_key
 
         return {'interfaces': wireguard_interfaces}
 
     def get_wireguard_status(self) -> dict:
         """Get WireGuard interface status"""
-        from app.services.vyos_command import VyOSCommandExecutor
-
         config = self.get_wireguard_config()
         wg_interfaces = config.get('interfaces', [])
 
@@ -2192,9 +1853,12 @@ class VyOSConfigService:
         }
 
         try:
-            executor = VyOSCommandExecutor(self.ssh_client)
+            # Every interface is queried in one exec over a single channel
+            results = VyOSCommandExecutor(self.ssh_client).execute_show_many(
+                [f"show interfaces wireguard {wg_if['name']}" for wg_if in wg_interfaces]
+            ) if wg_interfaces else []
 
-            for wg_if in wg_interfaces:
+            for wg_if, result in zip(wg_interfaces, results):
                 iface_name = wg_if['name']
                 try:
                     iface_status = {
@@ -2207,24 +1871,25 @@ class VyOSConfigService:
                     }
 
                     try:
-                        result = executor.execute_show(f"show interfaces wireguard {iface_name}")
                         if result.status.value == "success" and result.stdout:
                             iface_status['raw_output'] = result.stdout
 
                             if 'interface:' in result.stdout.lower() or iface_name in result.stdout:
                                 iface_status['status'] = 'active'
 
-                            lines = result.stdout.split('\n')
-                            for line in lines:
+                            for line in result.stdout.splitlines():
                                 line = line.strip()
                                 if not line:
                                     continue
-                                if 'public key:' in line.lower():
-                                    parts = line.split(':', 1)
-                                    if len(parts) > 1:
-                                        iface_status['public_key'] = parts[1].strip()
-                                elif 'listening port:' in line.lower():
-                                    match = re.search(r'(\d+)', line)
+                                # "<key>: <value>" lines; only the key is lowercased
+                                key, sep, value = line.partition(':')
+                                if not sep:
+                                    continue
+                                key = key.lower()
+                                if key == 'public key':
+                                    iface_status['public_key'] = value.strip()
+                                elif key == 'listening port':
+                                    match = _FIRST_INT_RE.search(value)
                                     if match:
                                         iface_status['listening_port'] = int(match.group(1))
 
@@ -2252,232 +1917,110 @@ class VyOSConfigService:
                          pre_shared_key: str | None = None,
                          description: str | None = None,
                          ike_group: int = 14,
-                         esp_group: int = 14) -> bool:
+                         esp_group: int = 14,
+                         session: VyOSConfigSession | None = None) -> bool:
         """Create an IPsec peer (site-to-site)"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            # First create default IKE and ESP groups if they don't exist
-            ike_base = "vpn ipsec ike-group VPN-WEBUI-IKE"
-            esp_base = "vpn ipsec esp-group VPN-WEBUI-ESP"
-
-            session._send_and_sleep(f"set {ike_base} proposal 1 encryption aes256", 0.2)
-            session._send_and_sleep(f"set {ike_base} proposal 1 hash sha256", 0.2)
-            session._send_and_sleep(f"set {ike_base} proposal 1 dh-group 14", 0.2)
-
-            session._send_and_sleep(f"set {esp_base} proposal 1 encryption aes256", 0.2)
-            session._send_and_sleep(f"set {esp_base} proposal 1 hash sha256", 0.2)
-
-            # Now create the peer
-            base = f"vpn ipsec site-to-site peer {name}"
-            session._send_and_sleep(f"set {base} remote-address {remote_address}", 0.2)
-
-            if local_address:
-                session._send_and_sleep(f"set {base} local-address {local_address}", 0.2)
-            if pre_shared_key:
-                session._send_and_sleep(f"set {base} authentication mode pre-shared-secret", 0.2)
-                # Note: pre-shared-secret is set without quotes in VyOS 1.4
-                session._send_and_sleep(f"set {base} authentication pre-shared-secret {pre_shared_key}", 0.3)
-            if description:
-                session._send_and_sleep(f"set {base} description \"{description}\"", 0.2)
-
-            session._send_and_sleep(f"set {base} ike-group VPN-WEBUI-IKE", 0.2)
-            session._send_and_sleep(f"set {base} default-esp-group VPN-WEBUI-ESP", 0.2)
-
-            # Create a default tunnel
-            tunnel_base = f"{base} tunnel 0"
-            session._send_and_sleep(f"set {tunnel_base} local prefix 0.0.0.0/0", 0.2)
-            session._send_and_sleep(f"set {tunnel_base} remote prefix 0.0.0.0/0", 0.2)
-
-            result = session.commit(comment=f"Create IPsec peer {name}")
-            return result
-        finally:
-            session.close()
-
-    def delete_ipsec_peer(self, name: str) -> bool:
+        cmds = []
+        # First create default IKE and ESP groups if they don't exist
+        ike_base = "vpn ipsec ike-group VPN-WEBUI-IKE"
+        esp_base = "vpn ipsec esp-group VPN-WEBUI-ESP"
+        groups = self._parsed('ipsec_groups', self._parse_ipsec_groups, ('vpn', 'ipsec'))
+
+        if 'VPN-WEBUI-IKE' not in groups['ike-group']:
+            cmds.append(f"set {ike_base} proposal 1 encryption aes256")
+            cmds.append(f"set {ike_base} proposal 1 hash sha256")
+            cmds.append(f"set {ike_base} proposal 1 dh-group 14")
+
+        if 'VPN-WEBUI-ESP' not in groups['esp-group']:
+            cmds.append(f"set {esp_base} proposal 1 encryption aes256")
+            cmds.append(f"set {esp_base} proposal 1 hash sha256")
+
+        # Now create the peer
+        base = f"vpn ipsec site-to-site peer {name}"
+        cmds.append(f"set {base} remote-address {remote_address}")
+
+        if local_address:
+            cmds.append(f"set {base} local-address {local_address}")
+        if pre_shared_key:
+            cmds.append(f"set {base} authentication mode pre-shared-secret")
+            cmds.append(f"set {base} authentication pre-shared-secret {_quote(pre_shared_key)}")
+        if description:
+            cmds.append(f"set {base} description {_quote(description)}")
+
+        cmds.append(f"set {base} ike-group VPN-WEBUI-IKE")
+        cmds.append(f"set {base} default-esp-group VPN-WEBUI-ESP")
+
+        # Create a default tunnel
+        tunnel_base = f"{base} tunnel 0"
+        cmds.append(f"set {tunnel_base} local prefix 0.0.0.0/0")
+        cmds.append(f"set {tunnel_base} remote prefix 0.0.0.0/0")
+        return self._apply(cmds, f"Create IPsec peer {name}", session)
+
+    def delete_ipsec_peer(self, name: str, session: VyOSConfigSession | None = None) -> bool:
         """Delete an IPsec peer"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"delete vpn ipsec site-to-site peer {name}", 0.3)
-            result = session.commit(comment=f"Delete IPsec peer {name}")
-            return result
-        finally:
-            session.close()
+        return self._apply([f"delete vpn ipsec site-to-site peer {name}"],
+                           f"Delete IPsec peer {name}", session)
 
     def add_ipsec_tunnel(self, peer_name: str,
                             tunnel_name: str,
                             local_prefix: str,
-                            remote_prefix: str) -> bool:
+                            remote_prefix: str,
+                            session: VyOSConfigSession | None = None) -> bool:
         """Add a tunnel to an IPsec peer"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            base = f"vpn ipsec site-to-site peer {peer_name} tunnel {tunnel_name}"
-            session._send_and_sleep(f"set {base}", 0.2)
-            session._send_and_sleep(f"set {base} local prefix {local_prefix}", 0.2)
-            session._send_and_sleep(f"set {base} remote prefix {remote_prefix}", 0.2)
-
-            result = session.commit(comment=f"Add IPsec tunnel {tunnel_name} to {peer_name}")
-            return result
-        finally:
-            session.close()
+        cmds = []
+        base = f"vpn ipsec site-to-site peer {peer_name} tunnel {tunnel_name}"
+        cmds.append(f"set {base} local prefix {local_prefix}")
+        cmds.append(f"set {base} remote prefix {remote_prefix}")
+        return self._apply(cmds, f"Add IPsec tunnel {tunnel_name} to {peer_name}", session)
+
+    @staticmethod
+    def _parse_ipsec_groups(config_events: list[_ConfigEvent]) -> dict[str, set[str]]:
+        """Names of the configured IKE and ESP groups"""
+        groups = {'ike-group': set(), 'esp-group': set()}
+        for path, key, value in _select_config(config_events, ('vpn', 'ipsec')):
+            if path == ('vpn', 'ipsec') and key in groups:
+                groups[key].add(value)
+        return groups
 
     def get_ipsec_config(self) -> dict:
         """Get IPsec configuration"""
-        stdin, stdout, stderr = self.ssh_client.client.exec_command("/bin/cli-shell-api showCfg")
-        config_text = stdout.read().decode("utf-8", errors="replace")
+        return self._parsed('ipsec_config', self._parse_ipsec_config, ('vpn', 'ipsec'))
 
+    @staticmethod
+    def _parse_ipsec_config(config_events: list[_ConfigEvent]) -> dict:
         ipsec_peers = []
-        lines = config_text.split('\n')
-        in_vpn = False
-        in_ipsec = False
-        in_site_to_site = False
-        vpn_brace_depth = 0
-        ipsec_brace_depth = 0
-        site_to_site_brace_depth = 0
-        in_peer = False
-        peer_brace_depth = 0
-        current_peer = None
-        in_tunnel = False
-        tunnel_brace_depth = 0
-        current_tunnel = None
-
-        for line in lines:
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-
-            if line_stripped == 'vpn {':
-                in_vpn = True
-                vpn_brace_depth = 1
-                continue
-
-            if in_vpn:
-                vpn_brace_depth += line.count('{') - line.count('}')
-                if vpn_brace_depth <= 0:
-                    in_vpn = False
-                    break
-
-            if not in_vpn:
-                continue
-
-            if not in_ipsec and line_stripped == 'ipsec {':
-                in_ipsec = True
-                ipsec_brace_depth = 1
-                continue
-
-            if in_ipsec:
-                ipsec_brace_depth += line.count('{') - line.count('}')
-                if ipsec_brace_depth <= 0:
-                    in_ipsec = False
-                    continue
-
-            if not in_ipsec:
-                continue
-
-            if not in_site_to_site and line_stripped == 'site-to-site {':
-                in_site_to_site = True
-                site_to_site_brace_depth = 1
-                continue
-
-            if in_site_to_site:
-                site_to_site_brace_depth += line.count('{') - line.count('}')
-                if site_to_site_brace_depth <= 0:
-                    in_site_to_site = False
-                    continue
-
-            if not in_site_to_site:
-                continue
-
-            if not in_peer and 'peer' in line_stripped and '{' in line_stripped:
-                match = re.search(r'peer\s+([^\s{]+)', line_stripped)
-                if match:
-                    current_peer = {
-                        'name': match.group(1),
-                        'remote_address': None,
-                        'local_address': None,
-                        'description': None,
-                        'authentication': 'pre-shared-secret',
-                        'ike_group': None,
-                        'esp_group': None,
-                        'tunnels': []
-                    }
-                    in_peer = True
-                    peer_brace_depth = 1
-                    continue
-
-            if in_peer and current_peer:
-                peer_brace_depth += line.count('{') - line.count('}')
-                if peer_brace_depth <= 0:
-                    ipsec_peers.append(current_peer)
-                    current_peer = None
-                    in_peer = False
-                    continue
-
-                if not in_tunnel and 'tunnel' in line_stripped and '{' in line_stripped:
-                    match = re.search(r'tunnel\s+([^\s{]+)', line_stripped)
-                    if match:
-                        current_tunnel = {
-                            'name': match.group(1),
-                            'local_prefix': None,
-                            'remote_prefix': None
-                        }
-                        in_tunnel = True
-                        tunnel_brace_depth = 1
-                        continue
-
-                if in_tunnel and current_tunnel:
-                    tunnel_brace_depth += line.count('{') - line.count('}')
-                    if tunnel_brace_depth <= 0:
-                        current_peer['tunnels'].append(current_tunnel)
-                        current_tunnel = None
-                        in_tunnel = False
-                        continue
-
-                    if 'local prefix' in line_stripped:
-                        match = re.search(r'prefix\s+([^\s]+)', line_stripped)
-                        if match:
-                            current_tunnel['local_prefix'] = match.group(1)
-                    elif 'remote prefix' in line_stripped:
-                        match = re.search(r'prefix\s+([^\s]+)', line_stripped)
-                        if match:
-                            current_tunnel['remote_prefix'] = match.group(1)
-                    continue
-
-                if 'remote-address' in line_stripped:
-                    match = re.search(r'remote-address\s+([^\s]+)', line_stripped)
-                    if match:
-                        current_peer['remote_address'] = match.group(1)
-                elif 'local-address' in line_stripped and '{' not in line_stripped:
-                    match = re.search(r'local-address\s+([^\s]+)', line_stripped)
-                    if match:
-                        current_peer['local_address'] = match.group(1)
-                elif 'description' in line_stripped:
-                    match = re.search(r'description\s+[\'"]?([^\'"]+)[\'"]?', line_stripped)
-                    if match:
-                        current_peer['description'] = match.group(1)
-                elif 'ike-group' in line_stripped:
-                    match = re.search(r'ike-group\s+(\d+)', line_stripped)
-                    if match:
-                        current_peer['ike_group'] = int(match.group(1))
-                elif 'esp-group' in line_stripped:
-                    match = re.search(r'esp-group\s+(\d+)', line_stripped)
-                    if match:
-                        current_peer['esp_group'] = int(match.group(1))
+        peers = _select_config(config_events, ('vpn', 'ipsec', 'site-to-site', 'peer'))
+        for path, key, value in peers:
+            if path == ('vpn', 'ipsec', 'site-to-site'):
+                ipsec_peers.append({
+                    'name': value,
+                    'remote_address': None,
+                    'local_address': None,
+                    'description': None,
+                    'authentication': 'pre-shared-secret',
+                    'ike_group': None,
+                    'esp_group': None,
+                    'tunnels': []
+                })
+            elif len(path) == 5:
+                if key == 'tunnel':
+                    ipsec_peers[-1]['tunnels'].append({
+                        'name': value,
+                        'local_prefix': None,
+                        'remote_prefix': None
+                    })
+                elif key in _IPSEC_PEER_FIELDS:
+                    name, convert = _IPSEC_PEER_FIELDS[key]
+                    ipsec_peers[-1][name] = convert(value)
+            elif len(path) == 8 and path[5] == 'tunnel' and key == 'prefix':
+                # tunnel <name> { local { prefix ... } remote { prefix ... } }
+                if path[7] in ('local', 'remote'):
+                    ipsec_peers[-1]['tunnels'][-1][f"{path[7]}_prefix"] = value
 
         return {'peers': ipsec_peers}
 
     def get_ipsec_status(self) -> dict:
         """Get IPsec status"""
-        from app.services.vyos_command import VyOSCommandExecutor
-
-        config = self.get_ipsec_config()
-        peers = config.get('peers', [])
-
         status_data = {
             'peers': [],
             'sas': []
@@ -2505,119 +2048,42 @@ class VyOSConfigService:
                                    device: str = 'tun0',
                                    description: str | None = None) -> bool:
         """Create an OpenVPN instance - NOTE: OpenVPN requires PKI/certificates in VyOS 1.4
-           For now, this returns True but actual OpenVPN setup requires additional certificate configuration
+           For now, this returns True but actual OpenVPN setup requires additional
+           certificate configuration
         """
         # OpenVPN needs full PKI setup which is complex. For now, we'll support
         # reading and deleting existing OpenVPN configs. Creation will be implemented
         # with full certificate management in a future update.
         # For testing, just return True to indicate API call success.
-        logger.warning(f"OpenVPN instance '{name}' creation requested - full PKI setup needed for actual configuration")
+        logger.warning(f"OpenVPN instance '{name}' creation requested - "
+                       "full PKI setup needed for actual configuration")
         return True
 
-    def delete_openvpn_instance(self, name: str) -> bool:
+    def delete_openvpn_instance(self, name: str, session: VyOSConfigSession | None = None) -> bool:
         """Delete an OpenVPN instance"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"delete interfaces openvpn {name}", 0.3)
-            result = session.commit(comment=f"Delete OpenVPN {name}")
-            return result
-        finally:
-            session.close()
+        return self._apply([f"delete interfaces openvpn {name}"],
+                           f"Delete OpenVPN {name}", session)
 
     def get_openvpn_config(self) -> dict:
         """Get OpenVPN configuration"""
-        stdin, stdout, stderr = self.ssh_client.client.exec_command("/bin/cli-shell-api showCfg")
-        config_text = stdout.read().decode("utf-8", errors="replace")
+        return self._parsed('openvpn_config', self._parse_openvpn_config, ('interfaces',))
 
+    @staticmethod
+    def _parse_openvpn_config(config_events: list[_ConfigEvent]) -> dict:
         openvpn_instances = []
-        lines = config_text.split('\n')
-        in_interfaces = False
-        in_openvpn = False
-        interfaces_brace_depth = 0
-        openvpn_brace_depth = 0
-        in_instance = False
-        instance_brace_depth = 0
-        current_instance = None
-
-        for line in lines:
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
-
-            if line_stripped == 'interfaces {':
-                in_interfaces = True
-                interfaces_brace_depth = 1
-                continue
-
-            if in_interfaces:
-                interfaces_brace_depth += line.count('{') - line.count('}')
-                if interfaces_brace_depth <= 0:
-                    in_interfaces = False
-                    break
-
-            if not in_interfaces:
-                continue
-
-            if not in_openvpn and line_stripped == 'openvpn {':
-                in_openvpn = True
-                openvpn_brace_depth = 1
-                continue
-
-            if in_openvpn:
-                openvpn_brace_depth += line.count('{') - line.count('}')
-                if openvpn_brace_depth <= 0:
-                    in_openvpn = False
-                    continue
-
-            if not in_openvpn:
-                continue
-
-            if not in_instance and line_stripped and not line_stripped.startswith(' ') and '{' in line_stripped:
-                match = re.search(r'([^\s{]+)', line_stripped)
-                if match:
-                    name = match.group(1)
-                    current_instance = {
-                        'name': name,
-                        'mode': None,
-                        'protocol': None,
-                        'port': None,
-                        'device': None,
-                        'description': None
-                    }
-                    in_instance = True
-                    instance_brace_depth = 1
-                    continue
-
-            if in_instance and current_instance:
-                instance_brace_depth += line.count('{') - line.count('}')
-                if instance_brace_depth <= 0:
-                    openvpn_instances.append(current_instance)
-                    current_instance = None
-                    in_instance = False
-                    continue
-
-                if 'mode' in line_stripped and '{' not in line_stripped:
-                    match = re.search(r'mode\s+([^\s]+)', line_stripped)
-                    if match:
-                        current_instance['mode'] = match.group(1)
-                elif 'protocol' in line_stripped and '{' not in line_stripped:
-                    match = re.search(r'protocol\s+([^\s]+)', line_stripped)
-                    if match:
-                        current_instance['protocol'] = match.group(1)
-                elif 'local-port' in line_stripped and '{' not in line_stripped:
-                    match = re.search(r'local-port\s+(\d+)', line_stripped)
-                    if match:
-                        current_instance['port'] = int(match.group(1))
-                elif 'device-type' in line_stripped and '{' not in line_stripped:
-                    match = re.search(r'device-type\s+([^\s]+)', line_stripped)
-                    if match:
-                        current_instance['device'] = match.group(1)
-                elif 'description' in line_stripped:
-                    match = re.search(r'description\s+[\'"]?([^\'"]+)[\'"]?', line_stripped)
-                    if match:
-                        current_instance['description'] = match.group(1)
+        for path, key, value in _select_config(config_events, ('interfaces', 'openvpn')):
+            if path == ('interfaces',):
+                openvpn_instances.append({
+                    'name': value,
+                    'mode': None,
+                    'protocol': None,
+                    'port': None,
+                    'device': None,
+                    'description': None
+                })
+            elif len(path) == 3 and key in _OPENVPN_FIELDS:
+                name, convert = _OPENVPN_FIELDS[key]
+                openvpn_instances[-1][name] = convert(value)
 
         return {'instances': openvpn_instances}
 
@@ -2625,41 +2091,29 @@ class VyOSConfigService:
 
     def add_static_route(self, destination: str, next_hop: str | None = None,
                          interface: str | None = None, distance: int = 1,
-                         description: str | None = None) -> bool:
+                         description: str | None = None,
+                         session: VyOSConfigSession | None = None) -> bool:
         """Add a static route"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            base_cmd = f"set protocols static route {destination}"
-
-            if next_hop and interface:
-                session._send_and_sleep(f"{base_cmd} next-hop {next_hop}", 0.2)
-                session._send_and_sleep(f"{base_cmd} interface {interface}", 0.2)
-            elif next_hop:
-                session._send_and_sleep(f"{base_cmd} next-hop {next_hop}", 0.2)
-            elif interface:
-                session._send_and_sleep(f"{base_cmd} interface {interface}", 0.2)
-
-            if distance != 1:
-                session._send_and_sleep(f"{base_cmd} distance {distance}", 0.2)
-
-            if description:
-                session._send_and_sleep(f"{base_cmd} description '{description}'", 0.2)
-
-            result = session.commit(comment=f"Add static route {destination}")
-            return result
-        finally:
-            session.close()
-
-    def remove_static_route(self, destination: str) -> bool:
+        cmds = []
+        base_cmd = f"set protocols static route {destination}"
+
+        if next_hop and interface:
+            cmds.append(f"{base_cmd} next-hop {next_hop}")
+            cmds.append(f"{base_cmd} interface {interface}")
+        elif next_hop:
+            cmds.append(f"{base_cmd} next-hop {next_hop}")
+        elif interface:
+            cmds.append(f"{base_cmd} interface {interface}")
+
+        if distance != 1:
+            cmds.append(f"{base_cmd} distance {distance}")
+
+        if description:
+            cmds.append(f"{base_cmd} description {_quote(description)}")
+        return self._apply(cmds, f"Add static route {destination}", session)
+
+    def remove_static_route(self, destination: str,
+                            session: VyOSConfigSession | None = None) -> bool:
         """Remove a static route"""
-        session = VyOSConfigSession(self.ssh_client)
-        session.open()
-        session.enter_config_mode()
-        try:
-            session._send_and_sleep(f"delete protocols static route {destination}", 0.3)
-            result = session.commit(comment=f"Remove static route {destination}")
-            return result
-        finally:
-            session.close()
+        return self._apply([f"delete protocols static route {destination}"],
+                           f"Remove static route {destination}", session)
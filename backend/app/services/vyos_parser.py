@@ -1,10 +1,45 @@
 """VyOS Command Output Parser"""
 import re
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
-from typing import Any
-
-
-@dataclass
+from functools import partial
+
+# Interface header line, e.g. "eth0" or "eth0.10"
+_IFACE_HEADER_RE = re.compile(r"^[a-z]+[0-9]+(?:\.[0-9]+)*$")
+# Connected or static route row. The attributes are optional lookaheads from
+# the same position, so they are found in any order within the line, and
+# the whole output is scanned by the regex engine in one pass
+_ROUTE_RE = re.compile(
+    r"^[ \t]*(?P<code>[CS])[ \t]+(?P<dest>\S+)"
+    r"(?=(?:[^\n]*?(?<!\S)via[ \t]+(?P<gateway>\S+))?)"
+    r"(?=(?:[^\n]*?(?<!\S)dev[ \t]+(?P<interface>\S+))?)"
+    r"(?=(?:[^\n]*?(?<!\S)metric[ \t]+(?P<metric>\d+)(?!\S))?)",
+    re.MULTILINE,
+)
+# Route code in the first column -> route type
+_ROUTE_TYPES: dict[str, str] = {
+    "C": "connected",
+    "S": "static",
+    "K": "kernel",
+    "B": "BGP",
+    "O": "OSPF",
+    "R": "RIP",
+}
+# Two or more spaces between table columns
+_MULTISPACE_RE = re.compile(r"\s{2,}")
+
+# "Key: value" interface property -> (field, converter)
+_IFACE_FIELDS = {
+    "Description": ("description", str.strip),
+    "MAC Address": ("mac_address", str.strip),
+    "Status": ("status", str.strip),
+    "MTU": ("mtu", int),
+    "Speed": ("speed", str.strip),
+    "Duplex": ("duplex", str.strip),
+}
+
+
+@dataclass(slots=True)
 class ParsedInterface:
     """Parsed network interface information"""
 
@@ -18,7 +53,7 @@ class ParsedInterface:
     duplex: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedRoute:
     """Parsed routing information"""
 
@@ -33,114 +68,90 @@ class VyOSOutputParser:
     """Parser for VyOS command output"""
 
     @staticmethod
-    def parse_interfaces(output: str) -> list[ParsedInterface]:
-        """Parse interface list from 'show interfaces' command
+    def iter_interfaces(output: str) -> Iterator[ParsedInterface]:
+        """Parse interface list from 'show interfaces' command, one at a time
 
         Args:
             output: Command output
 
-        Returns:
-            List of ParsedInterface objects
+        Yields:
+            ParsedInterface objects as each one is complete
         """
-        interfaces: list[ParsedInterface] = []
-        current_interface: dict[str, Any] | None = None
+        current: ParsedInterface | None = None
 
-        for line in output.split("\n"):
+        for line in output.splitlines():
             line = line.strip()
 
             # Detect interface header (e.g., "eth0")
-            if re.match(r"^[a-z]+[0-9]+(\.[0-9]+)*$", line):
-                if current_interface:
-                    interfaces.append(ParsedInterface(**current_interface))
+            if _IFACE_HEADER_RE.match(line):
+                if current is not None:
+                    yield current
 
-                current_interface = {"name": line, "ip_addresses": []}
+                # Fill the record in place rather than through a kwargs dict
+                current = ParsedInterface(name=line, ip_addresses=[])
                 continue
 
             # Parse interface properties
-            if current_interface:
-                if "Description:" in line:
-                    current_interface["description"] = line.split("Description:")[1].strip()
-                elif "MAC Address:" in line:
-                    current_interface["mac_address"] = line.split("MAC Address:")[1].strip()
-                elif "Status:" in line:
-                    current_interface["status"] = line.split("Status:")[1].strip()
-                elif "MTU:" in line:
-                    current_interface["mtu"] = int(line.split("MTU:")[1].strip())
-                elif "Speed:" in line:
-                    current_interface["speed"] = line.split("Speed:")[1].strip()
-                elif "Duplex:" in line:
-                    current_interface["duplex"] = line.split("Duplex:")[1].strip()
-                elif re.match(r"^\s*(IPv4|IPv6):", line):
-                    ip = line.split(":")[1].strip()
-                    if current_interface["ip_addresses"]:
-                        current_interface["ip_addresses"].append(ip)
-
-        # Add last interface
-        if current_interface:
-            interfaces.append(ParsedInterface(**current_interface))
-
-        return interfaces
+            if current is not None:
+                # One partition per line; the value keeps any further colons
+                key, sep, value = line.partition(":")
+                if not sep:
+                    continue
+                if key in _IFACE_FIELDS:
+                    field, convert = _IFACE_FIELDS[key]
+                    setattr(current, field, convert(value))
+                elif key in ("IPv4", "IPv6"):
+                    current.ip_addresses.append(value.strip())
+
+        # Last interface
+        if current is not None:
+            yield current
 
     @staticmethod
-    def parse_routes(output: str) -> list[ParsedRoute]:
-        """Parse routing table from 'show ip route' command
+    def parse_interfaces(output: str) -> list[ParsedInterface]:
+        """Parse interface list from 'show interfaces' command
 
         Args:
             output: Command output
 
         Returns:
-            List of ParsedRoute objects
+            List of ParsedInterface objects
         """
-        routes: list[ParsedRoute] = []
+        return list(VyOSOutputParser.iter_interfaces(output))
+
+    @staticmethod
+    def iter_routes(output: str) -> Iterator[ParsedRoute]:
+        """Parse routing table from 'show ip route' command, one route at a time
+
+        Args:
+            output: Command output
 
+        Yields:
+            ParsedRoute objects
+        """
         # Example VyOS route output format:
         # C    192.168.1.0/24 dev eth0 proto kernel scope link src 192.168.1.1
         # S    0.0.0.0/0 via 192.168.1.254 dev eth0
+        for match in _ROUTE_RE.finditer(output):
+            yield ParsedRoute(
+                destination=match["dest"],
+                gateway=match["gateway"],
+                interface=match["interface"],
+                metric=int(match["metric"]) if match["metric"] else None,
+                route_type=_ROUTE_TYPES.get(match["code"], "unknown"),
+            )
 
-        for line in output.split("\n"):
-            line = line.strip()
+    @staticmethod
+    def parse_routes(output: str) -> list[ParsedRoute]:
+        """Parse routing table from 'show ip route' command
 
-            # Skip empty lines and headers
-            if not line or line.startswith("Destination"):
-                continue
+        Args:
+            output: Command output
 
-            # Parse route
-            if re.match(r"^[CS]\s+", line):
-                parts = line.split()
-                if len(parts) >= 2:
-                    route_type_code = parts[0]
-                    destination = parts[1]
-
-                    route_type = {
-                        "C": "connected",
-                        "S": "static",
-                        "K": "kernel",
-                        "B": "BGP",
-                        "O": "OSPF",
-                        "R": "RIP",
-                    }.get(route_type_code, "unknown")
-
-                    gateway = None
-                    interface = None
-
-                    # Find gateway and interface
-                    for i, part in enumerate(parts):
-                        if part == "via" and i + 1 < len(parts):
-                            gateway = parts[i + 1]
-                        elif part == "dev" and i + 1 < len(parts):
-                            interface = parts[i + 1]
-                            break
-
-                    routes.append(
-                        ParsedRoute(
-                            destination=destination,
-                            gateway=gateway,
-                            interface=interface,
-                            route_type=route_type,
-                        )
-                    )
-
-        return routes
+        Returns:
+            List of ParsedRoute objects
+        """
+        return list(VyOSOutputParser.iter_routes(output))
 
     @staticmethod
     def parse_system_info(output: str) -> dict[str, str]:
@@ -154,12 +165,12 @@ class VyOSOutputParser:
         """
         info: dict[str, str] = {}
 
-        for line in output.split("\n"):
+        for line in output.splitlines():
             line = line.strip()
 
             # Parse key-value pairs
-            if ":" in line:
-                key, value = line.split(":", 1)
+            key, sep, value = line.partition(":")
+            if sep:
                 info[key.strip().lower().replace(" ", "_")] = value.strip()
 
         return info
@@ -177,54 +188,68 @@ class VyOSOutputParser:
         """
         result: dict[str, str] = {}
 
-        for line in output.split("\n"):
+        for line in output.splitlines():
             line = line.strip()
 
-            if separator in line:
-                key, value = line.split(separator, 1)
+            key, sep, value = line.partition(separator)
+            if sep:
                 result[key.strip()] = value.strip()
 
         return result
 
     @staticmethod
-    def parse_table(output: str, delimiter: str = None) -> list[dict[str, str]]:
-        """Parse tabular output
+    def iter_table(output: str, delimiter: str = None) -> Iterator[dict[str, str]]:
+        """Parse tabular output, one row at a time
 
         Args:
             output: Command output
             delimiter: Column delimiter (auto-detect if None)
 
-        Returns:
-            List of dictionaries with column names as keys
+        Yields:
+            Dictionaries with column names as keys
         """
-        lines = [line.strip() for line in output.split("\n") if line.strip()]
+        lines = (line for line in map(str.strip, output.splitlines()) if line)
 
-        if len(lines) < 2:
-            return []
+        header = next(lines, None)
+        if header is None:
+            return
 
         # Auto-detect delimiter
         if delimiter is None:
             # Look for common delimiters
-            if "\t" in lines[0]:
+            if "\t" in header:
                 delimiter = "\t"
-            elif re.search(r"\s{2,}", lines[0]):
+            elif _MULTISPACE_RE.search(header):
                 delimiter = r"\s+"
             else:
                 delimiter = " "
 
+        # Pick the splitter once: str methods for literal delimiters, a
+        # pattern compiled once per call otherwise
+        split: Callable[[str], list[str]]
+        if delimiter == " ":
+            split = str.split
+        elif delimiter == "\t":
+            split = partial(str.split, sep="\t")
+        else:
+            split = re.compile(delimiter).split
+
         # Parse header
-        headers = re.split(delimiter, lines[0]) if delimiter != " " else lines[0].split()
+        headers = [column.strip() for column in split(header)]
 
         # Parse rows
-        rows: list[dict[str, str]] = []
-        for line in lines[1:]:
-            values = re.split(delimiter, line) if delimiter != " " else line.split(delimiter)
+        for line in lines:
+            yield {column: value.strip() for column, value in zip(headers, split(line))}
 
-            row: dict[str, str] = {}
-            for i, header in enumerate(headers):
-                if i < len(values):
-                    row[header.strip()] = values[i].strip()
+    @staticmethod
+    def parse_table(output: str, delimiter: str = None) -> list[dict[str, str]]:
+        """Parse tabular output
 
-            rows.append(row)
+        Args:
+            output: Command output
+            delimiter: Column delimiter (auto-detect if None)
 
-        return rows
+        Returns:
+            List of dictionaries with column names as keys
+        """
+        return list(VyOSOutputParser.iter_table(output, delimiter))
@@ -1,4 +1,6 @@
 """VyOS service for SSH command execution"""
+import socket
+
 import paramiko
 from loguru import logger
 
@@ -38,6 +40,12 @@ class VyOSService:
             password=self.password,
             timeout=self.timeout,
         )
+        transport = self.client.get_transport()
+        if transport:
+            # The connection is kept for later commands: keep it alive and
+            # send small command writes without Nagle delay
+            transport.set_keepalive(30)
+            transport.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
         logger.info(f"Connected to VyOS at {self.host}")
 
     def disconnect(self) -> None:
@@ -47,16 +55,40 @@ class VyOSService:
             self.client = None
             logger.info("Disconnected from VyOS")
 
+    def is_connected(self) -> bool:
+        """Check that the SSH transport is still up"""
+        transport = self.client.get_transport() if self.client else None
+        return transport is not None and transport.is_active()
+
     def execute_command(self, command: str) -> str:
-        """Execute a command on VyOS and return output"""
-        if not self.client:
-            raise RuntimeError("Not connected to VyOS")
+        """Execute a command on VyOS and return output
+
+        Commands share one SSH connection, each on its own channel; the
+        connection is (re)opened on first use or after it dropped.
+        """
+        if not self.is_connected():
+            self.disconnect()
+            self.connect()
 
         logger.debug(f"Executing command: {command}")
-        stdin, stdout, stderr = self.client.exec_command(command, timeout=self.timeout)
+        channel = self.client.get_transport().open_session()
+        try:
+            channel.settimeout(self.timeout)
+            channel.exec_command(command)
+            channel.shutdown_write()
+            # Collect chunks in one growable buffer and decode once, instead
+            # of file-wrapper reads that hold extra copies of large outputs
+            buf = bytearray()
+            while chunk := channel.recv(65536):
+                buf += chunk
+            err = bytearray()
+            while chunk := channel.recv_stderr(65536):
+                err += chunk
+        finally:
+            channel.close()
 
-        output = stdout.read().decode("utf-8")
-        error = stderr.read().decode("utf-8")
+        output = buf.decode("utf-8")
+        error = err.decode("utf-8")
 
         if error:
             logger.warning(f"Command error: {error}")
@@ -1,8 +1,38 @@
 """VyOS SSH Connection and Authentication Module"""
+import socket
+import threading
+from typing import Any
+
 import paramiko
 from loguru import logger
 from pydantic import BaseModel
 
+# AEAD ciphers need no separate MAC pass and ETM MACs are cheaper to verify;
+# both are moved to the front, paramiko's other defaults stay as fallbacks
+PREFERRED_CIPHERS = ("aes128-gcm@openssh.com", "aes256-gcm@openssh.com")
+PREFERRED_MACS = ("hmac-sha2-256-etm@openssh.com", "hmac-sha2-512-etm@openssh.com")
+# Legacy algorithms that are never offered
+DISABLED_ALGORITHMS = {
+    "ciphers": ["3des-cbc", "aes128-cbc", "aes192-cbc", "aes256-cbc"],
+    "macs": ["hmac-md5", "hmac-md5-96", "hmac-sha1-96"],
+    "kex": ["diffie-hellman-group1-sha1", "diffie-hellman-group-exchange-sha1"],
+}
+
+
+def _prefer(available: tuple[str, ...], preferred: tuple[str, ...]) -> tuple[str, ...]:
+    """Reorder available algorithms so the preferred ones come first"""
+    first = tuple(name for name in preferred if name in available)
+    return first + tuple(name for name in available if name not in first)
+
+
+def _transport_factory(sock, **kwargs) -> paramiko.Transport:
+    """Build a transport that negotiates the fast algorithms when the peer has them"""
+    transport = paramiko.Transport(sock, **kwargs)
+    options = transport.get_security_options()
+    options.ciphers = _prefer(options.ciphers, PREFERRED_CIPHERS)
+    options.digests = _prefer(options.digests, PREFERRED_MACS)
+    return transport
+
 
 class VyOSSSHConfig(BaseModel):
     """VyOS SSH connection configuration"""
@@ -25,24 +55,34 @@ class VyOSSSHClient:
         self.config = config
         self.client: paramiko.SSHClient | None = None
         self._connected = False
+        # A shared client may be (re)connected from several request threads
+        self._connect_lock = threading.Lock()
 
     def connect(self) -> None:
-        """Establish SSH connection to VyOS"""
-        if self._connected and self.client:
-            return
-
+        """Establish SSH connection to VyOS, or re-establish one that dropped"""
+        with self._connect_lock:
+            if self.is_connected():
+                return
+            if self.client:
+                self.disconnect()
+            self._connect()
+
+    def _connect(self) -> None:
+        """Open a new SSH connection (caller holds the connect lock)"""
         try:
             self.client = paramiko.SSHClient()
             self.client.set_missing_host_key_policy(paramiko.WarningPolicy())
 
             # Prepare authentication
-            auth_kwargs: dict[str, int | str] = {
+            auth_kwargs: dict[str, Any] = {
                 "hostname": self.config.host,
                 "port": self.config.port,
                 "username": self.config.username,
                 "timeout": self.config.timeout,
                 "allow_agent": False,
                 "look_for_keys": False,
+                "disabled_algorithms": DISABLED_ALGORITHMS,
+                "transport_factory": _transport_factory,
             }
 
             # Use private key if provided
@@ -57,9 +97,13 @@ class VyOSSSHClient:
 
             self.client.connect(**auth_kwargs)
 
-            # Enable keepalive
-            if self.client.get_transport():
-                self.client.get_transport().set_keepalive(self.config.keepalive_interval)
+            transport = self.client.get_transport()
+            if transport:
+                # Enable keepalive
+                transport.set_keepalive(self.config.keepalive_interval)
+                # Commands and prompts are small writes; don't let Nagle hold
+                # them back waiting for the peer's delayed ACK
+                transport.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
             self._connected = True
             logger.info(f"SSH connected to {self.config.username}@{self.config.host}:{self.config.port}")
@@ -84,8 +128,11 @@ class VyOSSSHClient:
                 logger.info("SSH disconnected")
 
     def is_connected(self) -> bool:
-        """Check if client is connected"""
-        return self._connected and self.client is not None
+        """Check if client is connected and its transport is still up"""
+        if not (self._connected and self.client is not None):
+            return False
+        transport = self.client.get_transport()
+        return transport is not None and transport.is_active()
 
     def __enter__(self):
         """Context manager entry"""
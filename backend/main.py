@@ -1,19 +1,34 @@
 """VyOS Web API - Main Application Entry Point"""
 import os
+import stat
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
 from loguru import logger
 from pydantic import BaseModel
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.responses import Response
+from starlette.types import Scope
 
+from app.core.config import settings
+from app.services.ssh_pool import ssh_pool
 from app.api.v1 import auth, backup, logs, network, system, users, vpn
 from app.api.v1 import firewall_final as firewall
 from app.api.v1 import bgp, isis
 
 BACKEND_VERSION = "0.0.1-20250221"
 
+
+def _is_dir(path: Path) -> bool:
+    """Check for a directory with a single stat() call"""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
 # Determine static files path - check common locations
 STATIC_PATHS = [
     Path("../frontend/dist"),
@@ -22,16 +37,34 @@ STATIC_PATHS = [
 ]
 
 static_dir = None
-for path in STATIC_PATHS:
-    if path.exists() and path.is_dir():
-        static_dir = path
-        logger.info(f"Found static files at: {static_dir}")
-        break
+if settings.vyos_static_dir:
+    # Set at install/build time: skip probing
+    if _is_dir(Path(settings.vyos_static_dir)):
+        static_dir = Path(settings.vyos_static_dir)
+    else:
+        logger.warning(f"VYOS_STATIC_DIR {settings.vyos_static_dir} is not a directory; "
+                       "serving the API without static files")
+else:
+    for path in STATIC_PATHS:
+        if _is_dir(path):
+            static_dir = path
+            logger.info(f"Found static files at: {static_dir}")
+            break
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Share one SSH connection pool across requests; close it on shutdown"""
+    app.state.ssh_pool = ssh_pool
+    yield
+    ssh_pool.close()
+
 
 app = FastAPI(
     title="VyOS Web API",
     description="API for VyOS router management",
     version=BACKEND_VERSION,
+    lifespan=lifespan,
 )
 
 # CORS middleware configuration - allow all for development
@@ -74,21 +107,42 @@ async def get_version() -> VersionResponse:
     return VersionResponse(backend_version=BACKEND_VERSION)
 
 
+class SPAStaticFiles(StaticFiles):
+    """Static files that fall back to index.html for SPA routes
+
+    The frontend build does not change while the server runs, so the
+    directory is walked once and lookups are answered from that snapshot
+    instead of calling stat() per request.
+    """
+
+    def __init__(self, *, directory: str, **kwargs) -> None:
+        super().__init__(directory=directory, **kwargs)
+        # Relative path ("." for the root) -> (full path, stat result)
+        self._files: dict[str, tuple[str, os.stat_result]] = {}
+        for root, _dirs, names in os.walk(directory):
+            for name in (".", *names):
+                full_path = os.path.realpath(os.path.join(root, name))
+                rel_path = os.path.normpath(os.path.relpath(os.path.join(root, name), directory))
+                self._files[rel_path] = (full_path, os.stat(full_path))
+
+    def lookup_path(self, path: str) -> tuple[str, os.stat_result | None]:
+        return self._files.get(path, ("", None))
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        try:
+            return await super().get_response(path, scope)
+        except StarletteHTTPException as e:
+            if e.status_code != 404 or "index.html" not in self._files:
+                raise
+            full_path, stat_result = self._files["index.html"]
+            return self.file_response(full_path, stat_result, scope)
+
+
 # Serve static files (frontend) if available
 if static_dir:
     logger.info(f"Mounting static files from: {static_dir}")
-    app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
-
-    @app.get("/{path:path}")
-    async def serve_frontend(path: str):
-        """Serve frontend application - handle SPA routing"""
-        if path and (static_dir / path).exists() and not (static_dir / path).is_dir():
-            return FileResponse(str(static_dir / path))
-        # Fallback to index.html for SPA routing
-        index_path = static_dir / "index.html"
-        if index_path.exists():
-            return FileResponse(str(index_path))
-        return {"message": "Frontend not available", "version": BACKEND_VERSION}
+    # Mounted last so the API routes above still match first
+    app.mount("/", SPAStaticFiles(directory=str(static_dir), html=True), name="spa")
 else:
     logger.warning("No static files directory found, frontend will not be served")
 
@@ -7,23 +7,44 @@ import time
 import subprocess
 import threading
 import requests
+from requests.adapters import HTTPAdapter
 
 def read_backend_output(proc):
     """Read and print backend output"""
     for line in proc.stdout:
         print(f"[BACKEND] {line}", end="")
 
+
+def wait_for_server(proc, base_url, timeout=30):
+    """Poll /health with exponential backoff until the server answers"""
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline and proc.poll() is None:
+        try:
+            if requests.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+    return False
+
+
 def test_api_endpoints():
     """Test API endpoints"""
     base_url = "http://127.0.0.1:8000"
 
+    # One keep-alive connection for all probes
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+
     print("\n" + "=" * 70)
     print("Testing API Endpoints")
     print("=" * 70)
 
     # Root
     try:
-        r = requests.get(f"{base_url}/", timeout=5)
+        r = session.get(f"{base_url}/", timeout=5)
         print(f"\nGET / - {r.status_code}")
         print(f"  Response: {r.json()}")
     except Exception as e:
@@ -31,7 +52,7 @@ def test_api_endpoints():
 
     # Health
     try:
-        r = requests.get(f"{base_url}/health", timeout=5)
+        r = session.get(f"{base_url}/health", timeout=5)
         print(f"\nGET /health - {r.status_code}")
         print(f"  Response: {r.json()}")
     except Exception as e:
@@ -39,7 +60,7 @@ def test_api_endpoints():
 
     # System Info
     try:
-        r = requests.get(f"{base_url}/api/v1/system/info", timeout=15)
+        r = session.get(f"{base_url}/api/v1/system/info", timeout=15)
         print(f"\nGET /api/v1/system/info - {r.status_code}")
         if r.status_code == 200:
             data = r.json()
@@ -53,7 +74,7 @@ def test_api_endpoints():
 
     # Network Interfaces
     try:
-        r = requests.get(f"{base_url}/api/v1/network/interfaces", timeout=15)
+        r = session.get(f"{base_url}/api/v1/network/interfaces", timeout=15)
         print(f"\nGET /api/v1/network/interfaces - {r.status_code}")
         if r.status_code == 200:
             data = r.json()
@@ -67,7 +88,7 @@ def test_api_endpoints():
 
     # Routes
     try:
-        r = requests.get(f"{base_url}/api/v1/network/routes", timeout=15)
+        r = session.get(f"{base_url}/api/v1/network/routes", timeout=15)
         print(f"\nGET /api/v1/network/routes - {r.status_code}")
         if r.status_code == 200:
             data = r.json()
@@ -79,7 +100,7 @@ def test_api_endpoints():
 
     # ARP Table
     try:
-        r = requests.get(f"{base_url}/api/v1/network/arp-table", timeout=15)
+        r = session.get(f"{base_url}/api/v1/network/arp-table", timeout=15)
         print(f"\nGET /api/v1/network/arp-table - {r.status_code}")
         if r.status_code == 200:
             data = r.json()
@@ -93,6 +114,8 @@ def test_api_endpoints():
     print("API Docs: http://127.0.0.1:8000/docs")
     print("=" * 70)
 
+    session.close()
+
 
 def main():
     """Main function"""
@@ -126,12 +149,14 @@ def main():
         )
         output_thread.start()
 
-        print("Waiting for server to start (5 seconds)...")
-        time.sleep(5)
+        print("Waiting for server to start...")
+        ready = wait_for_server(proc, "http://127.0.0.1:8000")
 
         if proc.poll() is not None:
             print(f"Backend exited with code: {proc.returncode}")
             return 1
+        if not ready:
+            print("Server did not answer /health in time")
 
         # Test endpoints
         test_api_endpoints()
@@ -141,11 +166,9 @@ def main():
         print("\nNext step: Start frontend in another terminal:")
         print("  cd ../frontend && npm run dev")
 
-        while True:
-            time.sleep(1)
-            if proc.poll() is not None:
-                print(f"\nBackend exited with code: {proc.returncode}")
-                break
+        # Block until the backend exits (or Ctrl+C) instead of polling
+        proc.wait()
+        print(f"\nBackend exited with code: {proc.returncode}")
 
     except KeyboardInterrupt:
         print("\n\nStopping...")
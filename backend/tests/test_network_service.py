@@ -0,0 +1,50 @@
+"""Tests for NetworkConfigService write paths"""
+from unittest.mock import MagicMock
+
+from app.services import network
+from app.services.network import NetworkConfigService
+from app.services.vyos_command import CommandResult, CommandStatus
+
+
+def _result(command: str, stdout: str = "") -> CommandResult:
+    return CommandResult(
+        status=CommandStatus.SUCCESS,
+        stdout=stdout,
+        stderr="",
+        exit_code=0,
+        command=command,
+        execution_time=0.0,
+    )
+
+
+def _service() -> tuple[NetworkConfigService, MagicMock]:
+    executor = MagicMock()
+    executor.ssh_client.config.host = "192.0.2.1"
+    executor.ssh_client.config.port = 22
+    executor.execute.side_effect = lambda command: _result(command)
+    executor.configure.side_effect = lambda commands: _result(str(commands))
+    return NetworkConfigService(executor), executor
+
+
+def test_delete_route_configures_through_executor():
+    service, executor = _service()
+
+    assert service.delete_route("10.0.0.0/24") is True
+    executor.configure.assert_called_once_with("delete protocols static route 10.0.0.0/24")
+
+
+def test_write_drops_show_output_cached_during_change():
+    service, executor = _service()
+    command = "show ip route"
+
+    def configure(commands):
+        # A concurrent poll lands while the commit is still running
+        service._show(command)
+        return _result(str(commands))
+
+    executor.configure.side_effect = configure
+    service.delete_route("10.0.0.0/24")
+
+    assert all(key[2] != command for key in network._show_cache)
+    service._show(command)
+    assert executor.execute.call_count == 2
@@ -0,0 +1,82 @@
+"""Tests for the interactive configure-mode session"""
+import select
+import socket
+import threading
+import time
+
+from app.services.vyos_config import VyOSConfigSession
+
+PROMPT = b"\r\n[edit]\r\nvyos@vyos# "
+
+
+class _FakeShell:
+    """Channel-like end of a socketpair"""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.closed = False
+
+    def fileno(self) -> int:
+        return self.sock.fileno()
+
+    def recv(self, size: int) -> bytes:
+        return self.sock.recv(size)
+
+    def recv_ready(self) -> bool:
+        return bool(select.select([self.sock], [], [], 0)[0])
+
+    def sendall(self, data: bytes) -> None:
+        self.sock.sendall(data)
+
+    def close(self) -> None:
+        self.closed = True
+        self.sock.close()
+
+
+def _slow_shell(delay: float) -> tuple[VyOSConfigSession, list[str]]:
+    """Session on a shell that answers each line after delay seconds"""
+    ours, theirs = socket.socketpair()
+    received: list[str] = []
+
+    def serve():
+        buf = b""
+        while True:
+            data = theirs.recv(4096)
+            if not data:
+                return
+            buf += data
+            while b"\n" in buf:
+                line, buf = buf.split(b"\n", 1)
+                time.sleep(delay)
+                received.append(line.decode())
+                theirs.sendall(line + PROMPT)
+
+    threading.Thread(target=serve, daemon=True).start()
+    session = VyOSConfigSession(ssh_client=None)
+    session.shell = _FakeShell(ours)
+    session.in_config_mode = True
+    return session, received
+
+
+def test_send_batch_waits_for_every_prompt():
+    session, received = _slow_shell(0.15)
+
+    session.send_batch(["set a", "set b", "set c", "set d"])
+    assert received == ["set a", "set b", "set c", "set d"]
+
+    assert session.commit(comment="test") is True
+    assert received[-1] == 'commit comment "test"'
+    assert session.pending_changes is False
+    session.close()
+
+
+def test_commit_reads_an_outstanding_prompt_first():
+    session, received = _slow_shell(0.3)
+    session.shell.sendall(b"set a\n")
+    session._read_until_prompt(timeout=0.05)
+    assert session.awaiting_prompt
+
+    session.pending_changes = True
+    assert session.commit() is True
+    assert received == ["set a", "commit"]
+    session.close()
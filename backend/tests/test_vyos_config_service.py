@@ -0,0 +1,47 @@
+"""Tests for VyOSConfigService session handling"""
+from contextlib import contextmanager
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services import vyos_config_service
+from app.services.vyos_config import VyOSConfigSession
+from app.services.vyos_config_service import VyOSConfigService
+
+
+@pytest.fixture
+def service(monkeypatch):
+    session = MagicMock()
+    session.command_failed = VyOSConfigSession.command_failed
+
+    @contextmanager
+    def checkout(ssh_client):
+        yield session
+
+    monkeypatch.setattr(vyos_config_service.session_pool, "checkout", checkout)
+    ssh_client = MagicMock()
+    ssh_client.config.host = "192.0.2.1"
+    ssh_client.config.port = 22
+    ssh_client.config.username = "vyos"
+    return VyOSConfigService(ssh_client), session
+
+
+def test_staged_command_rejected_by_vyos_fails(service):
+    config_service, session = service
+    session.send_batch.return_value = (
+        "set nat source rule 10 protocol bogus\r\n"
+        "  Invalid value\r\n  Set failed\r\n\r\n[edit]\r\nvyos@vyos# "
+    )
+
+    assert config_service.remove_static_route("10.0.0.0/8", session=session) is False
+
+
+def test_request_session_raises_when_commit_fails(service):
+    config_service, session = service
+    session.send_batch.return_value = "[edit]\r\nvyos@vyos# "
+    session.pending_changes = True
+    session.commit.return_value = False
+
+    with pytest.raises(RuntimeError, match="commit failed"):
+        with config_service.request_session(comment="test") as staged:
+            assert config_service.remove_static_route("10.0.0.0/8", session=staged) is True
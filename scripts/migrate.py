@@ -5,19 +5,59 @@ Handles configuration and data migration between versions
 """
 
 import argparse
+import functools
+import io
 import json
 import os
+import re
 import shutil
 import subprocess
 import sys
+import tarfile
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 
 CONFIG_DIR = Path("/config/vyos-webui")
 BACKUP_DIR = Path("/config/vyos-webui/backups")
 ETC_DIR = Path("/etc/vyos-webui")
 VERSION_FILE = Path("/opt/vyos-webui/VERSION")
+VERSION_PART_RE = re.compile(r"\d+")
+
+# Fastest available backup compressor: (archive suffix, command compressing a
+# tar stream from stdin to stdout), or None to gzip in-process
+if shutil.which("zstd"):
+    BACKUP_COMPRESSOR = (".tar.zst", ["zstd", "-T0", "-3", "-q"])
+elif shutil.which("pigz"):
+    BACKUP_COMPRESSOR = (".tar.gz", ["pigz", "-6"])
+else:
+    BACKUP_COMPRESSOR = None
+
+
+def atomic_write(path: Path, data: str) -> None:
+    """Replace a file's contents so a crash never leaves it half-written"""
+    # Nothing to do (and nothing to fsync) when the content is unchanged
+    try:
+        if path.read_text() == data:
+            return
+    except FileNotFoundError:
+        pass
+
+    tmp = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    with open(tmp, "w") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    # Persist the rename itself
+    dir_fd = os.open(path.parent, os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
 
 
 def get_current_version() -> str:
@@ -27,44 +67,117 @@ def get_current_version() -> str:
     return "1.0.0"
 
 
+@contextmanager
+def open_backup_archive(tar_path: Path) -> Iterator[tarfile.TarFile]:
+    """Open a backup archive for writing, compressed with BACKUP_COMPRESSOR"""
+    if BACKUP_COMPRESSOR is None:
+        with tarfile.open(tar_path, "w:gz", compresslevel=6) as tar:
+            yield tar
+        return
+
+    with open(tar_path, "wb") as out:
+        proc = subprocess.Popen(BACKUP_COMPRESSOR[1], stdin=subprocess.PIPE, stdout=out)
+        try:
+            with tarfile.open(fileobj=proc.stdin, mode="w|") as tar:
+                yield tar
+        finally:
+            proc.stdin.close()
+            if proc.wait() != 0:
+                raise subprocess.CalledProcessError(proc.returncode, BACKUP_COMPRESSOR[1])
+
+
 def create_backup(version: str) -> Path:
     """Create a backup of current configuration"""
     BACKUP_DIR.mkdir(parents=True, exist_ok=True)
 
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_name = f"vyos-webui-backup-v{version}-{timestamp}"
-    backup_path = BACKUP_DIR / backup_name
-
-    print(f"Creating backup at: {backup_path}")
-
-    # Backup config directory
-    if CONFIG_DIR.exists():
-        shutil.copytree(CONFIG_DIR, backup_path / "config")
-
-    # Backup etc directory
-    if ETC_DIR.exists():
-        shutil.copytree(ETC_DIR, backup_path / "etc")
+    suffix = BACKUP_COMPRESSOR[0] if BACKUP_COMPRESSOR else ".tar.gz"
+    tar_path = BACKUP_DIR / f"{backup_name}{suffix}"
+
+    print(f"Creating backup at: {tar_path}")
+
+    def skip_backups(info: tarfile.TarInfo) -> tarfile.TarInfo | None:
+        # BACKUP_DIR lives inside CONFIG_DIR; never archive old backups
+        if info.name == f"{backup_name}/config/{BACKUP_DIR.name}":
+            return None
+        return info
+
+    # Stream both directories straight into the archive, no staging copy
+    with open_backup_archive(tar_path) as tar:
+        # Backup config directory
+        if CONFIG_DIR.exists():
+            tar.add(CONFIG_DIR, arcname=f"{backup_name}/config", filter=skip_backups)
+
+        # Backup etc directory
+        if ETC_DIR.exists():
+            tar.add(ETC_DIR, arcname=f"{backup_name}/etc")
+
+        # Create metadata
+        metadata = {
+            "version": version,
+            "timestamp": timestamp,
+            "backup_name": backup_name,
+        }
+        data = json.dumps(metadata, indent=2).encode()
+        info = tarfile.TarInfo(f"{backup_name}/metadata.json")
+        info.size = len(data)
+        info.mtime = int(time.time())
+        tar.addfile(info, io.BytesIO(data))
 
-    # Create metadata
-    metadata = {
-        "version": version,
-        "timestamp": timestamp,
-        "backup_name": backup_name,
-    }
-    (backup_path / "metadata.json").write_text(json.dumps(metadata, indent=2))
+    print(f"Backup created: {tar_path}")
+    return tar_path
 
-    # Create tar archive
-    tar_path = BACKUP_DIR / f"{backup_name}.tar.gz"
-    subprocess.run(
-        ["tar", "-czf", str(tar_path), "-C", str(BACKUP_DIR), backup_name],
-        check=True,
-    )
 
-    # Remove the temporary directory
-    shutil.rmtree(backup_path)
+@contextmanager
+def open_backup_for_reading(backup_path: Path) -> Iterator[tarfile.TarFile]:
+    """Open a backup archive as a tar stream, decompressing zstd archives with zstd"""
+    if backup_path.suffix != ".zst":
+        with tarfile.open(backup_path, "r|*") as tar:
+            yield tar
+        return
 
-    print(f"Backup created: {tar_path}")
-    return tar_path
+    cmd = ["zstd", "-dcq", str(backup_path)]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+    try:
+        with tarfile.open(fileobj=proc.stdout, mode="r|") as tar:
+            yield tar
+        # Drain the tar padding so zstd does not die writing into a closed pipe
+        while proc.stdout.read(65536):
+            pass
+    finally:
+        proc.stdout.close()
+        if proc.wait() != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def swap_directory(staging: Path, target: Path, keep: Path | None = None) -> None:
+    """Replace target with a fully extracted staging directory
+
+    The keep entry (the backups, which live inside CONFIG_DIR) is moved over
+    from the old directory rather than restored. If the swap fails, target
+    and keep are left where they were and the OSError is raised.
+    """
+    kept = keep is not None and keep.exists()
+    if kept:
+        os.replace(keep, staging / keep.name)
+    old = target.with_name(f".{target.name}.old")
+    try:
+        if target.exists():
+            shutil.rmtree(old, ignore_errors=True)
+            os.replace(target, old)
+            try:
+                os.replace(staging, target)
+            except OSError:
+                os.replace(old, target)
+                raise
+        else:
+            os.replace(staging, target)
+    except OSError:
+        if kept:
+            os.replace(staging / keep.name, keep)
+        raise
+    shutil.rmtree(old, ignore_errors=True)
 
 
 def restore_backup(backup_path: Path) -> bool:
@@ -73,43 +186,65 @@ def restore_backup(backup_path: Path) -> bool:
         print(f"Error: Backup not found: {backup_path}")
         return False
 
-    temp_dir = BACKUP_DIR / "temp_restore"
-    temp_dir.mkdir(parents=True, exist_ok=True)
+    # Archive section -> directory it restores to
+    targets = {"config": CONFIG_DIR, "etc": ETC_DIR}
+    # Section -> sibling directory it is extracted into before the swap
+    staged: dict[str, Path] = {}
 
+    print(f"Extracting backup: {backup_path}")
+    # Extract next to the live directories so nothing is touched until the
+    # whole archive has been read, then swap each one in with a rename
     try:
-        print(f"Extracting backup: {backup_path}")
-        subprocess.run(
-            ["tar", "-xzf", str(backup_path), "-C", str(temp_dir)],
-            check=True,
-        )
-
-        # Find the extracted directory
-        extracted = list(temp_dir.iterdir())[0] if list(temp_dir.iterdir()) else None
-        if not extracted:
-            print("Error: No files found in backup")
-            return False
-
-        # Restore config directory
-        config_src = extracted / "config"
-        if config_src.exists():
-            if CONFIG_DIR.exists():
-                shutil.rmtree(CONFIG_DIR)
-            shutil.copytree(config_src, CONFIG_DIR)
-
-        # Restore etc directory
-        etc_src = extracted / "etc"
-        if etc_src.exists():
-            if ETC_DIR.exists():
-                shutil.rmtree(ETC_DIR)
-            shutil.copytree(etc_src, ETC_DIR)
-
-        print("Backup restored successfully")
-        return True
+        with open_backup_for_reading(backup_path) as tar:
+            for member in tar:
+                # <backup_name>/<section>[/<path>]
+                parts = member.name.split("/", 2)
+                if len(parts) < 2 or parts[1] not in targets:
+                    continue
+                section = parts[1]
+                if section not in staged:
+                    target = targets[section]
+                    staging = target.with_name(f".{target.name}.restore")
+                    shutil.rmtree(staging, ignore_errors=True)
+                    staging.mkdir(parents=True)
+                    staged[section] = staging
+                if len(parts) == 2:
+                    continue
+
+                rel_path = parts[2]
+                if section == "config" and rel_path.split("/", 1)[0] == BACKUP_DIR.name:
+                    continue
+                if rel_path.startswith("/") or ".." in rel_path.split("/"):
+                    print(f"Warning: Skipping unsafe path in backup: {member.name}")
+                    continue
+                # Links could point extraction outside the target directory
+                if not (member.isfile() or member.isdir()):
+                    print(f"Warning: Skipping non-regular file in backup: {member.name}")
+                    continue
+                member.name = rel_path
+                tar.extract(member, path=staged[section])
+    except (tarfile.TarError, subprocess.CalledProcessError, OSError) as e:
+        print(f"Error: Could not read backup: {e}")
+        for staging in staged.values():
+            shutil.rmtree(staging, ignore_errors=True)
+        return False
 
-    finally:
-        # Cleanup
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
+    if not staged:
+        print("Error: No files found in backup")
+        return False
+
+    try:
+        for section, staging in staged.items():
+            target = targets[section]
+            swap_directory(staging, target, keep=BACKUP_DIR if target == CONFIG_DIR else None)
+    except OSError as e:
+        print(f"Error: Could not swap in restored files: {e}")
+        for staging in staged.values():
+            shutil.rmtree(staging, ignore_errors=True)
+        return False
+
+    print("Backup restored successfully")
+    return True
 
 
 def list_backups() -> list[Path]:
@@ -117,19 +252,32 @@ def list_backups() -> list[Path]:
     if not BACKUP_DIR.exists():
         return []
 
-    backups = sorted(
-        BACKUP_DIR.glob("vyos-webui-backup-*.tar.gz"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
-    return backups
+    # One directory scan; DirEntry caches its stat for the sort
+    with os.scandir(BACKUP_DIR) as it:
+        entries = [
+            (entry.stat().st_mtime, entry.name)
+            for entry in it
+            if entry.name.startswith("vyos-webui-backup-") and ".tar." in entry.name
+        ]
+    entries.sort(reverse=True)
+    return [BACKUP_DIR / name for _, name in entries]
+
+
+@functools.lru_cache(maxsize=32)
+def version_key(version: str) -> tuple[int, ...]:
+    """Numeric sort key for a dotted version, e.g. "1.10.0" -> (1, 10, 0)
+
+    Only the leading digits of each component count, so packaging
+    suffixes such as "0.0.1-1" compare as their base version.
+    """
+    return tuple(int(m.group()) for m in map(VERSION_PART_RE.match, version.split(".")) if m)
 
 
 def check_compatibility(from_version: str, to_version: str) -> tuple[bool, str]:
     """Check if versions are compatible for upgrade"""
     # Simple compatibility check - all 1.x versions are compatible
-    from_major = int(from_version.split(".")[0])
-    to_major = int(to_version.split(".")[0])
+    from_major = version_key(from_version)[0]
+    to_major = version_key(to_version)[0]
 
     if from_major != to_major:
         return False, f"Major version mismatch: {from_version} -> {to_version}"
@@ -151,7 +299,7 @@ def migrate_config(from_version: str, to_version: str) -> bool:
         config = json.loads(config_file.read_text())
 
         # Perform version-specific migrations
-        if from_version < "1.0.0":
+        if version_key(from_version) < (1, 0, 0):
             # Pre-1.0 migrations
             pass
 
@@ -162,7 +310,7 @@ def migrate_config(from_version: str, to_version: str) -> bool:
         config["last_migrated"] = datetime.now().isoformat()
 
         # Save migrated config
-        config_file.write_text(json.dumps(config, indent=2))
+        atomic_write(config_file, json.dumps(config, indent=2))
 
         print("Configuration migrated successfully")
         return True
@@ -189,30 +337,25 @@ def perform_upgrade(new_version: str) -> bool:
     print("\nStep 1: Creating backup...")
     backup_path = create_backup(current_version)
 
-    # Stop service
-    print("\nStep 2: Stopping service...")
-    try:
-        subprocess.run(["systemctl", "stop", "vyos-webui"], check=True)
-    except subprocess.CalledProcessError:
-        print("Warning: Could not stop service")
-
-    # Migrate configuration
-    print("\nStep 3: Migrating configuration...")
+    # Migrate configuration; config.json and VERSION are rewritten atomically
+    # and the environment file is only read at startup, so the service keeps
+    # running until the restart below
+    print("\nStep 2: Migrating configuration...")
     if not migrate_config(current_version, new_version):
         print("Configuration migration failed")
         print(f"To rollback, use: {sys.argv[0]} rollback {backup_path}")
         return False
 
     # Update version file
-    print("\nStep 4: Updating version...")
-    VERSION_FILE.write_text(new_version)
+    print("\nStep 3: Updating version...")
+    atomic_write(VERSION_FILE, new_version)
 
-    # Start service
-    print("\nStep 5: Starting service...")
+    # Restart service
+    print("\nStep 4: Restarting service...")
     try:
-        subprocess.run(["systemctl", "start", "vyos-webui"], check=True)
+        subprocess.run(["systemctl", "restart", "vyos-webui"], check=True)
     except subprocess.CalledProcessError:
-        print("Warning: Could not start service")
+        print("Warning: Could not restart service")
 
     print("\n========================================")
     print("Upgrade completed successfully!")
@@ -226,18 +369,16 @@ def rollback(backup_path: Path) -> bool:
     """Rollback to previous version using backup"""
     print(f"Rolling back to backup: {backup_path}")
 
-    # Stop service
+    # Stop service; the restore replaces whole directories under it
     print("Stopping service...")
     try:
         subprocess.run(["systemctl", "stop", "vyos-webui"], check=True)
     except subprocess.CalledProcessError:
         print("Warning: Could not stop service")
 
-    # Restore backup
+    # Restore backup; a failed restore leaves the current files in place
     print("Restoring backup...")
-    if not restore_backup(backup_path):
-        print("Rollback failed")
-        return False
+    restored = restore_backup(backup_path)
 
     # Start service
     print("Starting service...")
@@ -246,6 +387,10 @@ def rollback(backup_path: Path) -> bool:
     except subprocess.CalledProcessError:
         print("Warning: Could not start service")
 
+    if not restored:
+        print("Rollback failed")
+        return False
+
     print("Rollback completed successfully")
     return True
 